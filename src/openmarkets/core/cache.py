@@ -0,0 +1,366 @@
+"""Process- and host-level caching of upstream data.
+
+Tools frequently re-request the same upstream payload within seconds: an
+agent inspecting one ticker calls several tools that each download the same
+quote summary. The cache collapses those into one fetch.
+
+Two interchangeable backends are provided. :class:`MemoryCache` lives in the
+process and is the default. :class:`FileCache` stores entries under the
+cache directory so that every process on the host - notably the workers of
+a multi-worker HTTP server - shares one copy instead of each fetching its
+own. Entries are pickled; the directory is per user, so only data this
+server wrote is ever loaded.
+
+Concurrent misses for the same key within a process are coalesced: the
+first caller runs the factory while the others wait for its result.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Generator, Hashable, Protocol, TypeVar
+
+from openmarkets.core.config import Settings
+from openmarkets.core.metrics import CACHE_HITS, CACHE_MISSES
+from openmarkets.core.tracing import record_cache_status
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+#: Sentinel returned by ``get`` on a miss, so that ``None`` can be cached.
+MISSING: Any = object()
+
+#: Default lifetime, in seconds, of an entry stored without an explicit TTL.
+DEFAULT_TTL = 60.0
+
+
+class Cache(Protocol):
+    """Structural type shared by the cache backends."""
+
+    default_ttl: float
+    hits: int
+    misses: int
+
+    def get(self, key: Hashable) -> Any: ...
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None: ...
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], T], ttl: float | None = None) -> T: ...
+
+    def clear(self) -> None: ...
+
+
+class _CoalescingCache(ABC):
+    """Shared ``get_or_set`` logic with hit/miss accounting.
+
+    Subclasses implement ``_load`` and ``_store``.
+    """
+
+    def __init__(self, default_ttl: float = DEFAULT_TTL) -> None:
+        """Initialise counters and the per-key lock table.
+
+        Args:
+            default_ttl: Lifetime in seconds for entries stored without a TTL.
+        """
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+        # Per-key lock and the number of callers holding or awaiting it.
+        self._key_locks: dict[Hashable, tuple[threading.Lock, int]] = {}
+        self._key_locks_guard = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value for a key.
+
+        Args:
+            key: Hashable cache key.
+
+        Returns:
+            The cached value, or :data:`MISSING` if absent or expired.
+        """
+        value = self._load(key, time.time())
+        if value is MISSING:
+            self.misses += 1
+            CACHE_MISSES.inc()
+        else:
+            self.hits += 1
+            CACHE_HITS.inc()
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """Store a value.
+
+        Args:
+            key: Hashable cache key.
+            value: Value to store.
+            ttl: Lifetime in seconds. Uses ``default_ttl`` when None; a
+                non-positive lifetime stores nothing.
+        """
+        lifetime = self.default_ttl if ttl is None else ttl
+        if lifetime <= 0:
+            return
+        self._store(key, value, time.time() + lifetime)
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], T], ttl: float | None = None) -> T:
+        """Return the cached value, computing and storing it on a miss.
+
+        Args:
+            key: Hashable cache key.
+            factory: Zero-argument callable producing the value.
+            ttl: Lifetime in seconds, as for :meth:`set`.
+
+        Returns:
+            The cached or freshly computed value.
+        """
+        value = self.get(key)
+        if value is not MISSING:
+            record_cache_status(True)
+            return value
+        with self._lock_for(key):
+            # Another thread may have filled the entry while we waited.
+            value = self._load(key, time.time())
+            record_cache_status(value is not MISSING)
+            if value is not MISSING:
+                return value
+            value = factory()
+            self.set(key, value, ttl)
+            return value
+
+    def clear(self) -> None:
+        """Remove every entry and reset the counters."""
+        self.hits = 0
+        self.misses = 0
+        self._clear()
+
+    @contextmanager
+    def _lock_for(self, key: Hashable) -> Generator[None, None, None]:
+        """Hold the lock serialising misses for one key.
+
+        The lock is created on first use and dropped once no caller holds or
+        awaits it, so the table only grows with keys being computed.
+
+        Args:
+            key: Hashable cache key.
+        """
+        with self._key_locks_guard:
+            lock, users = self._key_locks.get(key, (None, 0))
+            if lock is None:
+                lock = threading.Lock()
+            self._key_locks[key] = (lock, users + 1)
+        try:
+            with lock:
+                yield
+        finally:
+            with self._key_locks_guard:
+                _, users = self._key_locks[key]
+                if users == 1:
+                    del self._key_locks[key]
+                else:
+                    self._key_locks[key] = (lock, users - 1)
+
+    @abstractmethod
+    def _load(self, key: Hashable, now: float) -> Any:
+        """Return the live value for a key, or :data:`MISSING`.
+
+        Args:
+            key: Hashable cache key.
+            now: Current time as a Unix timestamp.
+        """
+
+    @abstractmethod
+    def _store(self, key: Hashable, value: Any, expires_at: float) -> None:
+        """Store a value until ``expires_at``, a Unix timestamp."""
+
+    @abstractmethod
+    def _clear(self) -> None:
+        """Remove every entry."""
+
+
+class MemoryCache(_CoalescingCache):
+    """Bounded in-process cache with per-entry expiry and LRU eviction."""
+
+    def __init__(self, default_ttl: float = DEFAULT_TTL, max_entries: int = 4096) -> None:
+        """Initialise the cache.
+
+        Args:
+            default_ttl: Lifetime in seconds for entries stored without a TTL.
+            max_entries: Entries kept before the least recently used is evicted.
+        """
+        super().__init__(default_ttl)
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _load(self, key: Hashable, now: float) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISSING
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._entries[key]
+                return MISSING
+            self._entries.move_to_end(key)
+            return value
+
+    def _store(self, key: Hashable, value: Any, expires_at: float) -> None:
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class FileCache(_CoalescingCache):
+    """Directory-backed cache shared by every process on the host.
+
+    Each entry is one file named after a hash of its key, written to a
+    temporary name and renamed into place so readers in other processes
+    never see a partial write. Expired files are removed lazily on read and
+    swept periodically on write.
+    """
+
+    #: Writes between sweeps of expired entries.
+    _SWEEP_INTERVAL = 256
+
+    def __init__(self, directory: str | Path, default_ttl: float = DEFAULT_TTL) -> None:
+        """Initialise the cache.
+
+        Args:
+            directory: Directory holding the entry files; created if absent.
+            default_ttl: Lifetime in seconds for entries stored without a TTL.
+        """
+        super().__init__(default_ttl)
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._writes = 0
+
+    def _path(self, key: Hashable) -> Path:
+        """Return the entry file for a key.
+
+        Args:
+            key: Hashable cache key; its ``repr`` must be stable across processes.
+
+        Returns:
+            Path of the entry file.
+        """
+        digest = hashlib.sha256(repr(key).encode()).hexdigest()
+        return self.directory / f"{digest}.pkl"
+
+    def _load(self, key: Hashable, now: float) -> Any:
+        path = self._path(key)
+        try:
+            with path.open("rb") as handle:
+                expires_at, value = pickle.load(handle)
+        except FileNotFoundError:
+            return MISSING
+        except Exception:
+            logger.debug("Discarding unreadable cache entry %s.", path, exc_info=True)
+            path.unlink(missing_ok=True)
+            return MISSING
+        if expires_at <= now:
+            path.unlink(missing_ok=True)
+            return MISSING
+        return value
+
+    def _store(self, key: Hashable, value: Any, expires_at: float) -> None:
+        path = self._path(key)
+        tmp_name = None
+        try:
+            with tempfile.NamedTemporaryFile("wb", dir=self.directory, suffix=".tmp", delete=False) as handle:
+                tmp_name = handle.name
+                pickle.dump((expires_at, value), handle, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, path)
+        except Exception:
+            # Unpicklable values, full disks and a removed directory degrade
+            # to an uncached call.
+            logger.debug("Failed to write cache entry %s.", path, exc_info=True)
+            if tmp_name is not None:
+                Path(tmp_name).unlink(missing_ok=True)
+            return
+        self._writes += 1
+        if self._writes % self._SWEEP_INTERVAL == 0:
+            self._sweep(time.time())
+
+    def _sweep(self, now: float) -> None:
+        """Delete expired entry files.
+
+        Args:
+            now: Current time as a Unix timestamp.
+        """
+        for path in self.directory.glob("*.pkl"):
+            try:
+                with path.open("rb") as handle:
+                    expires_at, _ = pickle.load(handle)
+                if expires_at <= now:
+                    path.unlink(missing_ok=True)
+            except Exception:
+                path.unlink(missing_ok=True)
+
+    def _clear(self) -> None:
+        for path in self.directory.glob("*.pkl"):
+            path.unlink(missing_ok=True)
+
+
+_cache: Cache | None = None
+_lock = threading.Lock()
+
+
+def get_cache() -> Cache:
+    """Return the process-wide cache, creating an in-memory one on first use.
+
+    Returns:
+        Cache: The configured cache.
+    """
+    global _cache
+    if _cache is None:
+        with _lock:
+            if _cache is None:
+                _cache = MemoryCache()
+    return _cache
+
+
+def configure_cache(settings: Settings) -> Cache:
+    """Install the process-wide cache described by the settings.
+
+    A host-shared :class:`FileCache` is used when several worker processes
+    serve HTTP or ``shared_cache`` is set; otherwise a :class:`MemoryCache`.
+
+    Args:
+        settings: Application settings.
+
+    Returns:
+        Cache: The installed cache.
+    """
+    global _cache
+    cache: Cache
+    if settings.workers > 1 or settings.shared_cache:
+        cache = FileCache(Path(settings.cache_dir) / "data", default_ttl=settings.cache_ttl)
+    else:
+        cache = MemoryCache(default_ttl=settings.cache_ttl)
+    with _lock:
+        _cache = cache
+    return cache
+
+
+def reset_cache() -> None:
+    """Discard the process-wide cache; the next use creates a fresh one."""
+    global _cache
+    with _lock:
+        _cache = None
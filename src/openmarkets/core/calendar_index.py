@@ -0,0 +1,247 @@
+"""Background-refreshed index of upcoming earnings and dividend dates.
+
+Answering "who reports this week" across a portfolio otherwise takes one
+calendar request per holding. The index instead fetches the calendar of
+every ticker in a configured universe concurrently, buckets the events by
+day, and keeps the result in a JSON file under the cache directory. A
+daemon thread rebuilds it once per refresh interval; a restart, or another
+worker process on the host, picks up the stored build instead of fetching
+the whole universe again. Rebuilds take a host-wide file lock, so worker
+processes starting together fetch the universe once between them.
+
+A range query reads one bucket per day in the range, so its cost depends on
+the length of the range, not on the size of the universe.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from types import ModuleType
+from typing import Callable, Generator, Literal, NamedTuple
+
+from openmarkets.core.concurrency import gather
+
+fcntl: ModuleType | None
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+#: Kinds of event the index holds.
+CalendarEventKind = Literal["earnings", "ex_dividend", "dividend"]
+
+#: Default seconds between rebuilds of the index.
+DEFAULT_REFRESH_INTERVAL = 6 * 60 * 60.0
+
+# Calendars fetched at once by one rebuild.
+_MAX_CONCURRENT_CALENDARS = 16
+
+
+class CalendarEvent(NamedTuple):
+    """One dated event of one ticker."""
+
+    ticker: str
+    kind: CalendarEventKind
+    date: date
+
+
+class CalendarIndex:
+    """Upcoming events of a ticker universe, bucketed by day.
+
+    :meth:`start` loads the stored index and starts the refresher thread;
+    :meth:`events_between` may be called from any thread.
+    """
+
+    def __init__(self, fetch_dates: Callable[[str], dict[CalendarEventKind, list[date]]]) -> None:
+        """Initialise an empty, unstarted index.
+
+        Args:
+            fetch_dates: Blocking callable returning a ticker's event dates
+                by kind.
+        """
+        self.fetch_dates = fetch_dates
+        self.path: Path | None = None
+        self.tickers: list[str] = []
+        self.built_at: datetime | None = None
+        self._days: dict[date, list[CalendarEvent]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self, tickers: list[str], path: Path, interval: float = DEFAULT_REFRESH_INTERVAL) -> None:
+        """Load the stored index and keep it refreshed in a daemon thread.
+
+        Calling it again while the thread runs does nothing.
+
+        Args:
+            tickers: Ticker universe to index.
+            path: JSON file the index is stored in.
+            interval: Seconds between rebuilds.
+        """
+        with self._lock:
+            if self._thread is not None:
+                return
+            self.tickers = list(dict.fromkeys(ticker.upper() for ticker in tickers))
+            self.path = path
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, args=(interval,), name="calendar-index", daemon=True)
+        self._load()
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the refresher thread, keeping the events already indexed."""
+        self._stop.set()
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join()
+
+    def events_between(
+        self,
+        start: date,
+        end: date,
+        tickers: list[str] | None = None,
+        kinds: list[CalendarEventKind] | None = None,
+    ) -> list[CalendarEvent]:
+        """Return the indexed events from ``start`` to ``end``, both inclusive.
+
+        Args:
+            start: First day of the range.
+            end: Last day of the range.
+            tickers: Keep only these tickers. Defaults to the whole universe.
+            kinds: Keep only these kinds of event. Defaults to all kinds.
+
+        Returns:
+            Events in date order, then in universe order within a day.
+        """
+        wanted_tickers = {ticker.upper() for ticker in tickers} if tickers else None
+        wanted_kinds = set(kinds) if kinds else None
+        days = self._days
+        events = []
+        for offset in range((end - start).days + 1):
+            for event in days.get(start + timedelta(days=offset), ()):
+                if (wanted_tickers is None or event.ticker in wanted_tickers) and (
+                    wanted_kinds is None or event.kind in wanted_kinds
+                ):
+                    events.append(event)
+        return events
+
+    def refresh(self) -> None:
+        """Rebuild the index from every ticker's calendar and store it.
+
+        A ticker whose calendar fails to load is logged and left out, so
+        one bad symbol cannot fail the rebuild.
+        """
+
+        def fetch(ticker: str) -> dict[CalendarEventKind, list[date]]:
+            try:
+                return self.fetch_dates(ticker)
+            except Exception:
+                logger.debug("Calendar fetch for %s failed.", ticker, exc_info=True)
+                return {}
+
+        calendars = gather(
+            {ticker: (lambda ticker=ticker: fetch(ticker)) for ticker in self.tickers},
+            max_workers=_MAX_CONCURRENT_CALENDARS,
+        )
+        events = [
+            CalendarEvent(ticker, kind, day)
+            for ticker, calendar in calendars.items()
+            for kind, days in calendar.items()
+            for day in days
+        ]
+        self._install(events, datetime.now(timezone.utc))
+        self._save(events)
+
+    def _run(self, interval: float) -> None:
+        """Rebuild the index whenever the latest build is older than ``interval``."""
+        while not self._stop.is_set():
+            # Another process on the host may have rebuilt the stored index.
+            self._load()
+            if self._age(interval) >= interval:
+                with self._rebuild_lock():
+                    # A process that held the lock before us may just have rebuilt it.
+                    self._load()
+                    if self._age(interval) >= interval:
+                        try:
+                            self.refresh()
+                        except Exception:
+                            logger.exception("Calendar index rebuild failed.")
+            remaining = interval - self._age(interval)
+            # After a failed rebuild, retry a full interval later.
+            self._stop.wait(remaining if remaining > 0 else interval)
+
+    def _age(self, interval: float) -> float:
+        """Return the seconds since the latest build, or ``interval`` without one."""
+        if self.built_at is None:
+            return interval
+        return (datetime.now(timezone.utc) - self.built_at).total_seconds()
+
+    @contextmanager
+    def _rebuild_lock(self) -> Generator[None, None, None]:
+        """Hold the host-wide lock serialising rebuilds of the stored index.
+
+        Worker processes then rebuild one at a time, and the others load the
+        fresh build instead of fetching the universe too. Without ``fcntl``
+        (Windows) rebuilds are not serialised.
+        """
+        if fcntl is None or self.path is None:
+            yield
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path.with_suffix(".lock"), "w") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def _install(self, events: list[CalendarEvent], built_at: datetime) -> None:
+        """Replace the indexed events with a new build."""
+        days: dict[date, list[CalendarEvent]] = defaultdict(list)
+        for event in sorted(events, key=lambda event: event.date):
+            days[event.date].append(event)
+        with self._lock:
+            # Readers iterate the previous mapping undisturbed; it is never mutated.
+            self._days = dict(days)
+            self.built_at = built_at
+
+    def _load(self) -> None:
+        """Install the stored index if it is a newer build of the same universe."""
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            stored = json.loads(self.path.read_text())
+            built_at = datetime.fromisoformat(stored["built_at"])
+            if stored["tickers"] != self.tickers or (self.built_at is not None and built_at <= self.built_at):
+                return
+            events = [CalendarEvent(ticker, kind, date.fromisoformat(day)) for ticker, kind, day in stored["events"]]
+        except Exception:
+            logger.debug("Ignoring unreadable calendar index %s.", self.path, exc_info=True)
+            return
+        self._install(events, built_at)
+
+    def _save(self, events: list[CalendarEvent]) -> None:
+        """Store the current build atomically, so readers never see a partial file."""
+        if self.path is None or self.built_at is None:
+            return
+        stored = {
+            "built_at": self.built_at.isoformat(),
+            "tickers": self.tickers,
+            "events": [[event.ticker, event.kind, event.date.isoformat()] for event in events],
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile("w", dir=self.path.parent, suffix=".tmp", delete=False) as handle:
+                json.dump(stored, handle)
+            os.replace(handle.name, self.path)
+        except OSError:
+            logger.warning("Failed to store the calendar index at %s.", self.path, exc_info=True)
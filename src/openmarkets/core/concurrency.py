@@ -5,13 +5,17 @@ independent upstream requests. Run sequentially their latency is the sum of
 every call; run concurrently it is the slowest one. Every repository call is
 blocking I/O, so a thread pool is the right tool - the GIL is released while
 waiting on the network.
+
+Each call runs in a copy of the caller's context, so context-local state -
+notably the active trace span - follows the call into its worker thread.
 """
 
+import contextvars
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Callable
 
 
-def gather(calls: dict[str, Callable[[], Any]]) -> dict[str, Any]:
+def gather(calls: dict[str, Callable[[], Any]], max_workers: int | None = None) -> dict[str, Any]:
     """Run each callable concurrently and return the results by key.
 
     The value type is ``Any`` deliberately: callers pass heterogeneous
@@ -20,6 +24,8 @@ def gather(calls: dict[str, Callable[[], Any]]) -> dict[str, Any]:
 
     Args:
         calls: Mapping of result name to a zero-argument callable.
+        max_workers: Cap on calls in flight at once, for fan-outs whose size
+            depends on the request. Defaults to running every call at once.
 
     Returns:
         Mapping of the same keys to each callable's return value.
@@ -31,6 +37,6 @@ def gather(calls: dict[str, Callable[[], Any]]) -> dict[str, Any]:
     if not calls:
         return {}
 
-    with ThreadPoolExecutor(max_workers=len(calls)) as executor:
-        futures = {key: executor.submit(call) for key, call in calls.items()}
+    with ThreadPoolExecutor(max_workers=min(len(calls), max_workers or len(calls))) as executor:
+        futures = {key: executor.submit(contextvars.copy_context().run, call) for key, call in calls.items()}
         return {key: future.result() for key, future in futures.items()}
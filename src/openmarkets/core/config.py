@@ -1,9 +1,22 @@
+import os
 from functools import lru_cache
+from pathlib import Path
+from typing import Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, CliSettingsSource, PydanticBaseSettingsSource, SettingsConfigDict
 
 
+def _default_cache_dir() -> str:
+    """Return the per-user cache directory, honouring ``XDG_CACHE_HOME``.
+
+    Returns:
+        Absolute path of the OpenMarkets cache directory.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return str(Path(base) / "openmarkets")
+
+
 class Settings(BaseSettings):
     """Application configuration settings.
 
@@ -43,6 +56,74 @@ class Settings(BaseSettings):
         "*",
         description="Allowed origins for CORS (Cross-Origin Resource Sharing).",
     )
+    metrics: bool = Field(
+        True,
+        description="Serve Prometheus metrics at /metrics on the HTTP transport.",
+    )
+    tracing: Literal["none", "console", "otlp"] = Field(
+        "none",
+        description="OpenTelemetry trace exporter: none, console (stderr) or otlp (requires the tracing extra).",
+    )
+    otlp_endpoint: str | None = Field(
+        None,
+        description="OTLP/HTTP traces endpoint. Defaults to the exporter's standard OTEL_EXPORTER_OTLP_* settings.",
+    )
+    slow_call_threshold: float = Field(
+        5.0,
+        ge=0,
+        description="Tool calls taking longer than this many seconds log a slow-call record. 0 disables the log.",
+    )
+    profile_tools: str = Field(
+        "",
+        description="Comma-separated tool names to run under cProfile, or * for every tool.",
+    )
+    profile_dir: str | None = Field(
+        None,
+        description="Directory receiving tool profiles. Defaults to a profiles directory under cache_dir.",
+    )
+
+    cache_dir: str = Field(
+        default_factory=_default_cache_dir,
+        description="Directory for on-disk artifacts such as the precomputed tool schema cache.",
+    )
+    tool_schema_cache: bool = Field(
+        True,
+        description="Load tool definitions from a precomputed schema cache instead of regenerating them at startup.",
+    )
+    workers: int = Field(
+        1,
+        ge=1,
+        description="Number of worker processes serving the HTTP transport. More than one enables stateless mode.",
+    )
+    shared_cache: bool = Field(
+        False,
+        description="Share cached upstream data between processes on this host. Always on with multiple workers.",
+    )
+    cache_ttl: float = Field(
+        60.0,
+        ge=0,
+        description="Default lifetime (in seconds) of cached upstream data. 0 disables caching.",
+    )
+    price_poll_interval: float = Field(
+        5.0,
+        gt=0,
+        description="Seconds between server-side polls of the symbols watched through get_live_prices.",
+    )
+    calendar_universe: str = Field(
+        "",
+        description="Comma-separated tickers whose upcoming earnings and dividend dates are indexed in the background.",
+    )
+    calendar_refresh_interval: float = Field(
+        6 * 60 * 60.0,
+        gt=0,
+        description="Seconds between background rebuilds of the calendar_universe index.",
+    )
+    shutdown_timeout: int | None = Field(
+        30,
+        ge=0,
+        description="Seconds a worker waits for in-flight requests to finish when shutting down or restarting; "
+        "0 stops at once and None waits for every request.",
+    )
 
     model_config = SettingsConfigDict(env_file=".env")
 
@@ -8,20 +8,91 @@ because the services are module-level singletons those sessions were built
 at import time and never closed - nine live connection pools per process,
 leaked on shutdown. A single shared session also keeps connection reuse
 effective instead of splitting it across nine pools.
+
+Every request made through the session is timed and recorded by endpoint in
+:mod:`openmarkets.core.metrics`, inside a client span (see
+:mod:`openmarkets.core.tracing`).
 """
 
 import atexit
 import logging
 import threading
+import time
+from typing import Any
+from urllib.parse import urlsplit
 
 from curl_cffi.requests import Session
 
+from openmarkets.core.instrumentation import record_upstream_time
+from openmarkets.core.metrics import observe_upstream, upstream_endpoint
+from openmarkets.core.tracing import CLIENT_SPAN, TICKER_ATTRIBUTE, tracer
+
 logger = logging.getLogger(__name__)
 
 # yfinance is scraped rather than served through a public API, so requests
 # are made with a browser fingerprint.
 _IMPERSONATE = "chrome"
 
+
+class InstrumentedSession(Session):
+    """``curl_cffi`` session that records upstream request latency and spans."""
+
+    def request(self, method: Any, url: str, *args: Any, **kwargs: Any) -> Any:
+        """Issue a request, recording its latency by endpoint and tracing it.
+
+        Args:
+            method: HTTP method.
+            url: Request URL.
+            *args: Positional arguments forwarded to ``Session.request``.
+            **kwargs: Keyword arguments forwarded to ``Session.request``.
+
+        Returns:
+            The response.
+        """
+        endpoint = upstream_endpoint(url)
+        with tracer.start_as_current_span(f"{method} {endpoint}", **CLIENT_SPAN) as span:
+            started = time.perf_counter()
+            try:
+                response = super().request(method, url, *args, **kwargs)
+            except Exception:
+                record_upstream_time(observe_upstream(url, started, failed=True))
+                raise
+            record_upstream_time(observe_upstream(url, started))
+            if span.is_recording():
+                _annotate_span(span, method, url, endpoint, response)
+            return response
+
+
+def _annotate_span(span: Any, method: Any, url: str, endpoint: str, response: Any) -> None:
+    """Attach request and response details to an upstream request span.
+
+    Args:
+        span: Recording span of the request.
+        method: HTTP method.
+        url: Request URL.
+        endpoint: Endpoint label from :func:`upstream_endpoint`.
+        response: Response returned by the session.
+    """
+    path = urlsplit(url).path
+    span.set_attributes(
+        {
+            "http.request.method": str(method),
+            "server.address": urlsplit(url).hostname or "",
+            "openmarkets.endpoint": endpoint,
+            "http.response.status_code": response.status_code,
+            "http.response.body.size": len(response.content),
+        }
+    )
+    # Yahoo Finance paths end in the symbol, e.g. /v8/finance/chart/AAPL.
+    symbol = path[len(endpoint) :].strip("/") if path.startswith(endpoint) else ""
+    if symbol and "/" not in symbol:
+        span.set_attribute(TICKER_ATTRIBUTE, symbol.upper())
+    if response.status_code >= 400:
+        from opentelemetry.trace import StatusCode
+
+        span.set_status(StatusCode.ERROR)
+
+
 _session: Session | None = None
 _lock = threading.Lock()
 
@@ -40,7 +111,7 @@ def get_session() -> Session:
     if _session is None:
         with _lock:
             if _session is None:
-                _session = Session(impersonate=_IMPERSONATE)
+                _session = InstrumentedSession(impersonate=_IMPERSONATE)
     return _session
 
 
@@ -0,0 +1,184 @@
+"""Instrumentation of published tool methods.
+
+Every service tool method is wrapped before its tool definition is built,
+so each invocation is counted, timed and traced without the services
+knowing. The wrapper keeps the method's name, docstring and signature, so
+the published tool definitions are unchanged.
+
+Two diagnostics are driven by settings. Calls slower than
+``slow_call_threshold`` log a structured slow-call record breaking the time
+down into upstream requests and conversion. Tools named in
+``profile_tools`` run under :mod:`cProfile`, with one ``.prof`` file per
+call written to ``profile_dir`` for inspection with ``pstats`` or snakeviz.
+"""
+
+import contextvars
+import cProfile
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from openmarkets.core.metrics import TOOL_CALLS, TOOL_ERRORS, TOOL_LATENCY
+from openmarkets.core.tracing import TICKER_ATTRIBUTE, ticker_argument, tracer
+
+logger = logging.getLogger(__name__)
+
+# cProfile hooks the interpreter globally on recent Pythons, so only one
+# call is profiled at a time; concurrent calls run unprofiled.
+_profiler_lock = threading.Lock()
+
+
+class CallTimings:
+    """Upstream request time accumulated during one tool call.
+
+    Shared by reference with the threads ``gather()`` starts for the call,
+    since they run in copies of its context.
+    """
+
+    def __init__(self) -> None:
+        """Initialise empty totals."""
+        self.upstream_seconds = 0.0
+        self.upstream_requests = 0
+        self._lock = threading.Lock()
+
+    def add_upstream(self, seconds: float) -> None:
+        """Add one upstream request.
+
+        Args:
+            seconds: Duration of the request.
+        """
+        with self._lock:
+            self.upstream_seconds += seconds
+            self.upstream_requests += 1
+
+
+_call_timings: contextvars.ContextVar[CallTimings | None] = contextvars.ContextVar("call_timings", default=None)
+
+
+def record_upstream_time(seconds: float) -> None:
+    """Attribute an upstream request to the tool call in progress, if any.
+
+    Args:
+        seconds: Duration of the request.
+    """
+    timings = _call_timings.get()
+    if timings is not None:
+        timings.add_upstream(seconds)
+
+
+def instrument_tool(
+    method: Callable[..., Any],
+    slow_call_threshold: float = 0.0,
+    profile_dir: Path | None = None,
+) -> Callable[..., Any]:
+    """Wrap a tool method to record metrics and a trace span for each call.
+
+    Args:
+        method: Bound service tool method.
+        slow_call_threshold: Seconds above which a call is logged as slow;
+            0 disables the slow-call log.
+        profile_dir: Directory to write a cProfile profile of each call to;
+            None disables profiling.
+
+    Returns:
+        A callable with the same metadata that records call counts, latency
+        and errors, opens a ``tool <name>`` span, and re-raises any exception.
+    """
+    name = getattr(method, "__name__", repr(method))
+
+    @functools.wraps(method)
+    def instrumented(*args: Any, **kwargs: Any) -> Any:
+        TOOL_CALLS.inc(tool=name)
+        timings = CallTimings()
+        token = _call_timings.set(timings)
+        started = time.perf_counter()
+        failed = False
+        with tracer.start_as_current_span(f"tool {name}", attributes={"gen_ai.tool.name": name}) as span:
+            if span.is_recording():
+                ticker = ticker_argument(method, args, kwargs)
+                if ticker is not None:
+                    span.set_attribute(TICKER_ATTRIBUTE, ticker)
+            try:
+                if profile_dir is not None:
+                    return _run_profiled(name, profile_dir, method, args, kwargs)
+                return method(*args, **kwargs)
+            except Exception as exc:
+                failed = True
+                TOOL_ERRORS.inc(tool=name, exception=type(exc).__name__)
+                raise
+            finally:
+                elapsed = time.perf_counter() - started
+                _call_timings.reset(token)
+                TOOL_LATENCY.observe(elapsed, tool=name)
+                if slow_call_threshold and elapsed >= slow_call_threshold:
+                    _log_slow_call(name, kwargs, elapsed, timings, failed)
+
+    return instrumented
+
+
+def _run_profiled(
+    name: str, profile_dir: Path, method: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> Any:
+    """Run one call under cProfile and write the profile to disk.
+
+    Only the calling thread is profiled; sub-calls ``gather()`` runs in
+    worker threads show up as time spent waiting on their futures.
+
+    Args:
+        name: Tool name, used in the profile file name.
+        profile_dir: Directory receiving the profile.
+        method: Tool method.
+        args: Positional arguments of the call.
+        kwargs: Keyword arguments of the call.
+
+    Returns:
+        The method's return value.
+    """
+    if not _profiler_lock.acquire(blocking=False):
+        return method(*args, **kwargs)
+    try:
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(method, *args, **kwargs)
+        finally:
+            path = profile_dir / f"{name}-{time.strftime('%Y%m%dT%H%M%S')}-{os.getpid()}-{time.monotonic_ns()}.prof"
+            try:
+                profile_dir.mkdir(parents=True, exist_ok=True)
+                profiler.dump_stats(path)
+                logger.info("Wrote profile of %s to %s.", name, path)
+            except OSError:
+                logger.warning("Failed to write profile of %s to %s.", name, path, exc_info=True)
+    finally:
+        _profiler_lock.release()
+
+
+def _log_slow_call(name: str, arguments: dict[str, Any], elapsed: float, timings: CallTimings, failed: bool) -> None:
+    """Log a structured record of a slow tool call.
+
+    Upstream time is the summed duration of the call's upstream requests,
+    which can exceed wall time when ``gather()`` overlaps them; conversion
+    is the remaining wall time. Serializing the result happens in the MCP
+    SDK after the call returns and is not part of the record.
+
+    Args:
+        name: Tool name.
+        arguments: Keyword arguments of the call, as sent by the client.
+        elapsed: Total wall time of the call in seconds.
+        timings: Upstream totals recorded during the call.
+        failed: Whether the call raised.
+    """
+    record = {
+        "tool": name,
+        "arguments": arguments,
+        "failed": failed,
+        "total_seconds": round(elapsed, 6),
+        "upstream_seconds": round(timings.upstream_seconds, 6),
+        "upstream_requests": timings.upstream_requests,
+        "conversion_seconds": round(max(elapsed - timings.upstream_seconds, 0.0), 6),
+    }
+    logger.warning("Slow tool call: %s", json.dumps(record, default=str))
@@ -3,16 +3,43 @@
 Provides the server class used by Open Markets and a factory that
 registers all service tool methods against the official MCP Python SDK
 (v2), where the former ``FastMCP`` class is named ``MCPServer``.
+
+Tool definitions are built up front and handed to the server constructor,
+so they can come either from live schema generation or from the
+precomputed cache in :mod:`openmarkets.core.schema_cache`. Each tool
+method is wrapped by :mod:`openmarkets.core.instrumentation` first, and the
+HTTP applications serve the resulting Prometheus metrics at ``/metrics``.
+
+The server publishes on the stock service's price streamer bus and serves
+each streamed price as a ``quote://{symbol}`` resource; see
+:mod:`openmarkets.core.streaming`. :func:`start_calendar_index` starts the
+financials service's background calendar index; see
+:mod:`openmarkets.core.calendar_index`.
 """
 
 import logging
-from typing import Any
+from pathlib import Path
+from typing import Any, Callable
 
 from mcp.server import MCPServer
+from mcp.server.mcpserver.tools import Tool
+from mcp.types import Completion, CompletionArgument, CompletionContext, PromptReference, ResourceTemplateReference
 from starlette.applications import Starlette
 from starlette.middleware.cors import CORSMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
 
 from openmarkets.core.config import Settings, get_settings
+from openmarkets.core.instrumentation import instrument_tool
+from openmarkets.core.metrics import CONTENT_TYPE, REGISTRY
+from openmarkets.core.schema_cache import (
+    generate_tools,
+    load_tools,
+    save_tools,
+    schema_cache_path,
+    schema_fingerprint,
+)
+from openmarkets.core.streaming import QUOTE_URI_TEMPLATE
 from openmarkets.services import (
     analysis_service,
     crypto_service,
@@ -29,6 +56,9 @@ from openmarkets.services import (
 
 logger = logging.getLogger(__name__)
 
+#: File under the cache directory holding the calendar universe index.
+CALENDAR_INDEX_FILENAME = "calendar-index.json"
+
 INSTRUCTIONS = "This server allows for the integration of various market data tools."
 
 # Collection of all services to be registered
@@ -113,24 +143,59 @@ class CORSMCPServer(MCPServer):
         )
 
 
-def _register_all_services(tool_registrar: MCPServer) -> None:
-    """Register all service tool methods with the MCP server.
+def _build_all_tools(configuration: Settings) -> list[Tool]:
+    """Build the tool definitions for every service tool method.
+
+    When the schema cache is enabled, definitions are loaded from the
+    versioned artifact matching the current fingerprint; on a miss they are
+    generated live and the artifact is refreshed for the next start.
 
     Args:
-        tool_registrar: MCP server instance for tool registration.
+        configuration: Application configuration settings.
+
+    Returns:
+        list[Tool]: Definitions for every published service method.
 
     Raises:
         RuntimeError: If any service registration fails.
     """
     try:
-        for service in _SERVICES:
-            service.register_tool_methods(tool_registrar)
+        methods = [_instrument(method, configuration) for service in _SERVICES for method in service.tool_methods()]
+        if not configuration.tool_schema_cache:
+            tools = generate_tools(methods)
+        else:
+            fingerprint = schema_fingerprint()
+            path = schema_cache_path(configuration.cache_dir, fingerprint)
+            cached = load_tools(methods, path, fingerprint)
+            if cached is not None:
+                logger.info("Tool registration loaded from schema cache %s.", path)
+                return cached
+            tools = generate_tools(methods)
+            save_tools(tools, path, fingerprint)
         logger.info("Tool registration completed successfully.")
+        return tools
     except Exception as exception:
         logger.exception("Failed to register tools.")
         raise RuntimeError("Tool registration failed. See logs for details.") from exception
 
 
+def _instrument(method: Callable[..., Any], configuration: Settings) -> Callable[..., Any]:
+    """Wrap a tool method with the instrumentation the settings enable.
+
+    Args:
+        method: Bound service tool method.
+        configuration: Application configuration settings.
+
+    Returns:
+        The instrumented method.
+    """
+    profiled = {name.strip() for name in configuration.profile_tools.split(",") if name.strip()}
+    profile_dir = None
+    if "*" in profiled or getattr(method, "__name__", None) in profiled:
+        profile_dir = Path(configuration.profile_dir or Path(configuration.cache_dir) / "profiles")
+    return instrument_tool(method, slow_call_threshold=configuration.slow_call_threshold, profile_dir=profile_dir)
+
+
 def _parse_allowed_origins(cors_allow_origins: str) -> list[str]:
     """Parse a comma-separated origins string into a clean list.
 
@@ -156,20 +221,85 @@ def _parse_allowed_origins(cors_allow_origins: str) -> list[str]:
     return list(seen)
 
 
-def _create_server(configuration: Settings) -> MCPServer:
+async def metrics_endpoint(request: Request) -> Response:
+    """Serve the process metrics in the Prometheus text format.
+
+    Args:
+        request: Incoming scrape request.
+
+    Returns:
+        Response: The exposition document.
+    """
+    return Response(REGISTRY.render(), media_type=CONTENT_TYPE)
+
+
+async def _complete_watched_symbol(
+    ref: PromptReference | ResourceTemplateReference,
+    argument: CompletionArgument,
+    context: CompletionContext | None,
+) -> Completion | None:
+    """Complete the ``symbol`` of a ``quote://`` URI from the watched symbols.
+
+    Args:
+        ref: Prompt or resource template being completed.
+        argument: Argument name and the partial value typed so far.
+        context: Arguments already resolved; unused.
+
+    Returns:
+        Watched symbols starting with the partial value, or None for any
+        other reference or argument.
+    """
+    if not isinstance(ref, ResourceTemplateReference) or ref.uri != QUOTE_URI_TEMPLATE or argument.name != "symbol":
+        return None
+    prefix = argument.value.upper()
+    return Completion(
+        values=[symbol for symbol in stock_service.streamer.watched_symbols() if symbol.startswith(prefix)]
+    )
+
+
+def _create_server(configuration: Settings, tools: list[Tool] | None = None) -> MCPServer:
     """Create a new MCP server instance.
 
     Args:
         configuration: Application configuration settings.
+        tools: Tool definitions to register at construction.
 
     Returns:
         MCPServer: New server instance.
     """
-    return CORSMCPServer(
+    stock_service.streamer.interval = configuration.price_poll_interval
+    server = CORSMCPServer(
         name=configuration.name,
         instructions=INSTRUCTIONS,
         allow_origins=_parse_allowed_origins(configuration.cors_allow_origins),
+        tools=tools,
+        subscriptions=stock_service.streamer.bus,
     )
+    server.resource(
+        QUOTE_URI_TEMPLATE,
+        name="live_price",
+        description="Latest streamed price of a symbol watched through get_live_prices.",
+        mime_type="application/json",
+    )(stock_service.read_live_price)
+    server.completion()(_complete_watched_symbol)
+    if configuration.metrics:
+        server.custom_route("/metrics", methods=["GET"], include_in_schema=False)(metrics_endpoint)
+    return server
+
+
+def start_calendar_index(configuration: Settings) -> None:
+    """Start the background calendar index when a ticker universe is configured.
+
+    Args:
+        configuration: Application configuration settings.
+    """
+    universe = [ticker.strip() for ticker in configuration.calendar_universe.split(",") if ticker.strip()]
+    if universe:
+        financials_service.calendar_index.start(
+            universe,
+            Path(configuration.cache_dir) / CALENDAR_INDEX_FILENAME,
+            configuration.calendar_refresh_interval,
+        )
 
 
 def create_mcp(config: Settings | None = None) -> MCPServer:
@@ -185,6 +315,4 @@ def create_mcp(config: Settings | None = None) -> MCPServer:
         RuntimeError: If tool registration fails.
     """
     configuration = config if config is not None else get_settings()
-    server = _create_server(configuration)
-    _register_all_services(server)
-    return server
+    return _create_server(configuration, _build_all_tools(configuration))
@@ -0,0 +1,427 @@
+"""Prometheus metrics for tools, upstream requests and caches.
+
+A small in-process registry rendering the Prometheus text exposition
+format, served at ``/metrics`` on the HTTP transport. It covers the three
+metric types the server needs - counters, gauges and histograms - without
+adding a client library dependency.
+
+Values are per process. With several HTTP workers each scrape reports the
+worker that answered it, so aggregate with ``sum`` across scrapes of a
+target rather than reading one scrape as the host total.
+"""
+
+import bisect
+import logging
+import math
+import threading
+import time
+from collections.abc import Callable, Iterator
+from typing import TypeVar
+from urllib.parse import urlsplit
+
+import anyio.to_thread
+
+logger = logging.getLogger(__name__)
+
+#: Media type of the text exposition format.
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+#: Latency buckets in seconds, spanning cached hits to slow upstream calls.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+Sample = tuple[str, dict[str, str], float]
+
+
+class Metric:
+    """Base class holding labelled values.
+
+    A metric created with ``function`` has no stored values; the function is
+    called at scrape time and its result reported as the single sample.
+    """
+
+    kind = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        function: Callable[[], float] | None = None,
+    ) -> None:
+        """Initialise the metric.
+
+        Args:
+            name: Metric name.
+            documentation: Help text.
+            labelnames: Names of the labels every sample carries.
+            function: Optional zero-argument callable sampled at scrape time.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.function = function
+        self._values: dict[tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        """Return the value key for a label set.
+
+        Args:
+            labels: Label values by name.
+
+        Returns:
+            Label values in ``labelnames`` order.
+
+        Raises:
+            ValueError: If the label names do not match the metric's.
+        """
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}.")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def value(self, **labels: str) -> float:
+        """Return the current value for a label set.
+
+        Args:
+            **labels: Label values by name.
+
+        Returns:
+            The stored value, or 0.0 if never set.
+        """
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> Iterator[Sample]:
+        """Yield the metric's samples.
+
+        Yields:
+            Tuples of sample name, labels and value.
+        """
+        if self.function is not None:
+            yield self.name, {}, float(self.function())
+            return
+        with self._lock:
+            values = list(self._values.items())
+        for key, value in values:
+            yield self.name, dict(zip(self.labelnames, key, strict=True)), value
+
+
+class Counter(Metric):
+    """Monotonically increasing count."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase the count.
+
+        Args:
+            amount: Non-negative increment.
+            **labels: Label values by name.
+        """
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Gauge(Metric):
+    """Value that can go up and down."""
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set the value.
+
+        Args:
+            value: New value.
+            **labels: Label values by name.
+        """
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase the value.
+
+        Args:
+            amount: Increment; negative to decrease.
+            **labels: Label values by name.
+        """
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        """Decrease the value.
+
+        Args:
+            amount: Decrement.
+            **labels: Label values by name.
+        """
+        self.inc(-amount, **labels)
+
+
+class Histogram(Metric):
+    """Distribution of observations in cumulative buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        """Initialise the histogram.
+
+        Args:
+            name: Metric name.
+            documentation: Help text.
+            labelnames: Names of the labels every sample carries.
+            buckets: Ascending upper bounds; ``+Inf`` is always appended.
+        """
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._observations: dict[tuple[str, ...], tuple[list[int], float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record one observation.
+
+        Args:
+            value: Observed value.
+            **labels: Label values by name.
+        """
+        key = self._key(labels)
+        with self._lock:
+            counts, total = self._observations.get(key) or ([0] * (len(self.buckets) + 1), 0.0)
+            counts[bisect.bisect_left(self.buckets, value)] += 1
+            self._observations[key] = (counts, total + value)
+
+    def count(self, **labels: str) -> int:
+        """Return the number of observations for a label set.
+
+        Args:
+            **labels: Label values by name.
+
+        Returns:
+            Observation count.
+        """
+        counts, _ = self._observations.get(self._key(labels), ([], 0.0))
+        return sum(counts)
+
+    def samples(self) -> Iterator[Sample]:
+        """Yield bucket, sum and count samples.
+
+        Yields:
+            Tuples of sample name, labels and value.
+        """
+        with self._lock:
+            observations = [(key, list(counts), total) for key, (counts, total) in self._observations.items()]
+        for key, counts, total in observations:
+            labels = dict(zip(self.labelnames, key, strict=True))
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts, strict=True):
+                cumulative += count
+                yield f"{self.name}_bucket", {**labels, "le": _format_value(bound)}, cumulative
+            yield f"{self.name}_sum", labels, total
+            yield f"{self.name}_count", labels, cumulative
+
+
+M = TypeVar("M", bound=Metric)
+
+
+class MetricsRegistry:
+    """Ordered collection of metrics rendered together."""
+
+    def __init__(self) -> None:
+        """Initialise an empty registry."""
+        self._metrics: dict[str, Metric] = {}
+
+    def register(self, metric: M) -> M:
+        """Add a metric.
+
+        Args:
+            metric: Metric to add.
+
+        Returns:
+            The metric, for assignment at definition.
+
+        Raises:
+            ValueError: If a metric with the same name is registered.
+        """
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered.")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        """Render every metric in the text exposition format.
+
+        A metric whose scrape-time function fails is omitted, so one broken
+        source cannot take down the endpoint.
+
+        Returns:
+            The exposition document.
+        """
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            try:
+                samples = list(metric.samples())
+            except Exception:
+                logger.debug("Failed to sample metric %s.", metric.name, exc_info=True)
+                continue
+            lines.append(f"# HELP {metric.name} {_escape(metric.documentation, help_text=True)}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in samples:
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str, help_text: bool = False) -> str:
+    """Escape text for the exposition format.
+
+    Args:
+        value: Raw text.
+        help_text: Whether the text is a HELP line, where quotes are literal.
+
+    Returns:
+        Escaped text.
+    """
+    escaped = value.replace("\\", "\\\\").replace("\n", "\\n")
+    return escaped if help_text else escaped.replace('"', '\\"')
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    """Format a label set.
+
+    Args:
+        labels: Label values by name.
+
+    Returns:
+        ``{name="value",...}``, or an empty string for no labels.
+    """
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value.
+
+    Args:
+        value: Numeric value.
+
+    Returns:
+        The value as Prometheus expects it, including ``+Inf`` and ``NaN``.
+    """
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def upstream_endpoint(url: str) -> str:
+    """Reduce an upstream URL to a bounded-cardinality endpoint label.
+
+    Yahoo Finance paths end in the symbol (``/v10/finance/quoteSummary/AAPL``);
+    the path is kept up to the segment after ``finance`` so that every
+    symbol maps to the same endpoint. Other paths keep two segments.
+
+    Args:
+        url: Request URL.
+
+    Returns:
+        Endpoint path without host, query or symbol.
+    """
+    segments = [segment for segment in urlsplit(url).path.split("/") if segment]
+    if "finance" in segments:
+        segments = segments[: segments.index("finance") + 2]
+    else:
+        segments = segments[:2]
+    return "/" + "/".join(segments)
+
+
+def _cache_hit_ratio() -> float:
+    """Return the data cache hit ratio since the process started.
+
+    Returns:
+        Hits over lookups, or 0.0 before any lookup.
+    """
+    hits = CACHE_HITS.value()
+    lookups = hits + CACHE_MISSES.value()
+    return hits / lookups if lookups else 0.0
+
+
+def _thread_limiter_statistic(name: str) -> float:
+    """Read a statistic of the thread pool running synchronous tool handlers.
+
+    The SDK runs each synchronous tool through ``anyio.to_thread``; calls
+    beyond the limiter's capacity wait for a thread. Only readable from the
+    event loop, which is where ``/metrics`` is served.
+
+    Args:
+        name: ``tasks_waiting`` or ``borrowed_tokens``.
+
+    Returns:
+        The statistic's value.
+    """
+    return float(getattr(anyio.to_thread.current_default_thread_limiter().statistics(), name))
+
+
+REGISTRY = MetricsRegistry()
+
+TOOL_CALLS = REGISTRY.register(Counter("openmarkets_tool_calls_total", "Tool invocations.", ("tool",)))
+TOOL_LATENCY = REGISTRY.register(
+    Histogram("openmarkets_tool_duration_seconds", "Tool invocation latency in seconds.", ("tool",))
+)
+TOOL_ERRORS = REGISTRY.register(
+    Counter("openmarkets_tool_errors_total", "Tool invocations that raised, by exception class.", ("tool", "exception"))
+)
+UPSTREAM_LATENCY = REGISTRY.register(
+    Histogram(
+        "openmarkets_upstream_request_duration_seconds",
+        "Upstream HTTP request latency in seconds, by endpoint.",
+        ("endpoint",),
+    )
+)
+UPSTREAM_ERRORS = REGISTRY.register(
+    Counter("openmarkets_upstream_request_errors_total", "Upstream HTTP requests that failed.", ("endpoint",))
+)
+# Counted here rather than read from the cache, whose own counters restart
+# whenever it is cleared or replaced.
+CACHE_HITS = REGISTRY.register(Counter("openmarkets_cache_hits_total", "Data cache hits."))
+CACHE_MISSES = REGISTRY.register(Counter("openmarkets_cache_misses_total", "Data cache misses."))
+REGISTRY.register(Gauge("openmarkets_cache_hit_ratio", "Data cache hits over lookups.", function=_cache_hit_ratio))
+REGISTRY.register(
+    Gauge(
+        "openmarkets_executor_queue_depth",
+        "Tool calls waiting for a worker thread.",
+        function=lambda: _thread_limiter_statistic("tasks_waiting"),
+    )
+)
+REGISTRY.register(
+    Gauge(
+        "openmarkets_executor_busy_threads",
+        "Worker threads running tool calls.",
+        function=lambda: _thread_limiter_statistic("borrowed_tokens"),
+    )
+)
+
+
+def observe_upstream(url: str, started: float, failed: bool = False) -> float:
+    """Record one upstream request.
+
+    Args:
+        url: Request URL.
+        started: ``time.perf_counter()`` value taken before the request.
+        failed: Whether the request raised.
+
+    Returns:
+        The request's duration in seconds.
+    """
+    elapsed = time.perf_counter() - started
+    endpoint = upstream_endpoint(url)
+    UPSTREAM_LATENCY.observe(elapsed, endpoint=endpoint)
+    if failed:
+        UPSTREAM_ERRORS.inc(endpoint=endpoint)
+    return elapsed
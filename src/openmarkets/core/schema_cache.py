@@ -0,0 +1,304 @@
+"""Precomputed tool definition cache.
+
+Building a tool definition runs pydantic JSON schema generation for the
+argument model and, for structured output, the return model. Across the
+full tool surface that is well over a second per process start, almost all
+of it spent regenerating schemas that only change when the code does.
+
+Generated input and output schemas are written to a versioned artifact
+named after the package version and a fingerprint of everything that can
+affect them: the package sources plus the ``mcp`` and ``pydantic``
+versions. At startup the artifact is loaded and tools are rebuilt around
+the stored schemas; any mismatch, missing entry or unreadable file falls
+back to live generation, which then refreshes the artifact.
+"""
+
+import hashlib
+import inspect
+import json
+import logging
+import os
+import tempfile
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any, Callable, get_type_hints, is_typeddict
+
+from mcp.server.mcpserver.resolve import build_resolver_plans, find_resolved_parameters
+from mcp.server.mcpserver.tools import Tool
+from mcp.server.mcpserver.utilities.context_injection import find_context_parameter
+from mcp.server.mcpserver.utilities.func_metadata import FuncMetadata, func_metadata
+from mcp.shared._callable_inspection import is_async_callable
+from pydantic import create_model
+
+from openmarkets import __version__
+
+logger = logging.getLogger(__name__)
+
+_PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+
+#: Distributions whose versions change the generated schemas.
+_SCHEMA_DEPENDENCIES = ("mcp", "pydantic")
+
+
+def schema_fingerprint() -> str:
+    """Return a hash identifying the inputs to tool schema generation.
+
+    Returns:
+        Hex SHA-256 digest over the package sources and schema-relevant
+        dependency versions.
+    """
+    digest = hashlib.sha256()
+    digest.update(__version__.encode())
+    for dependency in _SCHEMA_DEPENDENCIES:
+        try:
+            digest.update(f"{dependency}=={version(dependency)}".encode())
+        except PackageNotFoundError:
+            digest.update(f"{dependency}==unknown".encode())
+    for source in sorted(_PACKAGE_ROOT.rglob("*.py")):
+        digest.update(source.relative_to(_PACKAGE_ROOT).as_posix().encode())
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def schema_cache_path(cache_dir: str | Path, fingerprint: str) -> Path:
+    """Return the artifact path for a package version and fingerprint.
+
+    Args:
+        cache_dir: Directory holding cached artifacts.
+        fingerprint: Value returned by :func:`schema_fingerprint`.
+
+    Returns:
+        Path of the versioned schema artifact.
+    """
+    return Path(cache_dir) / f"tool-schemas-{__version__}-{fingerprint[:16]}.json"
+
+
+def generate_tools(methods: list[Callable[..., Any]]) -> list[Tool]:
+    """Build tool definitions by live schema generation.
+
+    Args:
+        methods: Bound service methods to publish.
+
+    Returns:
+        One tool per method, as ``MCPServer.tool()`` would register it.
+    """
+    return [Tool.from_function(method) for method in methods]
+
+
+def load_tools(methods: list[Callable[..., Any]], path: Path, fingerprint: str) -> list[Tool] | None:
+    """Rebuild tool definitions around cached schemas.
+
+    Argument models are still created per method (they validate calls), but
+    no JSON schema is generated.
+
+    Args:
+        methods: Bound service methods to publish.
+        path: Artifact path from :func:`schema_cache_path`.
+        fingerprint: Expected fingerprint of the artifact.
+
+    Returns:
+        The rebuilt tools, or None when the artifact is absent, stale or
+        does not cover exactly the given methods.
+    """
+    try:
+        artifact = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        logger.debug("Ignoring unreadable tool schema cache %s.", path, exc_info=True)
+        return None
+
+    if not isinstance(artifact, dict) or artifact.get("fingerprint") != fingerprint:
+        return None
+    definitions = artifact.get("tools")
+    if not isinstance(definitions, dict):
+        return None
+    if set(definitions) != {_method_name(method) for method in methods}:
+        return None
+
+    try:
+        return [_rebuild_tool(method, definitions[_method_name(method)]) for method in methods]
+    except Exception:
+        logger.debug("Tool schema cache %s could not be applied.", path, exc_info=True)
+        return None
+
+
+def save_tools(tools: list[Tool], path: Path, fingerprint: str) -> None:
+    """Write generated tool schemas to the artifact path.
+
+    The file is written to a temporary name and renamed into place, so a
+    concurrently starting process never reads a partial artifact. Once it is
+    in place, artifacts for other versions and fingerprints are deleted.
+    Failures are logged and swallowed: the cache is an optimisation only.
+
+    Args:
+        tools: Tools produced by :func:`generate_tools`.
+        path: Artifact path from :func:`schema_cache_path`.
+        fingerprint: Fingerprint the schemas were generated under.
+    """
+    try:
+        artifact = {
+            "version": __version__,
+            "fingerprint": fingerprint,
+            "tools": {
+                tool.name: {
+                    "parameters": tool.parameters,
+                    "output_schema": tool.fn_metadata.output_schema,
+                    "output_kind": _output_kind(tool),
+                }
+                for tool in tools
+            },
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", dir=path.parent, suffix=".tmp", delete=False, encoding="utf-8") as handle:
+            json.dump(artifact, handle)
+        os.replace(handle.name, path)
+    except (OSError, TypeError):
+        logger.debug("Failed to write tool schema cache %s.", path, exc_info=True)
+        return
+    _remove_stale_artifacts(path)
+
+
+def _remove_stale_artifacts(path: Path) -> None:
+    """Delete schema artifacts other than the one just written.
+
+    Every source or dependency change produces a new fingerprint, so without
+    this the cache directory would keep one artifact per change forever.
+
+    Args:
+        path: Artifact path to keep.
+    """
+    for stale in path.parent.glob("tool-schemas-*.json"):
+        if stale == path:
+            continue
+        try:
+            stale.unlink()
+        except OSError:
+            logger.debug("Failed to remove stale tool schema cache %s.", stale, exc_info=True)
+
+
+def _output_kind(tool: Tool) -> str | None:
+    """Classify how the SDK derived a tool's structured output model.
+
+    Args:
+        tool: Live-generated tool.
+
+    Returns:
+        ``"wrapped"`` for a ``result``-wrapped model, ``"direct"`` when the
+        return annotation itself is the model, ``"typeddict"`` when a
+        TypedDict return was converted to a model, or None for unstructured
+        output.
+
+    Raises:
+        TypeError: If the output model has a shape that cannot be rebuilt.
+    """
+    metadata = tool.fn_metadata
+    if metadata.output_schema is None:
+        return None
+    if metadata.wrap_output:
+        return "wrapped"
+    annotation = _return_annotation(tool.fn)
+    if metadata.output_model is annotation:
+        return "direct"
+    if is_typeddict(annotation):
+        return "typeddict"
+    raise TypeError(f"Cannot cache the output model of {tool.name}.")
+
+
+def _rebuild_tool(method: Callable[..., Any], definition: dict[str, Any]) -> Tool:
+    """Rebuild one tool from its cached schemas.
+
+    Everything except the schemas is derived from the method exactly as
+    ``Tool.from_function`` derives it, so async tools and tools taking a
+    ``Context`` behave the same whether or not they came from the cache.
+
+    Args:
+        method: Bound service method.
+        definition: Cached ``parameters``, ``output_schema`` and ``output_kind``.
+
+    Returns:
+        Tool equivalent to ``Tool.from_function(method)``.
+    """
+    context_kwarg = find_context_parameter(method)
+    resolved_params = find_resolved_parameters(method)
+    skip_names = [context_kwarg] if context_kwarg is not None else []
+    skip_names.extend(resolved_params)
+
+    arguments = func_metadata(method, skip_names=skip_names, structured_output=False)
+    metadata = FuncMetadata(arg_model=arguments.arg_model)
+    if definition["output_schema"] is not None:
+        kind = definition["output_kind"]
+        # Supplying the schema skips derivation when FuncMetadata is built.
+        metadata = FuncMetadata(
+            arg_model=arguments.arg_model,
+            output_model=_output_model(method, kind),
+            output_schema=definition["output_schema"],
+            wrap_output=kind == "wrapped",
+        )
+    tool_arg_names = {field.alias or name for name, field in arguments.arg_model.model_fields.items()}
+    return Tool(
+        fn=method,
+        name=_method_name(method),
+        title=None,
+        description=method.__doc__ or "",
+        parameters=definition["parameters"],
+        fn_metadata=metadata,
+        is_async=is_async_callable(method),
+        context_kwarg=context_kwarg,
+        resolved_params=dict(resolved_params),
+        resolver_plans=build_resolver_plans(resolved_params, tool_arg_names),
+        annotations=None,
+    )
+
+
+def _output_model(method: Callable[..., Any], kind: str) -> Any:
+    """Rebuild the model structured output is validated against.
+
+    Mirrors the SDK's derivation for each kind recorded by :func:`_output_kind`.
+
+    Args:
+        method: Bound service method.
+        kind: Output kind recorded when the artifact was written.
+
+    Returns:
+        The output model.
+
+    Raises:
+        ValueError: If the kind is not recognised.
+    """
+    annotation = _return_annotation(method)
+    if kind == "wrapped":
+        return create_model(f"{_method_name(method)}Output", result=annotation)
+    if kind == "direct":
+        return annotation
+    if kind == "typeddict":
+        required = getattr(annotation, "__required_keys__", set())
+        fields: dict[str, Any] = {
+            name: hint if name in required else (hint, None) for name, hint in get_type_hints(annotation).items()
+        }
+        return create_model(annotation.__name__, **fields)
+    raise ValueError(f"Unknown output kind {kind!r} for {_method_name(method)}.")
+
+
+def _method_name(method: Callable[..., Any]) -> str:
+    """Return the name a method is published under.
+
+    Args:
+        method: Callable to name.
+
+    Returns:
+        The callable's ``__name__``, or its repr when it has none.
+    """
+    return getattr(method, "__name__", repr(method))
+
+
+def _return_annotation(method: Callable[..., Any]) -> Any:
+    """Return a method's evaluated return annotation.
+
+    Args:
+        method: Callable to inspect.
+
+    Returns:
+        The return annotation.
+    """
+    return inspect.signature(method, eval_str=True).return_annotation
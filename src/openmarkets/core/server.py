@@ -3,18 +3,79 @@ Open Markets Server
 
 Initializes and runs the Open Markets MCP server, handling tool registration
 and server lifecycle management.
+
+With ``workers`` above one, the HTTP transport runs that many shared-nothing
+worker processes behind one listening socket. Each worker serves stateless
+streamable HTTP, so any worker can answer any request, and upstream data is
+shared through the per-host file cache rather than fetched once per worker.
+The supervising process handles ``SIGHUP`` as a rolling restart - each
+replacement worker is ready before its predecessor is retired - and
+``SIGTERM``/``SIGINT`` as a graceful shutdown in which workers stop
+accepting connections and drain in-flight requests for up to
+``shutdown_timeout`` seconds.
 """
 
 import logging
 import sys
 
 from mcp.server.transport_security import TransportSecuritySettings
+from starlette.applications import Starlette
 
+from openmarkets.core.cache import configure_cache
 from openmarkets.core.config import Settings, get_settings
-from openmarkets.core.mcpserver import MCPServer, create_mcp
+from openmarkets.core.mcpserver import MCPServer, create_mcp, start_calendar_index
+from openmarkets.core.tracing import configure_tracing
 
 logger = logging.getLogger(__name__)
 
+#: Import string of the worker application factory, resolved in each worker.
+HTTP_APP_FACTORY = "openmarkets.core.server:create_http_app"
+
+
+def _configure_logging(settings: Settings) -> None:
+    """Direct log output to stderr at the configured level.
+
+    Args:
+        settings: Server settings/configuration.
+    """
+    logging.basicConfig(
+        level=logging.DEBUG if settings.debug else logging.INFO,
+        stream=sys.stderr,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
+
+def _transport_security() -> TransportSecuritySettings:
+    """Return the transport security settings for the HTTP transport.
+
+    DNS-rebinding protection is disabled because the server is expected to
+    run behind a reverse proxy, where the inbound Host header varies.
+
+    Returns:
+        TransportSecuritySettings: Settings passed to the SDK.
+    """
+    return TransportSecuritySettings(enable_dns_rebinding_protection=False)
+
+
+def create_http_app() -> Starlette:
+    """Build the streamable HTTP application for one worker process.
+
+    Called by uvicorn in every worker. Workers share no session state, so
+    the transport runs in stateless mode. The supervising process has
+    already built the server once, which leaves the tool schema cache warm
+    for the workers.
+
+    Returns:
+        Starlette: ASGI application serving the MCP endpoint.
+    """
+    settings = get_settings()
+    _configure_logging(settings)
+    configure_cache(settings)
+    configure_tracing(settings)
+    mcp = create_mcp(settings)
+    start_calendar_index(settings)
+    return mcp.streamable_http_app(stateless_http=True, transport_security=_transport_security())
+
 
 def run_stdio_server(mcp: MCPServer) -> None:
     """
@@ -37,8 +98,9 @@ def run_http_server(mcp: MCPServer, settings: Settings) -> None:
     """
     Runs the MCP server using the streamable HTTP transport.
 
-    DNS-rebinding protection is disabled because the server is expected to
-    run behind a reverse proxy, where the inbound Host header varies.
+    With a single worker the server runs in this process. With more, uvicorn
+    supervises ``settings.workers`` processes that each build their own
+    application through :func:`create_http_app`; ``mcp`` is then unused.
 
     Under real operation, ``uvicorn.Server`` installs its own SIGINT/SIGTERM
     handlers and calls ``sys.exit()`` directly for both graceful shutdown
@@ -59,12 +121,15 @@ def run_http_server(mcp: MCPServer, settings: Settings) -> None:
         SystemExit: If our own code raises before uvicorn takes over.
     """
     try:
-        mcp.run(
-            transport="streamable-http",
-            host=settings.host,
-            port=settings.port,
-            transport_security=TransportSecuritySettings(enable_dns_rebinding_protection=False),
-        )
+        if settings.workers > 1:
+            run_http_workers(settings)
+        else:
+            mcp.run(
+                transport="streamable-http",
+                host=settings.host,
+                port=settings.port,
+                transport_security=_transport_security(),
+            )
     except KeyboardInterrupt:
         logger.info(msg="Server shutdown requested by user.")
         sys.exit(0)
@@ -73,6 +138,27 @@ def run_http_server(mcp: MCPServer, settings: Settings) -> None:
         sys.exit(1)
 
 
+def run_http_workers(settings: Settings) -> None:
+    """
+    Runs the streamable HTTP transport in multiple worker processes.
+
+    Args:
+        settings: Server settings/configuration.
+    """
+    import uvicorn
+
+    logger.info("Starting %d HTTP workers on %s:%d.", settings.workers, settings.host, settings.port)
+    uvicorn.run(
+        HTTP_APP_FACTORY,
+        factory=True,
+        host=settings.host,
+        port=settings.port,
+        workers=settings.workers,
+        timeout_graceful_shutdown=settings.shutdown_timeout,
+        log_level="debug" if settings.debug else "info",
+    )
+
+
 def main() -> None:
     """
     Orchestrates the startup of the Open Markets MCP server based on transport type.
@@ -84,12 +170,13 @@ def main() -> None:
         None
     """
     settings = get_settings()
-    logging.basicConfig(
-        level=logging.DEBUG if settings.debug else logging.INFO,
-        stream=sys.stderr,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    )
+    _configure_logging(settings)
+    configure_cache(settings)
+    configure_tracing(settings)
     mcp = create_mcp(settings)
+    if settings.transport != "http" or settings.workers <= 1:
+        # A multi-worker supervisor serves no requests; its workers index the calendar.
+        start_calendar_index(settings)
 
     if settings.transport == "stdio":
         run_stdio_server(mcp)
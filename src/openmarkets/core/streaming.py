@@ -0,0 +1,212 @@
+"""Coalesced price polling for watchlists, pushed as MCP notifications.
+
+An agent monitoring prices otherwise polls a quote tool in a loop, one
+round trip and one upstream request per poll. Instead, a client registers
+a watchlist for a number of seconds and listens for resource-updated
+events on each symbol's ``quote://`` URI over ``subscriptions/listen``,
+reading the resource when one arrives.
+
+Every watchlist in the process feeds one poller. Each interval it fetches
+the union of the watched symbols once, so any number of clients watching
+``BTC-USD`` cost one upstream request per interval, and it publishes an
+event only for symbols whose price changed. The poller runs only while at
+least one watch is live: watches are leases that lapse unless renewed, so
+clients that disappear stop costing upstream traffic.
+
+Events are delivered through the server's in-process subscription bus.
+With several HTTP workers, a client's listen stream and its watch request
+can reach different processes, so streaming is only reliable with a single
+worker; a cross-process bus is the SDK's seam for lifting that.
+"""
+
+import asyncio
+import logging
+import math
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, NamedTuple
+
+import anyio
+import anyio.from_thread
+import anyio.to_thread
+from mcp.server.subscriptions import InMemorySubscriptionBus, ResourceUpdated, SubscriptionBus
+
+from openmarkets.core.concurrency import gather
+
+logger = logging.getLogger(__name__)
+
+#: Resource URI template of a symbol's latest streamed price.
+QUOTE_URI_TEMPLATE = "quote://{symbol}"
+
+#: Default seconds between polls of the watched symbols.
+DEFAULT_POLL_INTERVAL = 5.0
+
+# Quotes fetched at once by one poll.
+_MAX_CONCURRENT_QUOTES = 16
+
+
+class StreamedPrice(NamedTuple):
+    """A symbol's price as of its latest change."""
+
+    price: float
+    updated_at: datetime
+
+
+def quote_uri(symbol: str) -> str:
+    """Return the resource URI carrying a symbol's streamed price.
+
+    Args:
+        symbol: Ticker symbol.
+
+    Returns:
+        The ``quote://`` URI for the symbol.
+    """
+    return QUOTE_URI_TEMPLATE.format(symbol=symbol.upper())
+
+
+class PriceStreamer:
+    """Polls the union of all watched symbols and publishes price changes.
+
+    :meth:`watch` and :meth:`latest` are called from the worker threads
+    running tool handlers; the poller itself is a task on the server's
+    event loop, started by the first watch and finished once every lease
+    has lapsed. Leases and prices are only touched under ``_lock``, which
+    is never held across a fetch.
+    """
+
+    def __init__(
+        self,
+        fetch_price: Callable[[str], float | None],
+        interval: float = DEFAULT_POLL_INTERVAL,
+        bus: SubscriptionBus | None = None,
+    ) -> None:
+        """Initialise the streamer.
+
+        Args:
+            fetch_price: Blocking callable returning a symbol's last price,
+                or None when it has none.
+            interval: Seconds between polls.
+            bus: Subscription bus events are published to. Defaults to a
+                new in-process bus, to be handed to the server.
+        """
+        self.fetch_price = fetch_price
+        self.interval = interval
+        self.bus = bus if bus is not None else InMemorySubscriptionBus()
+        self._lock = threading.Lock()
+        self._leases: dict[str, float] = {}
+        self._latest: dict[str, StreamedPrice] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    def watch(self, symbols: list[str], duration: float) -> dict[str, StreamedPrice | None]:
+        """Watch symbols for ``duration`` seconds and return their prices.
+
+        Watching a symbol that is already watched extends its lease rather
+        than adding a poll. Must be called from a worker thread of the
+        event loop serving the server.
+
+        Args:
+            symbols: Ticker symbols to watch.
+            duration: Seconds until the watch lapses unless renewed.
+
+        Returns:
+            The latest price of each symbol, fetched now for symbols not
+            yet polled; None where there is no price.
+        """
+        symbols = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+        expires_at = time.monotonic() + duration
+        with self._lock:
+            for symbol in symbols:
+                self._leases[symbol] = max(self._leases.get(symbol, 0.0), expires_at)
+            unpolled = [symbol for symbol in symbols if symbol not in self._latest]
+        # Fetched without the lock, which the poller takes on the event loop.
+        self._record(self._fetch_all(unpolled))
+        anyio.from_thread.run_sync(self._ensure_polling)
+        with self._lock:
+            return {symbol: self._latest.get(symbol) for symbol in symbols}
+
+    def latest(self, symbol: str) -> StreamedPrice | None:
+        """Return the last price recorded for a symbol, if any.
+
+        Args:
+            symbol: Ticker symbol.
+
+        Returns:
+            The latest update, or None when the symbol has not been polled.
+        """
+        with self._lock:
+            return self._latest.get(symbol.upper())
+
+    def watched_symbols(self) -> list[str]:
+        """Return the symbols with a live lease, dropping lapsed ones.
+
+        Returns:
+            Watched symbols, in the order they were first watched.
+        """
+        now = time.monotonic()
+        with self._lock:
+            for symbol in [symbol for symbol, expires_at in self._leases.items() if expires_at <= now]:
+                del self._leases[symbol]
+                self._latest.pop(symbol, None)
+            return list(self._leases)
+
+    def _ensure_polling(self) -> None:
+        """Start the poller task unless it is running. Runs on the event loop."""
+        if self._task is None or self._task.done():
+            # A detached task: the poller outlives the request that started it.
+            self._task = asyncio.get_running_loop().create_task(self._poll())
+
+    async def _poll(self) -> None:
+        """Poll the watched symbols until no lease is left."""
+        while symbols := self.watched_symbols():
+            prices = await anyio.to_thread.run_sync(self._fetch_all, symbols)
+            for symbol in self._record(prices):
+                await self.bus.publish(ResourceUpdated(uri=quote_uri(symbol)))
+            await anyio.sleep(self.interval)
+
+    def _fetch_all(self, symbols: list[str]) -> dict[str, float | None]:
+        """Fetch each symbol's price concurrently.
+
+        A failing symbol is logged and reported as None, so one bad symbol
+        cannot stop the stream for the others.
+
+        Args:
+            symbols: Ticker symbols to fetch.
+
+        Returns:
+            Price by symbol.
+        """
+
+        def fetch(symbol: str) -> float | None:
+            try:
+                return self.fetch_price(symbol)
+            except Exception:
+                logger.debug("Price poll for %s failed.", symbol, exc_info=True)
+                return None
+
+        return gather(
+            {symbol: (lambda symbol=symbol: fetch(symbol)) for symbol in symbols},
+            max_workers=_MAX_CONCURRENT_QUOTES,
+        )
+
+    def _record(self, prices: dict[str, float | None]) -> list[str]:
+        """Store fetched prices that changed.
+
+        Args:
+            prices: Price by symbol, None where the fetch failed.
+
+        Returns:
+            The symbols whose price changed.
+        """
+        changed = []
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            for symbol, price in prices.items():
+                if price is None or not math.isfinite(price):
+                    continue
+                previous = self._latest.get(symbol)
+                if previous is not None and previous.price == price:
+                    continue
+                self._latest[symbol] = StreamedPrice(price=price, updated_at=now)
+                changed.append(symbol)
+        return changed
@@ -0,0 +1,202 @@
+"""OpenTelemetry tracing for tools, repositories and upstream requests.
+
+Spans are created through the OpenTelemetry API, which is a no-op until a
+tracer provider is installed. :func:`configure_tracing` installs one when
+the ``tracing`` setting selects an exporter; the SDK and exporter packages
+from the ``tracing`` extra are then required and imported on demand.
+Without the OpenTelemetry API at all, spans are replaced by a no-op
+stand-in.
+
+A tool invocation produces a span tree of the form::
+
+    tools/call get_full_financials          (server span, from the MCP SDK)
+      tool get_full_financials
+        YFinanceFinancialsRepository.get_balance_sheet
+          GET /v10/finance/quoteSummary
+        YFinanceFinancialsRepository.get_income_statement
+          ...
+
+so the slow sub-call of an aggregate tool is visible directly.
+"""
+
+import functools
+import inspect
+import logging
+import sys
+from contextlib import contextmanager
+from types import ModuleType
+from typing import Any, Callable, Generator, TypeVar
+
+from openmarkets import __version__
+from openmarkets.core.config import Settings
+
+trace: ModuleType | None
+try:
+    from opentelemetry import trace
+except ImportError:  # The tracing extra is not installed.
+    trace = None
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T", bound=type)
+
+
+class _NoopSpan:
+    """Span stand-in used when the OpenTelemetry API is not installed."""
+
+    def is_recording(self) -> bool:
+        """Report that nothing is recorded.
+
+        Returns:
+            Always False.
+        """
+        return False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Discard an attribute.
+
+        Args:
+            key: Attribute name.
+            value: Attribute value.
+        """
+
+
+class _NoopTracer:
+    """Tracer stand-in used when the OpenTelemetry API is not installed."""
+
+    @contextmanager
+    def start_as_current_span(self, name: str, **kwargs: Any) -> Generator[_NoopSpan, None, None]:
+        """Open a span that records nothing.
+
+        Args:
+            name: Span name.
+            **kwargs: Span options, ignored.
+
+        Yields:
+            A no-op span.
+        """
+        yield _NoopSpan()
+
+
+tracer: Any = trace.get_tracer("openmarkets", __version__) if trace is not None else _NoopTracer()
+
+#: Keyword arguments marking a span as an outgoing client request.
+CLIENT_SPAN: dict[str, Any] = {"kind": trace.SpanKind.CLIENT} if trace is not None else {}
+
+#: Span attribute carrying the ticker a span concerns.
+TICKER_ATTRIBUTE = "openmarkets.ticker"
+
+#: Span attribute recording whether a cached lookup was served from the cache.
+CACHE_HIT_ATTRIBUTE = "openmarkets.cache.hit"
+
+
+def configure_tracing(settings: Settings) -> None:
+    """Install a tracer provider exporting to the configured destination.
+
+    Args:
+        settings: Application settings.
+
+    Raises:
+        RuntimeError: If tracing is enabled but the OpenTelemetry SDK or
+            exporter package is not installed.
+    """
+    if settings.tracing == "none":
+        return
+    try:
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter, SpanExporter
+        from opentelemetry.trace import set_tracer_provider
+
+        exporter: SpanExporter
+        if settings.tracing == "otlp":
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+
+            exporter = OTLPSpanExporter(endpoint=settings.otlp_endpoint)
+        else:
+            # stdout carries the protocol stream under stdio transport.
+            exporter = ConsoleSpanExporter(out=sys.stderr)
+    except ImportError as exc:
+        raise RuntimeError(
+            f"Tracing with the {settings.tracing!r} exporter requires the OpenTelemetry SDK: {exc.name} is missing. "
+            "Install openmarkets[tracing]."
+        ) from exc
+
+    provider = TracerProvider(resource=Resource.create({"service.name": "openmarkets", "service.version": __version__}))
+    provider.add_span_processor(BatchSpanProcessor(exporter))
+    set_tracer_provider(provider)
+    logger.info("Exporting traces to %s.", settings.otlp_endpoint or settings.tracing)
+
+
+def ticker_argument(function: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]) -> str | None:
+    """Return the ``ticker`` argument of a call, if it has one.
+
+    Args:
+        function: Called function; a bound method or plain function.
+        args: Positional arguments of the call.
+        kwargs: Keyword arguments of the call.
+
+    Returns:
+        The upper-cased ticker, or None when the call takes no ticker.
+    """
+    ticker = kwargs.get("ticker")
+    if ticker is None and args:
+        try:
+            ticker = inspect.signature(function).bind_partial(*args, **kwargs).arguments.get("ticker")
+        except TypeError:
+            return None
+    return ticker.upper() if isinstance(ticker, str) else None
+
+
+def record_cache_status(hit: bool) -> None:
+    """Annotate the current span with the outcome of a cache lookup.
+
+    Args:
+        hit: Whether the value was served from the cache.
+    """
+    if trace is None:
+        return
+    span = trace.get_current_span()
+    if span.is_recording():
+        span.set_attribute(CACHE_HIT_ATTRIBUTE, hit)
+
+
+def traced_repository(cls: T) -> T:
+    """Class decorator opening a span around each public repository method.
+
+    Spans are named ``<Class>.<method>`` and carry the call's ticker.
+
+    Args:
+        cls: Repository class.
+
+    Returns:
+        The same class with its public methods wrapped.
+    """
+    for name, member in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.isfunction(member):
+            continue
+        setattr(cls, name, _traced_method(member, f"{cls.__name__}.{name}"))
+    return cls
+
+
+def _traced_method(method: Callable[..., Any], span_name: str) -> Callable[..., Any]:
+    """Wrap one repository method in a span.
+
+    Args:
+        method: Unbound repository method.
+        span_name: Name of the span.
+
+    Returns:
+        The wrapped method.
+    """
+
+    @functools.wraps(method)
+    def traced(self: Any, *args: Any, **kwargs: Any) -> Any:
+        with tracer.start_as_current_span(span_name) as span:
+            if span.is_recording():
+                ticker = ticker_argument(method, (self, *args), kwargs)
+                if ticker is not None:
+                    span.set_attribute(TICKER_ATTRIBUTE, ticker)
+            return method(self, *args, **kwargs)
+
+    return traced
@@ -64,6 +64,69 @@ Interval = Literal["1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h", "1d", "5d
 #: fixed set: yfinance itself raises ValueError for anything else.
 ValuationFrequency = Literal["quarterly", "monthly", "yearly", "trailing"]
 
+#: Period columns of a financial statement: fiscal years, fiscal quarters,
+#: or the trailing twelve months.
+StatementFrequency = Literal["annual", "quarterly", "ttm"]
+
+#: Period columns of a balance sheet. It is a point-in-time snapshot, so
+#: there is no trailing-twelve-month form.
+BalanceSheetFrequency = Literal["annual", "quarterly"]
+
+#: Ratios get_financial_ratios can derive from the statements.
+FinancialRatio = Literal[
+    "gross_margin",
+    "operating_margin",
+    "net_margin",
+    "fcf_margin",
+    "roe",
+    "roa",
+    "roic",
+    "interest_coverage",
+    "current_ratio",
+    "debt_to_equity",
+    "altman_z",
+    "piotroski_f",
+]
+
+#: Numeric ``StockInfo`` fields compare_fundamentals can tabulate.
+FundamentalMetric = Literal[
+    "market_cap",
+    "enterprise_value",
+    "trailing_pe",
+    "forward_pe",
+    "trailing_peg_ratio",
+    "price_to_book",
+    "price_to_sales_trailing_12_months",
+    "enterprise_to_revenue",
+    "enterprise_to_ebitda",
+    "trailing_eps",
+    "forward_eps",
+    "total_revenue",
+    "revenue_growth",
+    "earnings_growth",
+    "gross_margins",
+    "ebitda_margins",
+    "operating_margins",
+    "profit_margins",
+    "return_on_assets",
+    "return_on_equity",
+    "debt_to_equity",
+    "current_ratio",
+    "quick_ratio",
+    "operating_cashflow",
+    "free_cashflow",
+    "total_cash",
+    "total_debt",
+    "dividend_yield",
+    "payout_ratio",
+    "beta",
+]
+
+#: Shape of per-contract option data: one object per contract, or one
+#: array per field. Columns avoid building a model per contract, which
+#: matters on chains with thousands of contracts.
+ContractLayout = Literal["rows", "columns"]
+
 #: Runtime-checkable tuples, for validating values that arrive untyped.
 PERIODS: tuple[str, ...] = get_args(Period)
 INTERVALS: tuple[str, ...] = get_args(Interval)
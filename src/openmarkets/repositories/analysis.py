@@ -7,6 +7,7 @@ earnings estimates, revenue estimates, and other analysis-related data.
 import yfinance as yf
 from curl_cffi.requests import Session
 
+from openmarkets.core.tracing import traced_repository
 from openmarkets.schemas.analysis import (
     AnalystPriceTargets,
     AnalystRecommendation,
@@ -18,6 +19,7 @@ from openmarkets.schemas.analysis import (
 )
 
 
+@traced_repository
 class YFinanceAnalysisRepository:
     """YFinance implementation of the Analysis repository."""
 
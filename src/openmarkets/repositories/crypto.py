@@ -5,16 +5,52 @@ indicators from yfinance.
 """
 
 import math
+from datetime import date, datetime, time, timedelta, timezone
+from typing import NamedTuple
 
+import numpy as np
+import pandas as pd
 import yfinance as yf
 from curl_cffi.requests import Session
 
+from openmarkets.core.cache import get_cache
+from openmarkets.core.concurrency import gather
 from openmarkets.core.constants import DEFAULT_SENTIMENT_TICKERS, TOP_CRYPTO_TICKERS
 from openmarkets.core.exceptions import APIError
+from openmarkets.core.tracing import traced_repository
 from openmarkets.core.types import INTERVALS, PERIODS, Interval, Period
-from openmarkets.schemas.crypto import CryptoFastInfo, CryptoHistory, CryptoSentiment, CryptoSentimentEntry
+from openmarkets.schemas.crypto import (
+    CryptoFastInfo,
+    CryptoHistory,
+    CryptoSentiment,
+    CryptoSentimentEntry,
+    CryptoSentimentHistory,
+    CryptoSentimentPoint,
+)
 
+# Histories downloaded at once when computing sentiment over a basket.
+_MAX_CONCURRENT_DOWNLOADS = 16
 
+# Daily closes spanned by the weekly change of the sentiment history;
+# crypto trades every day, so seven rows are seven calendar days.
+_WEEKLY_WINDOW = 7
+
+_SENTIMENT_NOTE = "This is a simplified sentiment proxy based on price movements, not the official Fear & Greed Index"
+
+
+class _SettledSentiment(NamedTuple):
+    """Sentiment history of the days that can no longer change."""
+
+    points: list[CryptoSentimentPoint]
+    closes: pd.DataFrame
+
+
+def _days(index: pd.Index) -> pd.DatetimeIndex:
+    """Return the calendar day of each timestamp, in the index's own timezone."""
+    return pd.DatetimeIndex(index).tz_localize(None).normalize()
+
+
+@traced_repository
 class YFinanceCryptoRepository:
     """Repository for fetching crypto data from yfinance."""
 
@@ -96,6 +132,147 @@ class YFinanceCryptoRepository:
         sentiment_label = self._determine_sentiment_label(average_change)
         return self._build_sentiment_response(sentiment_label, average_change, sentiment_data)
 
+    def get_crypto_sentiment_history(
+        self, tickers: list[str] | None = None, period: Period = "3mo", session: Session | None = None
+    ) -> CryptoSentimentHistory:
+        """Calculate the sentiment proxy for every day of a period.
+
+        Each day's value is the mean, across the basket, of the change over
+        the trailing ``_WEEKLY_WINDOW`` daily closes. Only the current UTC
+        day still moves, so the days before it are computed once, for the
+        whole close matrix at once, and cached until the next UTC midnight;
+        each request then downloads just the latest closes and recomputes
+        the current day. Days before the first full window have no value
+        and are omitted.
+
+        Args:
+            tickers: List of cryptocurrency symbols. Uses defaults if None.
+            period: Time period of daily closes to download.
+            session: Optional HTTP session for request handling.
+
+        Returns:
+            The daily sentiment series, oldest first.
+
+        Raises:
+            APIError: If sentiment data could not be retrieved from upstream.
+        """
+        self._validate_period(period)
+        tickers = list(dict.fromkeys(tickers or DEFAULT_SENTIMENT_TICKERS))
+        now = datetime.now(timezone.utc)
+        today = now.date()
+        midnight = datetime.combine(today + timedelta(days=1), time.min, tzinfo=timezone.utc)
+        settled = get_cache().get_or_set(
+            ("crypto.sentiment_settled", tuple(tickers), period, today.isoformat()),
+            lambda: self._settled_sentiment(tickers, period, today, session),
+            ttl=(midnight - now).total_seconds(),
+        )
+        return get_cache().get_or_set(
+            ("crypto.sentiment_history", tuple(tickers), period),
+            lambda: CryptoSentimentHistory(
+                tickers=tickers,
+                period=period,
+                points=settled.points + self._current_sentiment(settled.closes, tickers, today, session),
+                note=_SENTIMENT_NOTE,
+            ),
+        )
+
+    def _settled_sentiment(
+        self, tickers: list[str], period: Period, today: date, session: Session | None
+    ) -> _SettledSentiment:
+        """Download the basket's closes and compute the series up to yesterday.
+
+        Args:
+            tickers: List of cryptocurrency symbols.
+            period: Time period of daily closes to download.
+            today: Current UTC day, left out of the result.
+            session: Optional HTTP session for request handling.
+
+        Returns:
+            The points of the days before ``today`` and the trailing closes
+            the current day's point is computed from.
+
+        Raises:
+            APIError: If sentiment data could not be retrieved from upstream.
+        """
+        matrix = self._close_matrix(tickers, period, session)
+        matrix = matrix[_days(matrix.index) < pd.Timestamp(today)]
+        return _SettledSentiment(points=self._sentiment_points(matrix), closes=matrix.tail(_WEEKLY_WINDOW))
+
+    def _current_sentiment(
+        self, settled_closes: pd.DataFrame, tickers: list[str], today: date, session: Session | None
+    ) -> list[CryptoSentimentPoint]:
+        """Compute the current day's point from the latest closes.
+
+        Args:
+            settled_closes: Trailing closes of the days before ``today``.
+            tickers: List of cryptocurrency symbols.
+            today: Current UTC day.
+            session: Optional HTTP session for request handling.
+
+        Returns:
+            The current day's point, or nothing before its first close or
+            without a full week of history.
+
+        Raises:
+            APIError: If sentiment data could not be retrieved from upstream.
+        """
+        latest = self._close_matrix(tickers, "1d", session)
+        latest = latest[_days(latest.index) >= pd.Timestamp(today)]
+        if latest.empty:
+            return []
+        # Only the appended row can have a full window behind it.
+        return self._sentiment_points(pd.concat([settled_closes, latest.tail(1)]))
+
+    def _close_matrix(self, tickers: list[str], period: str, session: Session | None) -> pd.DataFrame:
+        """Download the basket's daily closes as one column per symbol.
+
+        Args:
+            tickers: List of cryptocurrency symbols.
+            period: Time period of daily closes to download.
+            session: Optional HTTP session for request handling.
+
+        Returns:
+            Closes aligned on date, oldest first; empty without any data.
+
+        Raises:
+            APIError: If sentiment data could not be retrieved from upstream.
+        """
+        try:
+            closes = self._download_closes(tickers, period, session)
+        except Exception as error:
+            raise APIError(f"Failed to retrieve crypto sentiment data: {error}") from error
+        series = [close for close in closes.values() if not close.empty]
+        if not series:
+            return pd.DataFrame(index=pd.DatetimeIndex([], tz="UTC"))
+        return pd.concat(series, axis=1)
+
+    def _sentiment_points(self, matrix: pd.DataFrame) -> list[CryptoSentimentPoint]:
+        """Compute the sentiment proxy of every row of a close matrix.
+
+        Args:
+            matrix: Daily closes, one column per symbol, oldest first.
+
+        Returns:
+            One point per day with at least one full trailing window.
+        """
+        changes = matrix.pct_change(periods=_WEEKLY_WINDOW, fill_method=None).mul(100)
+        changes = changes.replace([np.inf, -np.inf], np.nan)
+        average = changes.mean(axis=1)
+        assets = changes.notna().sum(axis=1)
+        points = []
+        for day, change, count in zip(average.index, average.tolist(), assets.tolist(), strict=True):
+            if count == 0:
+                continue
+            points.append(
+                CryptoSentimentPoint(
+                    date=day,
+                    sentiment_proxy=self._determine_sentiment_label(change),
+                    average_weekly_change=change,
+                    assets=count,
+                )
+            )
+        return points
+
     def _normalize_ticker(self, ticker: str) -> str:
         """Normalize cryptocurrency ticker to include -USD suffix.
 
@@ -147,79 +324,89 @@ class YFinanceCryptoRepository:
     def _collect_crypto_sentiment_data(self, tickers: list[str], session: Session | None) -> list[dict]:
         """Collect sentiment data for given cryptocurrency tickers.
 
+        Histories are downloaded concurrently, at most
+        ``_MAX_CONCURRENT_DOWNLOADS`` at a time, so latency no longer grows
+        with the basket size. The changes are then computed for every
+        symbol at once.
+
         Args:
             tickers: List of cryptocurrency symbols.
             session: Optional HTTP session for request handling.
 
         Returns:
-            List of dictionaries containing sentiment data per crypto.
+            List of dictionaries containing sentiment data per crypto, in
+            input order. Symbols with fewer than two closes are omitted.
         """
-        sentiment_data = []
-        for crypto in tickers:
-            crypto_data = self._fetch_crypto_sentiment(crypto, session)
-            if crypto_data:
-                sentiment_data.append(crypto_data)
-        return sentiment_data
-
-    def _fetch_crypto_sentiment(self, crypto: str, session: Session | None) -> dict | None:
-        """Fetch sentiment data for a single cryptocurrency.
-
-        Args:
-            crypto: Cryptocurrency symbol.
-            session: Optional HTTP session for request handling.
+        closes = self._download_closes(tickers, "7d", session)
+        usable = {crypto: close.to_numpy() for crypto, close in closes.items() if len(close) >= 2}
+        if not usable:
+            return []
+
+        # One row per symbol: first, previous and latest close.
+        endpoints = np.array([(values[0], values[-2], values[-1]) for values in usable.values()])
+        daily = self._percentage_changes(endpoints[:, 2], endpoints[:, 1])
+        weekly = self._percentage_changes(endpoints[:, 2], endpoints[:, 0])
+        return [
+            {"symbol": crypto, "daily_change_percent": daily_change, "weekly_change_percent": weekly_change}
+            for crypto, daily_change, weekly_change in zip(usable, daily, weekly, strict=True)
+        ]
 
-        Returns:
-            Dictionary with sentiment data or None if insufficient history.
-        """
-        ticker_obj = yf.Ticker(crypto, session=session)
-        history = ticker_obj.history(period="7d")
-        if len(history) < 2:
-            return None
-        weekly_change = self._calculate_weekly_change(history)
-        daily_change = self._calculate_daily_change(history)
-        return {
-            "symbol": crypto,
-            "daily_change_percent": daily_change,
-            "weekly_change_percent": weekly_change,
-        }
+    def _download_closes(self, tickers: list[str], period: str, session: Session | None) -> dict[str, pd.Series]:
+        """Fetch closing prices for every ticker concurrently.
 
-    def _percentage_change(self, current: float, baseline: float) -> float | None:
-        """Calculate percentage change against a baseline price.
+        At most ``_MAX_CONCURRENT_DOWNLOADS`` histories are in flight at
+        once; duplicate symbols are fetched once.
 
         Args:
-            current: Current price.
-            baseline: Earlier price to compare against.
+            tickers: List of cryptocurrency symbols.
+            period: Time period to download.
+            session: Optional HTTP session for request handling.
 
         Returns:
-            Percentage change, or None when the baseline is zero or either
-            value is not finite. A zero or NaN baseline is a data-quality
-            problem (delisted or erroneous feed), not a 100% move.
+            Closing prices per symbol, in input order.
         """
-        if not math.isfinite(current) or not math.isfinite(baseline) or baseline == 0:
-            return None
-        return ((current - baseline) / baseline) * 100
+        return gather(
+            {
+                crypto: (lambda crypto=crypto: self._fetch_closes(crypto, period, session))
+                for crypto in dict.fromkeys(tickers)
+            },
+            max_workers=_MAX_CONCURRENT_DOWNLOADS,
+        )
 
-    def _calculate_weekly_change(self, history) -> float | None:
-        """Calculate weekly percentage change from history data.
+    def _fetch_closes(self, crypto: str, period: str, session: Session | None) -> pd.Series:
+        """Fetch closing prices for a single cryptocurrency.
 
         Args:
-            history: Historical price data DataFrame.
+            crypto: Cryptocurrency symbol.
+            period: Time period to download.
+            session: Optional HTTP session for request handling.
 
         Returns:
-            Weekly percentage change, or None if it cannot be computed.
+            Closing prices named after the symbol, oldest first, without
+            missing values.
         """
-        return self._percentage_change(float(history.iloc[-1]["Close"]), float(history.iloc[0]["Close"]))
+        history = yf.Ticker(crypto, session=session).history(period=period)
+        if history.empty or "Close" not in history.columns:
+            return pd.Series(dtype=float, name=crypto)
+        return history["Close"].dropna().astype(float).rename(crypto)
 
-    def _calculate_daily_change(self, history) -> float | None:
-        """Calculate daily percentage change from history data.
+    def _percentage_changes(self, current: np.ndarray, baseline: np.ndarray) -> list[float | None]:
+        """Calculate percentage changes against baseline prices.
 
         Args:
-            history: Historical price data DataFrame.
+            current: Current prices.
+            baseline: Earlier prices to compare against.
 
         Returns:
-            Daily percentage change, or None if it cannot be computed.
+            Percentage change per element, or None where the baseline is
+            zero or either value is not finite. A zero or NaN baseline is a
+            data-quality problem (delisted or erroneous feed), not a 100%
+            move.
         """
-        return self._percentage_change(float(history.iloc[-1]["Close"]), float(history.iloc[-2]["Close"]))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            changes = (current - baseline) / baseline * 100
+        usable = np.isfinite(changes) & (baseline != 0)
+        return np.where(usable, changes, None).tolist()
 
     def _calculate_average_weekly_change(self, sentiment_data: list[dict]) -> float | None:
         """Calculate average weekly change from sentiment data.
@@ -285,5 +472,5 @@ class YFinanceCryptoRepository:
             sentiment_proxy=sentiment_label,
             average_weekly_change=average_change,
             crypto_data=[CryptoSentimentEntry(**entry) for entry in sentiment_data],
-            note=("This is a simplified sentiment proxy based on price movements, not the official Fear & Greed Index"),
+            note=_SENTIMENT_NOTE,
         )
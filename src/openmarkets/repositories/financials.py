@@ -1,91 +1,498 @@
 """Repository layer for financial data operations.
 
 Provides abstractions and implementations for fetching balance sheets,
-income statements, cash flow statements, and other financial data.
+income statements, cash flow statements, and other financial data, and for
+deriving financial ratios from those statements.
+
+Statements only change when a company reports, so they are cached until
+the next report date on the earnings calendar rather than for the default
+cache lifetime; a warm cache then serves fundamentals for a whole index
+with almost no upstream traffic.
 """
 
+from datetime import date, datetime, time, timedelta, timezone
+from functools import cache
+from types import GenericAlias
+from typing import Callable, TypeVar, get_args
+
+import numpy as np
+import pandas as pd
 import yfinance as yf
 from curl_cffi.requests import Session
+from pydantic import BaseModel, TypeAdapter
 
+from openmarkets.core.cache import get_cache
+from openmarkets.core.concurrency import gather
+from openmarkets.core.exceptions import DataUnavailableError
+from openmarkets.core.tracing import traced_repository
+from openmarkets.core.types import BalanceSheetFrequency, FinancialRatio, StatementFrequency
 from openmarkets.schemas.financials import (
     BalanceSheetEntry,
+    EarningsSurpriseRow,
+    EarningsSurprises,
     EPSHistoryEntry,
     FinancialCalendar,
+    FinancialRatioPeriod,
+    FinancialRatios,
     IncomeStatementEntry,
     SecFilingRecord,
     TTMCashFlowStatementEntry,
     TTMIncomeStatementEntry,
 )
 
+#: Ratios computed when the caller names none: every supported ratio.
+DEFAULT_FINANCIAL_RATIOS: tuple[FinancialRatio, ...] = get_args(FinancialRatio)
+
+# How each statement is read from a ``Ticker``, by cache key: its getter,
+# and whether its row labels are the spaced "pretty" form the TTM schemas
+# alias rather than the CamelCase form the others do.
+_STATEMENTS: dict[str, tuple[str, bool]] = {
+    "income_statement": ("get_income_stmt", False),
+    "balance_sheet": ("get_balance_sheet", False),
+    "cash_flow": ("get_cash_flow", False),
+    "ttm_income_statement": ("get_income_stmt", True),
+    "ttm_cash_flow": ("get_cash_flow", True),
+}
+
+# yfinance's name for each statement frequency.
+_YF_FREQUENCIES: dict[StatementFrequency, str] = {"annual": "yearly", "quarterly": "quarterly", "ttm": "trailing"}
+
+# Statements the ratios are derived from.
+_RATIO_STATEMENTS = ("income_statement", "balance_sheet", "cash_flow")
+
+# Alias of the period field of every statement entry schema; the row
+# labels of a statement are the aliases of its line-item fields.
+_PERIOD_ALIAS = "index"
+
+_StatementEntryT = TypeVar("_StatementEntryT", bound=BaseModel)
+
+# Time after a scheduled report during which its filing may still reach
+# Yahoo; statements cached across a report expire at its end.
+_REPORT_GRACE = timedelta(days=2)
+
+# Lifetime, in seconds, of statements and reported EPS when no report is
+# scheduled or the calendar has not yet moved past the last one.
+_UNSCHEDULED_REPORT_TTL = 6 * 60 * 60.0
+
+# Earnings-date pages downloaded at once by one multi-ticker call; the
+# page is one of Yahoo's slowest.
+_MAX_CONCURRENT_EARNINGS = 8
+
+# Lifetime, in seconds, of the earnings calendar; report dates are daily.
+_CALENDAR_TTL = 24 * 60 * 60.0
+
+
+class _LineItems:
+    """The line items of several statements, each a series over periods.
+
+    Periods run oldest to newest, so ``diff`` and ``shift`` compare a
+    period with the one before it. A line item a company does not report
+    is an all-NaN series, which every ratio using it inherits.
+    """
+
+    def __init__(self, statements: list[pd.DataFrame]) -> None:
+        """Merge statements of line-item rows by period columns.
+
+        Args:
+            statements: Statements as yfinance returns them, one row per
+                line item and one column per period.
+        """
+        frame = pd.concat([statement for statement in statements if not statement.empty])
+        frame = frame[~frame.index.duplicated()]
+        self.frame = frame.sort_index(axis=1).apply(pd.to_numeric, errors="coerce")
+
+    @property
+    def periods(self) -> pd.Index:
+        """Return the statement periods, oldest first."""
+        return self.frame.columns
+
+    def __getitem__(self, item: str) -> pd.Series:
+        """Return a line item across periods, all NaN when not reported."""
+        if item in self.frame.index:
+            return self.frame.loc[item]
+        return pd.Series(np.nan, index=self.periods)
+
+
+def _signal(condition: pd.Series, *inputs: pd.Series) -> pd.Series:
+    """Return a 0/1 signal that is NaN wherever one of its inputs is.
+
+    Args:
+        condition: Boolean test per period.
+        inputs: Series the test was computed from.
+
+    Returns:
+        1.0 where the condition holds, 0.0 where not, NaN where undefined.
+    """
+    defined = pd.concat(inputs, axis=1).notna().all(axis=1)
+    return condition.astype(float).where(defined)
+
+
+def _altman_z(items: _LineItems) -> pd.Series:
+    """Return Altman's Z' score, the book-equity form of the Z score.
+
+    The original score divides market capitalisation by liabilities;
+    statements carry no historical market value, so book equity stands in,
+    with the coefficients Altman re-estimated for that substitution.
+    """
+    assets = items["TotalAssets"]
+    return (
+        0.717 * items["WorkingCapital"] / assets
+        + 0.847 * items["RetainedEarnings"] / assets
+        + 3.107 * items["EBIT"] / assets
+        + 0.420 * items["StockholdersEquity"] / items["TotalLiabilitiesNetMinorityInterest"]
+        + 0.998 * items["TotalRevenue"] / assets
+    )
+
+
+def _piotroski_f(items: _LineItems) -> pd.Series:
+    """Return the Piotroski F-score, nine 0/1 signals each versus the prior period.
+
+    The oldest period has no prior one and scores NaN, as does any period
+    missing a line item a signal needs.
+    """
+    assets = items["TotalAssets"]
+    net_income = items["NetIncome"]
+    cash_flow = items["OperatingCashFlow"]
+    roa = net_income / assets
+    leverage = items["LongTermDebt"] / assets
+    liquidity = items["CurrentAssets"] / items["CurrentLiabilities"]
+    shares = items["OrdinarySharesNumber"]
+    gross_margin = items["GrossProfit"] / items["TotalRevenue"]
+    turnover = items["TotalRevenue"] / assets
+    signals = [
+        _signal(roa > 0, roa),
+        _signal(cash_flow > 0, cash_flow),
+        _signal(roa.diff() > 0, roa.diff()),
+        _signal(cash_flow > net_income, cash_flow, net_income),
+        _signal(leverage.diff() < 0, leverage.diff()),
+        _signal(liquidity.diff() > 0, liquidity.diff()),
+        _signal(shares.diff() <= 0, shares.diff()),
+        _signal(gross_margin.diff() > 0, gross_margin.diff()),
+        _signal(turnover.diff() > 0, turnover.diff()),
+    ]
+    return pd.concat(signals, axis=1).sum(axis=1, skipna=False)
+
+
+# How each ratio is derived; every formula works on whole series, so one
+# evaluation covers every period.
+_RATIO_FORMULAS: dict[str, Callable[[_LineItems], pd.Series]] = {
+    "gross_margin": lambda items: items["GrossProfit"] / items["TotalRevenue"],
+    "operating_margin": lambda items: items["OperatingIncome"] / items["TotalRevenue"],
+    "net_margin": lambda items: items["NetIncome"] / items["TotalRevenue"],
+    "fcf_margin": lambda items: items["FreeCashFlow"] / items["TotalRevenue"],
+    "roe": lambda items: items["NetIncome"] / items["StockholdersEquity"],
+    "roa": lambda items: items["NetIncome"] / items["TotalAssets"],
+    "roic": lambda items: items["EBIT"] * (1 - items["TaxRateForCalcs"]) / items["InvestedCapital"],
+    "interest_coverage": lambda items: items["EBIT"] / items["InterestExpense"],
+    "current_ratio": lambda items: items["CurrentAssets"] / items["CurrentLiabilities"],
+    "debt_to_equity": lambda items: items["TotalDebt"] / items["StockholdersEquity"],
+    "altman_z": _altman_z,
+    "piotroski_f": _piotroski_f,
+}
+
+
+def _get_calendar(ticker: str, session: Session | None) -> dict:
+    """Return a ticker's earnings and dividend calendar, shared through the cache.
+
+    Args:
+        ticker: Stock ticker symbol.
+        session: Optional HTTP session for request handling.
+
+    Returns:
+        The raw calendar mapping.
+    """
+    return get_cache().get_or_set(
+        ("financials.calendar", ticker.upper()),
+        lambda: yf.Ticker(ticker, session=session).get_calendar(),
+        ttl=_CALENDAR_TTL,
+    )
+
+
+def _report_ttl(ticker: str, session: Session | None) -> float:
+    """Return how long data that changes only when a ticker reports stays valid.
+
+    Statements and reported EPS change only when a report is filed, so
+    they are kept until the next scheduled report plus a grace window for
+    the filing to reach Yahoo. A report that is still within its grace
+    window counts as the next one, so the data keeps refreshing until it
+    has been picked up.
+
+    Args:
+        ticker: Stock ticker symbol.
+        session: Optional HTTP session for request handling.
+
+    Returns:
+        Seconds until the end of the next report's grace window, or
+        ``_UNSCHEDULED_REPORT_TTL`` when no report is scheduled.
+    """
+    now = datetime.now(timezone.utc)
+    try:
+        report_dates = list(_get_calendar(ticker, session).get("Earnings Date") or [])
+    except Exception:
+        report_dates = []
+    deadlines = [
+        datetime.combine(report, time.min, tzinfo=timezone.utc) + _REPORT_GRACE
+        for report in (value.date() if isinstance(value, datetime) else value for value in report_dates)
+        if isinstance(report, date)
+    ]
+    upcoming = [deadline for deadline in deadlines if deadline > now]
+    if not upcoming:
+        return _UNSCHEDULED_REPORT_TTL
+    return (min(upcoming) - now).total_seconds()
+
+
+def _get_statement(ticker: str, statement: str, freq: StatementFrequency, session: Session | None) -> pd.DataFrame:
+    """Return one of a ticker's statements, cached until its next report.
+
+    Each frequency is its own entry, so switching between annual and
+    quarterly views of a statement downloads each at most once.
+
+    Args:
+        ticker: Stock ticker symbol.
+        statement: Key of ``_STATEMENTS``.
+        freq: Period columns of the statement.
+        session: Optional HTTP session for request handling.
+
+    Returns:
+        The statement, one row per line item and one column per period,
+        newest first.
+    """
+    getter, pretty = _STATEMENTS[statement]
+
+    def download() -> pd.DataFrame:
+        frame = getattr(yf.Ticker(ticker, session=session), getter)(pretty=pretty, freq=_YF_FREQUENCIES[freq])
+        return frame.sort_index(axis=1, ascending=False)
+
+    return get_cache().get_or_set(
+        ("financials.statement", ticker.upper(), statement, freq),
+        download,
+        ttl=_report_ttl(ticker, session),
+    )
 
+
+def _get_earnings_dates(ticker: str, session: Session | None) -> pd.DataFrame | None:
+    """Return a ticker's past and upcoming earnings dates, cached until its next report.
+
+    Args:
+        ticker: Stock ticker symbol.
+        session: Optional HTTP session for request handling.
+
+    Returns:
+        Estimated and reported EPS by earnings date, newest first, or None
+        when Yahoo lists no earnings dates.
+    """
+    return get_cache().get_or_set(
+        ("financials.earnings_dates", ticker.upper()),
+        lambda: yf.Ticker(ticker, session=session).get_earnings_dates(),
+        ttl=_report_ttl(ticker, session),
+    )
+
+
+def _earnings_surprise(ticker: str, earnings: pd.DataFrame, quarters: int) -> EarningsSurpriseRow:
+    """Summarise a ticker's recent EPS surprises.
+
+    Args:
+        ticker: Ticker symbol.
+        earnings: Earnings dates as yfinance returns them.
+        quarters: Number of most recent reported quarters to summarise.
+
+    Returns:
+        The ticker's surprise row.
+    """
+    earnings = earnings.sort_index(ascending=False)
+    reported = earnings[earnings["Reported EPS"].notna()].iloc[:quarters]
+    upcoming = earnings.index[earnings["Reported EPS"].isna() & (earnings.index > pd.Timestamp.now(tz="UTC"))]
+    # +1 beat, -1 miss, 0 in line, NaN without an estimate.
+    outcomes = np.sign(reported["Reported EPS"] - reported["EPS Estimate"]).dropna().to_numpy()
+    streak = 0
+    if len(outcomes) and outcomes[0] != 0:
+        broken = outcomes != outcomes[0]
+        streak = int((broken.argmax() if broken.any() else len(outcomes)) * outcomes[0])
+    surprises = reported["Surprise(%)"]
+    last_surprise = surprises.iloc[0] if len(surprises) else np.nan
+    return EarningsSurpriseRow(
+        ticker=ticker,
+        next_report_date=upcoming.min().to_pydatetime() if len(upcoming) else None,
+        last_report_date=reported.index[0].to_pydatetime() if len(reported) else None,
+        last_surprise_pct=None if np.isnan(last_surprise) else float(last_surprise),
+        average_surprise_pct=float(surprises.mean()) if surprises.notna().any() else None,
+        beats=int((outcomes > 0).sum()),
+        misses=int((outcomes < 0).sum()),
+        streak=streak,
+    )
+
+
+@cache
+def _line_item_aliases(model: type[_StatementEntryT]) -> dict[str, str]:
+    """Map each line-item field of a statement schema, by name and alias, to its alias.
+
+    Args:
+        model: Statement entry schema.
+
+    Returns:
+        Alias by field name and by alias, excluding the period field.
+    """
+    aliases: dict[str, str] = {}
+    for name, field in model.model_fields.items():
+        alias = field.alias or name
+        if alias != _PERIOD_ALIAS:
+            aliases[name] = aliases[alias] = alias
+    return aliases
+
+
+@cache
+def _entries_adapter(model: type[_StatementEntryT]) -> TypeAdapter[list[_StatementEntryT]]:
+    """Return the adapter validating a list of statement entries in one call."""
+    return TypeAdapter(GenericAlias(list, (model,)))
+
+
+def _statement_entries(
+    statement: pd.DataFrame,
+    model: type[_StatementEntryT],
+    items: list[str] | None = None,
+    periods: int | None = None,
+) -> list[_StatementEntryT]:
+    """Convert a statement to one schema entry per period.
+
+    The frame is never transposed: its line-item rows are cut to the
+    schema's aliases (or the requested items) once, each period column
+    becomes a record, and all records are validated in a single call.
+    Missing and unrequested line items are left out of the records, so
+    they stay unset and are omitted from the entries' output rather than
+    reaching the client as NaN or null.
+
+    Args:
+        statement: Statement with one row per line item and one column
+            per period.
+        model: Statement entry schema, whose line-item aliases match the
+            statement's row labels.
+        items: Line items to keep, by field name or alias. Defaults to
+            every line item of the schema.
+        periods: Number of leading period columns to keep. Defaults to
+            all of them.
+
+    Returns:
+        One entry per period, in the statement's column order.
+
+    Raises:
+        ValueError: If an item is not a line item of the schema.
+    """
+    aliases = _line_item_aliases(model)
+    if items is None:
+        wanted = set(aliases.values())
+    else:
+        unknown = [item for item in items if item not in aliases]
+        if unknown:
+            raise ValueError(f"Unknown line items for {model.__name__}: {', '.join(unknown)}.")
+        wanted = {aliases[item] for item in items}
+    selected = statement.loc[statement.index.isin(wanted), statement.columns[:periods]]
+    records = [
+        {_PERIOD_ALIAS: period, **{item: value for item, value in values.items() if value == value}}
+        for period, values in selected.to_dict().items()
+    ]
+    return _entries_adapter(model).validate_python(records)
+
+
+@traced_repository
 class YFinanceFinancialsRepository:
     """Repository for accessing financial data from yfinance."""
 
-    def get_balance_sheet(self, ticker: str, session: Session | None = None) -> list[BalanceSheetEntry]:
+    def get_balance_sheet(
+        self,
+        ticker: str,
+        freq: BalanceSheetFrequency = "annual",
+        periods: int | None = None,
+        items: list[str] | None = None,
+        session: Session | None = None,
+    ) -> list[BalanceSheetEntry]:
         """Retrieve balance sheet data for a ticker.
 
         Args:
             ticker: Stock ticker symbol.
+            freq: Period columns: fiscal years or quarters.
+            periods: Number of periods to return, newest first. Defaults
+                to every period available.
+            items: Line items to include, by field name or alias. Defaults
+                to every line item.
             session: Optional HTTP session for request handling.
 
         Returns:
-            List of balance sheet entries.
+            List of balance sheet entries, newest first.
         """
-        ticker_obj = yf.Ticker(ticker, session=session)
-        df = ticker_obj.get_balance_sheet()
-        transposed = df.transpose()
-        reset_df = transposed.reset_index()
-        return [BalanceSheetEntry(**row.to_dict()) for _, row in reset_df.iterrows()]
+        statement = _get_statement(ticker, "balance_sheet", freq, session)
+        return _statement_entries(statement, BalanceSheetEntry, items, periods)
 
-    def get_income_statement(self, ticker: str, session: Session | None = None) -> list[IncomeStatementEntry]:
+    def get_income_statement(
+        self,
+        ticker: str,
+        freq: StatementFrequency = "annual",
+        periods: int | None = None,
+        items: list[str] | None = None,
+        session: Session | None = None,
+    ) -> list[IncomeStatementEntry]:
         """Retrieve income statement data for a ticker.
 
         Args:
             ticker: Stock ticker symbol.
+            freq: Period columns: fiscal years or quarters, or the trailing
+                twelve months.
+            periods: Number of periods to return, newest first. Defaults
+                to every period available.
+            items: Line items to include, by field name or alias. Defaults
+                to every line item.
             session: Optional HTTP session for request handling.
 
         Returns:
-            List of income statement entries.
+            List of income statement entries, newest first.
         """
-        ticker_obj = yf.Ticker(ticker, session=session)
-        df = ticker_obj.get_income_stmt()
-        transposed = df.transpose()
-        reset_df = transposed.reset_index()
-        return [IncomeStatementEntry(**row.to_dict()) for _, row in reset_df.iterrows()]
+        statement = _get_statement(ticker, "income_statement", freq, session)
+        return _statement_entries(statement, IncomeStatementEntry, items, periods)
 
-    def get_ttm_income_statement(self, ticker: str, session: Session | None = None) -> list[TTMIncomeStatementEntry]:
+    def get_ttm_income_statement(
+        self,
+        ticker: str,
+        periods: int | None = None,
+        items: list[str] | None = None,
+        session: Session | None = None,
+    ) -> list[TTMIncomeStatementEntry]:
         """Retrieve trailing twelve months income statement for a ticker.
 
         Args:
             ticker: Stock ticker symbol.
+            periods: Number of periods to return, newest first. Defaults
+                to every period available.
+            items: Line items to include, by field name or alias. Defaults
+                to every line item.
             session: Optional HTTP session for request handling.
 
         Returns:
-            List of TTM income statement entries.
+            List of TTM income statement entries, newest first.
         """
-        ticker_obj = yf.Ticker(ticker, session=session)
-        data = ticker_obj.ttm_income_stmt
-        transposed = data.transpose()
-        reset_data = transposed.reset_index()
-        return [TTMIncomeStatementEntry(**row.to_dict()) for _, row in reset_data.iterrows()]
+        statement = _get_statement(ticker, "ttm_income_statement", "ttm", session)
+        return _statement_entries(statement, TTMIncomeStatementEntry, items, periods)
 
     def get_ttm_cash_flow_statement(
-        self, ticker: str, session: Session | None = None
+        self,
+        ticker: str,
+        periods: int | None = None,
+        items: list[str] | None = None,
+        session: Session | None = None,
     ) -> list[TTMCashFlowStatementEntry]:
         """Retrieve trailing twelve months cash flow statement for a ticker.
 
         Args:
             ticker: Stock ticker symbol.
+            periods: Number of periods to return, newest first. Defaults
+                to every period available.
+            items: Line items to include, by field name or alias. Defaults
+                to every line item.
             session: Optional HTTP session for request handling.
 
         Returns:
-            List of TTM cash flow statement entries.
+            List of TTM cash flow statement entries, newest first.
         """
-        ticker_obj = yf.Ticker(ticker, session=session)
-        data = ticker_obj.ttm_cash_flow
-        transposed = data.transpose()
-        reset_data = transposed.reset_index()
-        return [TTMCashFlowStatementEntry(**row.to_dict()) for _, row in reset_data.iterrows()]
+        statement = _get_statement(ticker, "ttm_cash_flow", "ttm", session)
+        return _statement_entries(statement, TTMCashFlowStatementEntry, items, periods)
 
     def get_financial_calendar(self, ticker: str, session: Session | None = None) -> FinancialCalendar:
         """Retrieve financial calendar for a ticker.
@@ -97,8 +504,7 @@ class YFinanceFinancialsRepository:
         Returns:
             Financial calendar data.
         """
-        ticker_obj = yf.Ticker(ticker, session=session)
-        data = ticker_obj.get_calendar()
+        data = _get_calendar(ticker, session)
         return FinancialCalendar(**data)
 
     def get_sec_filings(self, ticker: str, session: Session | None = None) -> list[SecFilingRecord]:
@@ -125,9 +531,103 @@ class YFinanceFinancialsRepository:
         Returns:
             List of EPS history entries.
         """
-        ticker_obj = yf.Ticker(ticker, session=session)
-        df = ticker_obj.get_earnings_dates()
+        df = _get_earnings_dates(ticker, session)
         if df is None:
             return []
         reset_df = df.reset_index()
         return [EPSHistoryEntry(**row.to_dict()) for _, row in reset_df.iterrows()]
+
+    def get_financial_ratios(
+        self,
+        ticker: str,
+        ratios: list[FinancialRatio] | None = None,
+        freq: BalanceSheetFrequency = "annual",
+        periods: int | None = None,
+        session: Session | None = None,
+    ) -> FinancialRatios:
+        """Derive financial ratios for every period of a ticker's statements.
+
+        The income statement, balance sheet and cash flow statement are
+        downloaded concurrently, once, and each ratio is evaluated over all
+        periods at a time. Period-over-period signals are computed over
+        every period before ``periods`` cuts the table.
+
+        Args:
+            ticker: Stock ticker symbol.
+            ratios: Ratios to compute, in column order. Defaults to every
+                supported ratio.
+            freq: Period columns: fiscal years or quarters.
+            periods: Number of periods to return, newest first. Defaults
+                to every period with a computable ratio.
+            session: Optional HTTP session for request handling.
+
+        Returns:
+            One row per period, newest first, of values aligned with
+            ``ratios``; periods without any computable ratio are dropped.
+
+        Raises:
+            DataUnavailableError: If the ticker has none of the statements.
+        """
+        columns = list(dict.fromkeys(ratios or DEFAULT_FINANCIAL_RATIOS))
+        statements = gather(
+            {
+                statement: (lambda statement=statement: _get_statement(ticker, statement, freq, session))
+                for statement in _RATIO_STATEMENTS
+            }
+        )
+        if all(statement.empty for statement in statements.values()):
+            raise DataUnavailableError(f"No financial statements available for {ticker}.")
+        items = _LineItems(list(statements.values()))
+        table = pd.DataFrame({ratio: _RATIO_FORMULAS[ratio](items) for ratio in columns}, index=items.periods)
+        table = table.replace([np.inf, -np.inf], np.nan).dropna(how="all").iloc[::-1].iloc[:periods]
+        return FinancialRatios(
+            ticker=ticker.upper(),
+            freq=freq,
+            ratios=columns,
+            periods=[
+                FinancialRatioPeriod(
+                    period=period.date(), values=[None if np.isnan(value) else float(value) for value in row]
+                )
+                for period, row in zip(table.index, table.to_numpy(), strict=True)
+            ],
+        )
+
+    def get_earnings_surprises(
+        self, tickers: list[str], quarters: int = 8, session: Session | None = None
+    ) -> EarningsSurprises:
+        """Summarise recent EPS surprises of several tickers.
+
+        Earnings dates are downloaded concurrently, at most
+        ``_MAX_CONCURRENT_EARNINGS`` at a time, through the same cache
+        entry as ``get_eps_history``, which holds until each ticker's next
+        report.
+
+        Args:
+            tickers: Ticker symbols; duplicates are ignored.
+            quarters: Number of most recent reported quarters to summarise.
+            session: Optional HTTP session for request handling.
+
+        Returns:
+            One row per ticker with earnings dates, in request order, and
+            the tickers without.
+        """
+        symbols = list(dict.fromkeys(ticker.upper() for ticker in tickers))
+
+        def summarise(symbol: str) -> EarningsSurpriseRow | None:
+            try:
+                earnings = _get_earnings_dates(symbol, session)
+            except Exception:
+                return None
+            if earnings is None or earnings.empty:
+                return None
+            return _earnings_surprise(symbol, earnings, quarters)
+
+        rows = gather(
+            {symbol: (lambda symbol=symbol: summarise(symbol)) for symbol in symbols},
+            max_workers=_MAX_CONCURRENT_EARNINGS,
+        )
+        return EarningsSurprises(
+            quarters=quarters,
+            rows=[row for row in rows.values() if row is not None],
+            unavailable=[symbol for symbol, row in rows.items() if row is None],
+        )
@@ -2,23 +2,82 @@
 
 Provides abstractions and implementations for fetching fund information,
 holdings, sector weightings, and operational data.
+
+Every fund tool except :meth:`YFinanceFundsRepository.get_fund_info` is a
+projection of the same ``Ticker.get_funds_data()`` download, so it is taken
+once per ticker as a snapshot of all its sections and shared through the
+cache; a full fund profile costs a single upstream request, and a
+look-through or overlap matrix across several funds one request per fund.
 """
 
+from typing import Any, NamedTuple
+
+import numpy as np
+import pandas as pd
 import yfinance as yf
 from curl_cffi.requests import Session
 
+from openmarkets.core.cache import get_cache
+from openmarkets.core.concurrency import gather
+from openmarkets.core.tracing import traced_repository
 from openmarkets.schemas.funds import (
     FundAssetClassHolding,
     FundBondHolding,
     FundEquityHolding,
     FundInfo,
+    FundLookThrough,
     FundOperations,
+    FundOverlap,
     FundOverview,
+    FundProfile,
     FundSectorWeighting,
     FundTopHolding,
+    LookThroughHolding,
+    SectorExposure,
 )
 
+# Lifetime, in seconds, of a fund's data snapshot; holdings and weightings
+# are only republished every few weeks.
+_FUNDS_DATA_TTL = 6 * 60 * 60.0
+
+# Fund data downloaded at once by one multi-fund call.
+_MAX_CONCURRENT_FUNDS = 8
+
+
+class _FundsData(NamedTuple):
+    """The sections of a fund's data, None where the fund has none."""
+
+    sector_weightings: dict | None = None
+    fund_operations: Any = None
+    fund_overview: dict | None = None
+    top_holdings: pd.DataFrame | None = None
+    bond_holdings: pd.DataFrame | None = None
+    equity_holdings: pd.DataFrame | None = None
+    asset_classes: dict | None = None
+
+
+def _get_funds_data(ticker: str, session: Session | None) -> _FundsData:
+    """Return a snapshot of a fund's data, shared through the cache.
+
+    Args:
+        ticker: Fund ticker symbol.
+        session: Optional HTTP session for request handling.
+
+    Returns:
+        Every section of the fund's data, read from one download.
+    """
+
+    def snapshot() -> _FundsData:
+        funds_data = yf.Ticker(ticker, session=session).get_funds_data()
+        if not funds_data:
+            return _FundsData()
+        # The sections are parsed from one response on first access.
+        return _FundsData(*(getattr(funds_data, section, None) for section in _FundsData._fields))
+
+    return get_cache().get_or_set(("funds.data", ticker.upper()), snapshot, ttl=_FUNDS_DATA_TTL)
 
+
+@traced_repository
 class YFinanceFundsRepository:
     """Repository for accessing fund data from yfinance."""
 
@@ -37,28 +96,248 @@ class YFinanceFundsRepository:
         return FundInfo(**fund_info)
 
     def get_fund_sector_weighting(self, ticker: str, session: Session | None = None) -> FundSectorWeighting | None:
-        fund_ticker = yf.Ticker(ticker, session=session)
-        fund_info = fund_ticker.get_funds_data()
-        if not fund_info:
-            return None
-        if not hasattr(fund_info, "sector_weightings"):
-            return None
-        return FundSectorWeighting(**fund_info.sector_weightings)
+        """Retrieve fund sector weighting for a ticker.
+
+        Args:
+            ticker: Fund ticker symbol.
+            session: Optional HTTP session for request handling.
+
+        Returns:
+            Fund sector weighting, or None if unavailable.
+        """
+        return self._sector_weighting(_get_funds_data(ticker, session))
 
     def get_fund_operations(self, ticker: str, session: Session | None = None) -> FundOperations | None:
-        fund_ticker = yf.Ticker(ticker, session=session)
-        fund_info = fund_ticker.get_funds_data()
-        if not fund_info:
-            return None
-        if not hasattr(fund_info, "fund_operations"):
-            return None
+        """Retrieve fund operations for a ticker.
 
-        ops = fund_info.fund_operations
-        if hasattr(ops, "to_dict"):
-            ops = ops.to_dict()
+        Args:
+            ticker: Fund ticker symbol.
+            session: Optional HTTP session for request handling.
+
+        Returns:
+            Fund operations, or None if unavailable.
+        """
+        return self._operations(_get_funds_data(ticker, session))
+
+    def get_fund_overview(self, ticker: str, session: Session | None = None) -> FundOverview | None:
+        """Retrieve fund overview for a ticker.
+
+        Args:
+            ticker: Fund ticker symbol.
+            session: Optional HTTP session for request handling.
+
+        Returns:
+            Fund overview, or None if unavailable.
+        """
+        return self._overview(_get_funds_data(ticker, session))
+
+    def get_fund_top_holdings(self, ticker: str, session: Session | None = None) -> list[FundTopHolding]:
+        """Retrieve fund top holdings for a ticker.
 
-        normalized_ops = self._normalize_fund_operations(ops)
-        return FundOperations(**normalized_ops)
+        Args:
+            ticker: Fund ticker symbol.
+            session: Optional HTTP session for request handling.
+
+        Returns:
+            List of fund top holdings.
+        """
+        return self._top_holdings(_get_funds_data(ticker, session))
+
+    def get_fund_bond_holdings(self, ticker: str, session: Session | None = None) -> list[FundBondHolding]:
+        """Retrieve fund bond holdings for a ticker.
+
+        Args:
+            ticker: Fund ticker symbol.
+            session: Optional HTTP session for request handling.
+
+        Returns:
+            List of fund bond holdings.
+        """
+        return self._bond_holdings(_get_funds_data(ticker, session))
+
+    def get_fund_equity_holdings(self, ticker: str, session: Session | None = None) -> list[FundEquityHolding]:
+        """Retrieve fund equity holdings for a ticker.
+
+        Args:
+            ticker: Fund ticker symbol.
+            session: Optional HTTP session for request handling.
+
+        Returns:
+            List of fund equity holdings.
+        """
+        return self._equity_holdings(_get_funds_data(ticker, session))
+
+    def get_fund_asset_class_holdings(
+        self, ticker: str, session: Session | None = None
+    ) -> FundAssetClassHolding | None:
+        """Retrieve fund asset class holdings for a ticker.
+
+        Args:
+            ticker: Fund ticker symbol.
+            session: Optional HTTP session for request handling.
+
+        Returns:
+            Fund asset class holdings, or None if unavailable.
+        """
+        return self._asset_class_holdings(_get_funds_data(ticker, session))
+
+    def get_full_fund_profile(self, ticker: str, session: Session | None = None) -> FundProfile:
+        """Retrieve every section of a fund's data from a single download.
+
+        Args:
+            ticker: Fund ticker symbol.
+            session: Optional HTTP session for request handling.
+
+        Returns:
+            The fund's overview, operations, allocations and holdings.
+        """
+        data = _get_funds_data(ticker, session)
+        return FundProfile(
+            ticker=ticker.upper(),
+            overview=self._overview(data),
+            operations=self._operations(data),
+            asset_classes=self._asset_class_holdings(data),
+            sector_weighting=self._sector_weighting(data),
+            top_holdings=self._top_holdings(data),
+            equity_holdings=self._equity_holdings(data),
+            bond_holdings=self._bond_holdings(data),
+        )
+
+    def get_fund_look_through(
+        self, funds: dict[str, float], top: int = 25, session: Session | None = None
+    ) -> FundLookThrough:
+        """Aggregate a portfolio of funds into its effective holdings and sectors.
+
+        Fund data is downloaded concurrently, at most ``_MAX_CONCURRENT_FUNDS``
+        at a time, through the same cache entry as the single-fund tools. The
+        exposure to a stock or sector is the sum over funds of the fund's
+        portfolio weight times the stock's or sector's weight in the fund,
+        computed as one matrix product per table.
+
+        Args:
+            funds: Portfolio weight by fund ticker; weights are normalised to
+                sum to 1 and repeated tickers are added together.
+            top: Number of effective holdings to return.
+            session: Optional HTTP session for request handling.
+
+        Returns:
+            The largest effective holdings, the sector exposure, and the
+            funds whose data could not be used.
+        """
+        weights = pd.Series(funds, dtype=float)
+        weights = weights.groupby(weights.index.str.upper(), sort=False).sum()
+        weights = weights / weights.sum()
+        snapshots = gather(
+            {fund: (lambda fund=fund: self._try_get_funds_data(fund, session)) for fund in weights.index},
+            max_workers=_MAX_CONCURRENT_FUNDS,
+        )
+
+        names: dict[str, str] = {}
+        holding_columns = {}
+        sector_columns = {}
+        for fund, data in snapshots.items():
+            if data is None:
+                continue
+            frame = self._listed_top_holdings(data)
+            if not frame.empty:
+                names.update(frame.dropna(subset=["Name"]).set_index("Symbol")["Name"].to_dict())
+                holding_columns[fund] = frame.groupby("Symbol")["Holding Percent"].sum()
+            # An empty weighting leaves the fund out, as if it reported none.
+            if data.sector_weightings and (sector_weighting := self._sector_weighting(data)) is not None:
+                sector_columns[fund] = pd.Series(sector_weighting.model_dump(), dtype=float)
+
+        holdings = pd.DataFrame(holding_columns)
+        sectors = pd.DataFrame(sector_columns)
+        exposure = holdings.fillna(0.0) @ weights.reindex(holdings.columns)
+        sector_exposure = sectors.fillna(0.0) @ weights.reindex(sectors.columns)
+        largest = exposure.nlargest(top)
+        return FundLookThrough(
+            weights=weights.to_dict(),
+            holdings=[
+                LookThroughHolding(
+                    symbol=symbol,
+                    name=names.get(symbol),
+                    weight=weight,
+                    funds=holdings.columns[holdings.loc[symbol].notna()].tolist(),
+                )
+                for symbol, weight in largest.items()
+            ],
+            holdings_coverage=float(exposure.sum()),
+            sectors=[
+                SectorExposure(sector=sector, weight=weight)
+                for sector, weight in sector_exposure[sector_exposure > 0].sort_values(ascending=False).items()
+            ],
+            unavailable=[fund for fund in weights.index if fund not in holding_columns and fund not in sector_columns],
+        )
+
+    def get_fund_overlap(self, tickers: list[str], session: Session | None = None) -> FundOverlap:
+        """Compute the pairwise holdings overlap of several funds.
+
+        The overlap of two funds is the weight they hold in common, the sum
+        over stocks of the smaller of the two funds' weights in the stock.
+        Each fund's top holdings become a weight vector over the vocabulary
+        of every symbol held by any of the funds, so all pairs are computed
+        at once from one fund x symbol matrix.
+
+        Args:
+            tickers: Fund ticker symbols; duplicates are ignored.
+            session: Optional HTTP session for request handling.
+
+        Returns:
+            Symmetric overlap and shared-holding matrices over the funds
+            with top holdings, and the funds without them.
+        """
+        symbols = list(dict.fromkeys(ticker.upper() for ticker in tickers))
+        snapshots = gather(
+            {fund: (lambda fund=fund: self._try_get_funds_data(fund, session)) for fund in symbols},
+            max_workers=_MAX_CONCURRENT_FUNDS,
+        )
+        holding_columns = {}
+        for fund, data in snapshots.items():
+            frame = self._listed_top_holdings(data)
+            if not frame.empty:
+                holding_columns[fund] = frame.groupby("Symbol")["Holding Percent"].sum()
+
+        # Rows are funds, columns the symbol vocabulary.
+        weights = pd.DataFrame(holding_columns).fillna(0.0).to_numpy().T
+        held = (weights > 0).astype(int)
+        overlap = np.minimum(weights[:, None, :], weights[None, :, :]).sum(axis=2)
+        return FundOverlap(
+            tickers=list(holding_columns),
+            overlap=overlap.round(4).tolist(),
+            shared_holdings=(held @ held.T).tolist(),
+            unavailable=[fund for fund in symbols if fund not in holding_columns],
+        )
+
+    def _listed_top_holdings(self, data: _FundsData | None) -> pd.DataFrame:
+        """Return a fund's top holdings that have a ticker symbol.
+
+        Args:
+            data: The fund's data snapshot, None when it could not be fetched.
+
+        Returns:
+            The holdings as Symbol, Name and Holding Percent columns; empty
+            when the fund has none.
+        """
+        if data is None or data.top_holdings is None:
+            return pd.DataFrame(columns=["Symbol", "Name", "Holding Percent"])
+        return data.top_holdings.reset_index().dropna(subset=["Symbol"])
+
+    def _try_get_funds_data(self, ticker: str, session: Session | None) -> _FundsData | None:
+        """Return a fund's data snapshot, or None when it cannot be fetched.
+
+        Args:
+            ticker: Fund ticker symbol.
+            session: Optional HTTP session for request handling.
+
+        Returns:
+            The snapshot, or None for a failed download, so one bad ticker
+            cannot fail the look-through.
+        """
+        try:
+            return _get_funds_data(ticker, session)
+        except Exception:
+            return None
 
     def _normalize_fund_operations(self, ops: dict) -> dict:
         """Normalize fund operations dictionary to native types.
@@ -69,8 +348,6 @@ class YFinanceFundsRepository:
         Returns:
             Dictionary with normalized keys and values.
         """
-        import numpy as np
-        import pandas as pd
 
         def to_native(val):
             if isinstance(val, pd.Series):
@@ -88,84 +365,102 @@ class YFinanceFundsRepository:
 
         return {str(k): to_native(v) for k, v in ops.items()}
 
-    def get_fund_overview(self, ticker: str, session: Session | None = None) -> FundOverview | None:
-        fund_ticker = yf.Ticker(ticker, session=session)
-        fund_info = fund_ticker.get_funds_data()
-        if not fund_info:
+    def _sector_weighting(self, data: _FundsData) -> FundSectorWeighting | None:
+        """Return a fund's sector weights.
+
+        Args:
+            data: The fund's data snapshot.
+
+        Returns:
+            The weight of each sector, or None when the fund reports none.
+        """
+        if data.sector_weightings is None:
+            return None
+        return FundSectorWeighting(**data.sector_weightings)
+
+    def _operations(self, data: _FundsData) -> FundOperations | None:
+        """Return a fund's operating figures, such as expense ratio and turnover.
+
+        Args:
+            data: The fund's data snapshot.
+
+        Returns:
+            The operations converted to native types, or None when the fund
+            reports none.
+        """
+        ops = data.fund_operations
+        if ops is None:
             return None
-        if not hasattr(fund_info, "fund_overview"):
+        if hasattr(ops, "to_dict"):
+            ops = ops.to_dict()
+        return FundOperations(**self._normalize_fund_operations(ops))
+
+    def _overview(self, data: _FundsData) -> FundOverview | None:
+        """Return a fund's category, family and legal type.
+
+        Args:
+            data: The fund's data snapshot.
+
+        Returns:
+            The overview, or None when the fund reports none.
+        """
+        if data.fund_overview is None:
             return None
-        return FundOverview(**fund_info.fund_overview)
+        return FundOverview(**data.fund_overview)
 
-    def get_fund_top_holdings(self, ticker: str, session: Session | None = None) -> list[FundTopHolding]:
-        """Retrieve fund top holdings for a ticker.
+    def _top_holdings(self, data: _FundsData) -> list[FundTopHolding]:
+        """Return a fund's top holdings, including those without a symbol.
 
         Args:
-            ticker: Fund ticker symbol.
-            session: Optional HTTP session for request handling.
+            data: The fund's data snapshot.
 
         Returns:
-            List of fund top holdings.
+            One entry per holding; empty when the fund reports none.
         """
-        fund_ticker = yf.Ticker(ticker, session=session)
-        fund_info = fund_ticker.get_funds_data()
-        if not fund_info:
-            return []
-        if not hasattr(fund_info, "top_holdings"):
+        if data.top_holdings is None:
             return []
-        df = fund_info.top_holdings
-        reset_df = df.reset_index()
+        reset_df = data.top_holdings.reset_index()
         return [FundTopHolding(**row.to_dict()) for _, row in reset_df.iterrows()]
 
-    def get_fund_bond_holdings(self, ticker: str, session: Session | None = None) -> list[FundBondHolding]:
-        """Retrieve fund bond holdings for a ticker.
+    def _bond_holdings(self, data: _FundsData) -> list[FundBondHolding]:
+        """Return a fund's bond portfolio metrics.
 
         Args:
-            ticker: Fund ticker symbol.
-            session: Optional HTTP session for request handling.
+            data: The fund's data snapshot.
 
         Returns:
-            List of fund bond holdings.
+            One entry per upstream column, such as the fund and its category
+            average; empty when the fund reports none.
         """
-        fund_ticker = yf.Ticker(ticker, session=session)
-        fund_info = fund_ticker.get_funds_data()
-        if not fund_info:
-            return []
-        if not hasattr(fund_info, "bond_holdings"):
+        if data.bond_holdings is None:
             return []
-        df = fund_info.bond_holdings
-        transposed = df.transpose()
-        reset_df = transposed.reset_index()
+        reset_df = data.bond_holdings.transpose().reset_index()
         return [FundBondHolding(**row.to_dict()) for _, row in reset_df.iterrows()]
 
-    def get_fund_equity_holdings(self, ticker: str, session: Session | None = None) -> list[FundEquityHolding]:
-        """Retrieve fund equity holdings for a ticker.
+    def _equity_holdings(self, data: _FundsData) -> list[FundEquityHolding]:
+        """Return a fund's equity portfolio metrics.
 
         Args:
-            ticker: Fund ticker symbol.
-            session: Optional HTTP session for request handling.
+            data: The fund's data snapshot.
 
         Returns:
-            List of fund equity holdings.
+            One entry per upstream column, such as the fund and its category
+            average; empty when the fund reports none.
         """
-        fund_ticker = yf.Ticker(ticker, session=session)
-        fund_info = fund_ticker.get_funds_data()
-        if not fund_info:
+        if data.equity_holdings is None:
             return []
-        if not hasattr(fund_info, "equity_holdings"):
-            return []
-        df = fund_info.equity_holdings
-        transposed = df.transpose()
-        reset_df = transposed.reset_index()
+        reset_df = data.equity_holdings.transpose().reset_index()
         return [FundEquityHolding(**row.to_dict()) for _, row in reset_df.iterrows()]
 
-    def get_fund_asset_class_holdings(
-        self, ticker: str, session: Session | None = None
-    ) -> FundAssetClassHolding | None:
-        fund_ticker = yf.Ticker(ticker, session=session)
-        fund_info = fund_ticker.get_funds_data()
-        if not fund_info:
-            return None
-        if not hasattr(fund_info, "asset_classes"):
+    def _asset_class_holdings(self, data: _FundsData) -> FundAssetClassHolding | None:
+        """Return a fund's weights by asset class, such as stocks and bonds.
+
+        Args:
+            data: The fund's data snapshot.
+
+        Returns:
+            The asset class weights, or None when the fund reports none.
+        """
+        if data.asset_classes is None:
             return None
-        return FundAssetClassHolding(**fund_info.asset_classes)
+        return FundAssetClassHolding(**data.asset_classes)
@@ -7,6 +7,7 @@ mutual fund holdings, insider data, and major holders information.
 import yfinance as yf
 from curl_cffi.requests import Session
 
+from openmarkets.core.tracing import traced_repository
 from openmarkets.schemas.holdings import (
     InsiderPurchase,
     InsiderRosterHolder,
@@ -16,6 +17,7 @@ from openmarkets.schemas.holdings import (
 )
 
 
+@traced_repository
 class YFinanceHoldingsRepository:
     """Repository for accessing holdings data from yfinance."""
 
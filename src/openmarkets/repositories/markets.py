@@ -7,9 +7,11 @@ market status, and related market-level information.
 import yfinance as yf
 from curl_cffi.requests import Session
 
+from openmarkets.core.tracing import traced_repository
 from openmarkets.schemas.markets import MarketStatus, MarketSummary, SummaryEntry
 
 
+@traced_repository
 class YFinanceMarketsRepository:
     """Repository for accessing market data from yfinance.
 
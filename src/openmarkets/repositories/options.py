@@ -1,28 +1,222 @@
 """Options repository.
 
 Provides access to option chains, contracts, and analytics using yfinance.
+
+Downloaded chains and expiration lists are kept in the shared cache, so an
+agent examining one expiration through several tools triggers one download.
+
+Chains are held as :class:`_ContractColumns`, a struct of numpy arrays per
+side, rather than DataFrames or per-contract models. The analytics run on
+whole arrays, and tools returning contracts build one pydantic model per
+contract only for the ``rows`` layout; the ``columns`` layout converts each
+array to a list once. Cached chains are shared between callers and must not
+be mutated.
 """
 
-from datetime import date
-from typing import Protocol
+import logging
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from typing import Literal, NamedTuple, Protocol
 
+import numpy as np
+import pandas as pd
 import yfinance as yf
 from curl_cffi.requests import Session
+from yfinance.exceptions import YFException
 
+from openmarkets.core import black_scholes
+from openmarkets.core.cache import get_cache
+from openmarkets.core.concurrency import gather
 from openmarkets.core.exceptions import DataUnavailableError
+from openmarkets.core.tracing import traced_repository
+from openmarkets.core.types import ContractLayout
 from openmarkets.schemas.options import (
     CallOption,
     OptionContractChain,
+    OptionContractColumns,
     OptionExpirationDate,
+    OptionGreeks,
+    OptionGreeksChain,
+    OptionGreeksColumns,
     OptionsByMoneyness,
+    OptionsPositioning,
+    OptionsScan,
+    OptionsScanRow,
     OptionsSkew,
     OptionsVolumeAnalysis,
     OptionUnderlying,
     PriceRange,
     PutOption,
     SkewPoint,
+    StrikeGammaExposure,
+    StrikeOpenInterest,
+    VolatilitySurface,
 )
 
+logger = logging.getLogger(__name__)
+
+# US equity options stop trading at 16:00 New York time, 20:00 or 21:00 UTC
+# depending on daylight saving; the later bound keeps expiry-day T positive.
+_EXPIRY_TIME_UTC = timedelta(hours=21)
+
+# Floor on time to expiry (one hour), so contracts expiring today still get
+# finite Greeks instead of dividing by zero.
+_MIN_YEARS_TO_EXPIRY = 1 / (365 * 24)
+
+_GREEK_COLUMNS = ("delta", "gamma", "theta", "vega", "rho")
+
+# Shares delivered per standard US equity option contract.
+_CONTRACT_MULTIPLIER = 100
+
+# Chains downloaded at once when one tool call needs several expirations.
+_MAX_CONCURRENT_CHAINS = 8
+
+# Errors that drop one ticker from a scan: upstream and network failures,
+# and chains with missing or malformed data.
+_SCAN_ERRORS = (YFException, OSError, KeyError, TypeError, ValueError)
+
+#: Metrics get_options_scan can rank tickers by.
+OptionsScanMetric = Literal[
+    "put_call_ratio_oi",
+    "put_call_ratio_volume",
+    "atm_implied_volatility",
+    "total_call_volume",
+    "total_put_volume",
+    "total_call_open_interest",
+    "total_put_open_interest",
+]
+
+# The expiration list changes at most daily, so it is kept this many times
+# longer than chains, whose quotes move continuously.
+_EXPIRATIONS_TTL_FACTOR = 10
+
+# Yahoo chain columns stored as float arrays; the rest keep their objects.
+_NUMERIC_COLUMNS = frozenset(
+    {"strike", "lastPrice", "bid", "ask", "change", "percentChange", "volume", "openInterest", "impliedVolatility"}
+)
+
+# Yahoo column names of the fields in a columnar contract response.
+_CONTRACT_FIELDS = tuple(field.alias or name for name, field in OptionContractColumns.model_fields.items())
+
+
+@dataclass(frozen=True)
+class _ContractColumns:
+    """Option contracts as a struct of arrays.
+
+    ``columns`` maps Yahoo's column names to arrays of equal length, one
+    element per contract: float arrays, NaN where a value is missing, for
+    numeric columns and object arrays for the rest.
+    """
+
+    columns: dict[str, np.ndarray] = field(default_factory=dict)
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame | None) -> "_ContractColumns":
+        """Convert one side of a yfinance chain.
+
+        Args:
+            frame: Calls or puts DataFrame; None for a missing side.
+
+        Returns:
+            The same contracts as columns.
+        """
+        if frame is None:
+            return cls()
+        return cls(
+            {
+                str(name): (
+                    pd.to_numeric(frame[name], errors="coerce").to_numpy(dtype=float)
+                    if name in _NUMERIC_COLUMNS
+                    else frame[name].to_numpy(dtype=object)
+                )
+                for name in frame.columns
+            }
+        )
+
+    def __len__(self) -> int:
+        """Return the number of contracts."""
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """Return one column."""
+        return self.columns[name]
+
+    @property
+    def empty(self) -> bool:
+        """Whether there are no contracts."""
+        return len(self) == 0
+
+    def values(self, name: str) -> np.ndarray:
+        """Return a numeric column, all NaN when it is absent."""
+        if name not in self.columns:
+            return np.full(len(self), np.nan)
+        return self.columns[name]
+
+    def select(self, mask: np.ndarray) -> "_ContractColumns":
+        """Return the contracts where ``mask`` is true."""
+        return _ContractColumns({name: array[mask] for name, array in self.columns.items()})
+
+    def with_columns(self, **arrays: np.ndarray) -> "_ContractColumns":
+        """Return a copy with columns added or replaced."""
+        return _ContractColumns({**self.columns, **arrays})
+
+    def records(self, names: list[str] | None = None) -> list[dict]:
+        """Materialise one dictionary per contract.
+
+        Args:
+            names: Columns to include, in order. Defaults to all columns.
+
+        Returns:
+            Records with plain Python values; NaN is kept as NaN.
+        """
+        names = list(self.columns) if names is None else names
+        rows = zip(*(self.columns[name].tolist() for name in names), strict=True)
+        return [dict(zip(names, row, strict=True)) for row in rows]
+
+    def lists(self, names: tuple[str, ...]) -> dict[str, list]:
+        """Convert columns to lists for a columnar response.
+
+        Args:
+            names: Columns to include, in order; absent ones are all None.
+
+        Returns:
+            Plain Python values by column name, with NaN and NaT as None.
+        """
+        absent = np.full(len(self), None, dtype=object)
+        arrays = {name: self.columns.get(name, absent) for name in names}
+        return {name: np.where(pd.isna(array), None, array).tolist() for name, array in arrays.items()}
+
+
+class _OptionChain(NamedTuple):
+    """One expiration's chain in the picklable form stored in the cache."""
+
+    calls: _ContractColumns
+    puts: _ContractColumns
+    underlying: dict
+
+    def stacked(self) -> _ContractColumns:
+        """Return calls followed by puts, with an ``is_call`` column.
+
+        Columns present on one side only are padded with NaN (numeric) or
+        None on the other.
+        """
+        names = list(dict.fromkeys([*self.calls.columns, *self.puts.columns]))
+        columns = {}
+        for name in names:
+            parts = []
+            for side in (self.calls, self.puts):
+                if name in side.columns:
+                    parts.append(side[name])
+                elif name in _NUMERIC_COLUMNS:
+                    parts.append(np.full(len(side), np.nan))
+                else:
+                    parts.append(np.full(len(side), None, dtype=object))
+            columns[name] = np.concatenate(parts)
+        columns["is_call"] = np.concatenate(
+            [np.ones(len(self.calls), dtype=bool), np.zeros(len(self.puts), dtype=bool)]
+        )
+        return _ContractColumns(columns)
+
 
 class OptionsRepository(Protocol):
     """Structural type for options data access.
@@ -36,16 +230,28 @@ class OptionsRepository(Protocol):
     ) -> list[OptionExpirationDate]: ...
 
     def get_option_chain(
-        self, ticker: str, expiration: date | None = None, session: Session | None = None
+        self,
+        ticker: str,
+        expiration: date | None = None,
+        layout: ContractLayout = "rows",
+        session: Session | None = None,
     ) -> OptionContractChain: ...
 
     def get_call_options(
-        self, ticker: str, expiration: date | None = None, session: Session | None = None
-    ) -> list[CallOption] | None: ...
+        self,
+        ticker: str,
+        expiration: date | None = None,
+        layout: ContractLayout = "rows",
+        session: Session | None = None,
+    ) -> list[CallOption] | OptionContractColumns | None: ...
 
     def get_put_options(
-        self, ticker: str, expiration: date | None = None, session: Session | None = None
-    ) -> list[PutOption] | None: ...
+        self,
+        ticker: str,
+        expiration: date | None = None,
+        layout: ContractLayout = "rows",
+        session: Session | None = None,
+    ) -> list[PutOption] | OptionContractColumns | None: ...
 
     def get_options_volume_analysis(
         self, ticker: str, expiration_date: str | None = None, session: Session | None = None
@@ -63,7 +269,41 @@ class OptionsRepository(Protocol):
         self, ticker: str, expiration_date: str | None = None, session: Session | None = None
     ) -> OptionsSkew: ...
 
+    def get_option_greeks(
+        self,
+        ticker: str,
+        expiration: date | None = None,
+        risk_free_rate: float = black_scholes.DEFAULT_RISK_FREE_RATE,
+        dividend_yield: float = 0.0,
+        layout: ContractLayout = "rows",
+        session: Session | None = None,
+    ) -> OptionGreeksChain: ...
 
+    def get_volatility_surface(
+        self,
+        ticker: str,
+        max_expirations: int = 6,
+        moneyness_range: float = 0.2,
+        session: Session | None = None,
+    ) -> VolatilitySurface: ...
+
+    def get_options_positioning(
+        self,
+        ticker: str,
+        expiration_date: str | None = None,
+        top_n: int = 5,
+        session: Session | None = None,
+    ) -> OptionsPositioning: ...
+
+    def get_options_scan(
+        self,
+        tickers: list[str],
+        sort_by: OptionsScanMetric = "put_call_ratio_oi",
+        session: Session | None = None,
+    ) -> OptionsScan: ...
+
+
+@traced_repository
 class YFinanceOptionsRepository:
     """YFinance-based implementation of options repository."""
 
@@ -77,81 +317,110 @@ class YFinanceOptionsRepository:
         Returns:
             List of option expiration dates.
         """
-        ticker_obj = yf.Ticker(ticker, session=session)
-        options = ticker_obj.options
-        return [OptionExpirationDate(date=dt) for dt in options]
+        stock = yf.Ticker(ticker, session=session)
+        return [OptionExpirationDate(date=dt) for dt in self._get_expirations(stock, ticker)]
 
     def get_option_chain(
-        self, ticker: str, expiration: date | None = None, session: Session | None = None
+        self,
+        ticker: str,
+        expiration: date | None = None,
+        layout: ContractLayout = "rows",
+        session: Session | None = None,
     ) -> OptionContractChain:
         """Retrieve the full option contract chain for a ticker and expiration date.
 
         Args:
             ticker: Stock ticker symbol.
             expiration: Option expiration date. Uses nearest if None.
+            layout: ``rows`` for ``calls`` and ``puts`` with one model per
+                contract, or ``columns`` for ``call_columns`` and
+                ``put_columns`` with one array per field.
             session: Optional HTTP session for request handling.
 
         Returns:
             Option contract chain containing calls and puts.
+
+        Raises:
+            DataUnavailableError: If the ticker has no listed options.
         """
-        ticker_obj = yf.Ticker(ticker, session=session)
-        expiration_str = str(expiration) if expiration else None
-        option_chain = ticker_obj.option_chain(date=expiration_str)
+        option_chain = self._get_option_chain(ticker, expiration, session)
+        if option_chain is None:
+            raise DataUnavailableError(f"No options data available for {ticker}.")
         calls = option_chain.calls
         puts = option_chain.puts
+        underlying = OptionUnderlying(**option_chain.underlying)
+        if layout == "columns":
+            return OptionContractChain(
+                call_columns=None if calls.empty else self._contract_columns(calls),
+                put_columns=None if puts.empty else self._contract_columns(puts),
+                underlying=underlying,
+            )
 
         call_objs = None
         if not calls.empty:
-            call_objs = [CallOption(**row.to_dict()) for _, row in calls.iterrows()]
+            call_objs = [CallOption(**record) for record in calls.records()]
 
         put_objs = None
         if not puts.empty:
-            put_objs = [PutOption(**row.to_dict()) for _, row in puts.iterrows()]
+            put_objs = [PutOption(**record) for record in puts.records()]
 
-        underlying = OptionUnderlying(**getattr(option_chain, "underlying", {}))
         return OptionContractChain(calls=call_objs, puts=put_objs, underlying=underlying)
 
     def get_call_options(
-        self, ticker: str, expiration: date | None = None, session: Session | None = None
-    ) -> list[CallOption] | None:
+        self,
+        ticker: str,
+        expiration: date | None = None,
+        layout: ContractLayout = "rows",
+        session: Session | None = None,
+    ) -> list[CallOption] | OptionContractColumns | None:
         """Retrieve all call options for a ticker and expiration date.
 
         Args:
             ticker: Stock ticker symbol.
             expiration: Option expiration date. Uses nearest if None.
+            layout: ``rows`` for one model per contract, or ``columns`` for
+                one array per field.
             session: Optional HTTP session for request handling.
 
         Returns:
-            List of call options or None if unavailable.
+            Call options in the requested layout, or None if unavailable.
         """
-        ticker_obj = yf.Ticker(ticker, session=session)
-        expiration_str = str(expiration) if expiration else None
-        option_chain = ticker_obj.option_chain(expiration_str)
-        calls = option_chain.calls
-        if calls.empty:
+        option_chain = self._get_option_chain(ticker, expiration, session)
+        if option_chain is None or option_chain.calls.empty:
             return None
-        return [CallOption(**row.to_dict()) for _, row in calls.iterrows()]
+        if layout == "columns":
+            return self._contract_columns(option_chain.calls)
+        return [CallOption(**record) for record in option_chain.calls.records()]
 
     def get_put_options(
-        self, ticker: str, expiration: date | None = None, session: Session | None = None
-    ) -> list[PutOption] | None:
+        self,
+        ticker: str,
+        expiration: date | None = None,
+        layout: ContractLayout = "rows",
+        session: Session | None = None,
+    ) -> list[PutOption] | OptionContractColumns | None:
         """Retrieve all put options for a ticker and expiration date.
 
         Args:
             ticker: Stock ticker symbol.
             expiration: Option expiration date. Uses nearest if None.
+            layout: ``rows`` for one model per contract, or ``columns`` for
+                one array per field.
             session: Optional HTTP session for request handling.
 
         Returns:
-            List of put options or None if unavailable.
+            Put options in the requested layout, or None if unavailable.
         """
-        ticker_obj = yf.Ticker(ticker, session=session)
-        expiration_str = str(expiration) if expiration else None
-        option_chain = ticker_obj.option_chain(expiration_str)
-        puts = option_chain.puts
-        if puts.empty:
+        option_chain = self._get_option_chain(ticker, expiration, session)
+        if option_chain is None or option_chain.puts.empty:
             return None
-        return [PutOption(**row.to_dict()) for _, row in puts.iterrows()]
+        if layout == "columns":
+            return self._contract_columns(option_chain.puts)
+        return [PutOption(**record) for record in option_chain.puts.records()]
+
+    def _contract_columns(self, contracts: _ContractColumns) -> OptionContractColumns:
+        """Build the columnar response for one side of a chain."""
+        return OptionContractColumns(**contracts.lists(_CONTRACT_FIELDS))
 
     def get_options_volume_analysis(
         self, ticker: str, expiration_date: str | None = None, session: Session | None = None
@@ -161,9 +430,13 @@ class YFinanceOptionsRepository:
         Returns total call/put volume, open interest, and put/call ratios.
         """
         stock = yf.Ticker(ticker, session=session)
-        option_chain = self._get_option_chain_for_expiration(stock, expiration_date)
+        option_chain = self._get_option_chain_for_expiration(stock, ticker, expiration_date)
         if option_chain is None:
             raise DataUnavailableError(f"No options data available for {ticker}.")
+        return self._volume_analysis(option_chain)
+
+    def _volume_analysis(self, option_chain: _OptionChain) -> OptionsVolumeAnalysis:
+        """Sum volume and open interest per side of a chain."""
         calls = option_chain.calls
         puts = option_chain.puts
         return OptionsVolumeAnalysis(
@@ -190,23 +463,23 @@ class YFinanceOptionsRepository:
     ) -> OptionsByMoneyness:
         """Get options filtered by moneyness for a ticker and expiration date."""
         stock = yf.Ticker(ticker, session=session)
-        current_price = stock.info.get("currentPrice")
-        if not current_price:
-            raise DataUnavailableError(f"Could not get current stock price for {ticker}.")
-        option_chain = self._get_option_chain_for_expiration(stock, expiration_date)
+        option_chain = self._get_option_chain_for_expiration(stock, ticker, expiration_date)
         if option_chain is None:
             raise DataUnavailableError(f"No options data available for {ticker}.")
+        current_price = self._get_underlying_price(stock, option_chain)
+        if not current_price:
+            raise DataUnavailableError(f"Could not get current stock price for {ticker}.")
         price_min = current_price * (1 - moneyness_range)
         price_max = current_price * (1 + moneyness_range)
         calls = option_chain.calls
         puts = option_chain.puts
-        filtered_calls = calls[(calls["strike"] >= price_min) & (calls["strike"] <= price_max)]
-        filtered_puts = puts[(puts["strike"] >= price_min) & (puts["strike"] <= price_max)]
+        filtered_calls = calls.select((calls.values("strike") >= price_min) & (calls.values("strike") <= price_max))
+        filtered_puts = puts.select((puts.values("strike") >= price_min) & (puts.values("strike") <= price_max))
         return OptionsByMoneyness(
             current_price=current_price,
             price_range=PriceRange(min=price_min, max=price_max),
-            calls=filtered_calls.to_dict("records"),
-            puts=filtered_puts.to_dict("records"),
+            calls=filtered_calls.records(),
+            puts=filtered_puts.records(),
         )
 
     def get_options_skew(
@@ -214,7 +487,7 @@ class YFinanceOptionsRepository:
     ) -> OptionsSkew:
         """Get options skew (implied volatility by strike) for a ticker and expiration date."""
         stock = yf.Ticker(ticker, session=session)
-        option_chain = self._get_option_chain_for_expiration(stock, expiration_date)
+        option_chain = self._get_option_chain_for_expiration(stock, ticker, expiration_date)
 
         if option_chain is None or (option_chain.calls.empty and option_chain.puts.empty):
             raise DataUnavailableError(f"No options data available for {ticker} on {expiration_date}.")
@@ -238,11 +511,495 @@ class YFinanceOptionsRepository:
             warning=warning,
         )
 
-    def _extract_skew(self, contracts) -> list[dict] | None:
+    def get_option_greeks(
+        self,
+        ticker: str,
+        expiration: date | None = None,
+        risk_free_rate: float = black_scholes.DEFAULT_RISK_FREE_RATE,
+        dividend_yield: float = 0.0,
+        layout: ContractLayout = "rows",
+        session: Session | None = None,
+    ) -> OptionGreeksChain:
+        """Compute Black-Scholes Greeks for every contract of one expiration.
+
+        Implied volatility is re-solved from each contract's market price, so
+        the Greeks are consistent with the rate and dividend yield supplied;
+        Yahoo's quoted volatility is used for contracts whose price has no
+        solution (stale quotes below intrinsic value, for example).
+
+        Args:
+            ticker: Stock ticker symbol.
+            expiration: Option expiration date. Uses nearest if None.
+            risk_free_rate: Annual continuously compounded risk-free rate.
+            dividend_yield: Annual continuous dividend yield.
+            layout: ``rows`` for ``contracts`` with one model per contract,
+                or ``columns`` for ``columns`` with one array per field.
+            session: Optional HTTP session for request handling.
+
+        Returns:
+            Greeks for calls and puts of the expiration.
+
+        Raises:
+            DataUnavailableError: If there is no chain or underlying price.
+        """
+        expires, spot, years, contracts = self._get_priced_contracts(
+            ticker, str(expiration) if expiration else None, risk_free_rate, dividend_yield, session
+        )
+        fields = {
+            "contract_symbol": contracts.columns.get("contractSymbol", np.full(len(contracts), "", dtype=object)),
+            "option_type": np.where(contracts["is_call"], "call", "put").astype(object),
+            "strike": contracts.values("strike"),
+            "market_price": contracts["market_price"],
+            "quoted_implied_volatility": contracts.values("impliedVolatility"),
+            "implied_volatility": contracts["implied_volatility"],
+            **{name: contracts[name] for name in _GREEK_COLUMNS},
+            "volume": contracts.values("volume"),
+            "open_interest": contracts.values("openInterest"),
+        }
+        greeks = _ContractColumns(fields)
+        if layout == "columns":
+            return OptionGreeksChain(
+                expiration=expires,
+                underlying_price=spot,
+                time_to_expiry=years,
+                risk_free_rate=risk_free_rate,
+                dividend_yield=dividend_yield,
+                columns=OptionGreeksColumns(**greeks.lists(tuple(fields))),
+            )
+        # NaN marks "no value" in the arrays; the schema reports it as None.
+        records = _ContractColumns(
+            {
+                name: np.where(np.isnan(array), None, array) if array.dtype.kind == "f" else array
+                for name, array in fields.items()
+            }
+        ).records()
+        return OptionGreeksChain(
+            expiration=expires,
+            underlying_price=spot,
+            time_to_expiry=years,
+            risk_free_rate=risk_free_rate,
+            dividend_yield=dividend_yield,
+            contracts=[OptionGreeks(**record) for record in records],
+        )
+
+    def get_volatility_surface(
+        self,
+        ticker: str,
+        max_expirations: int = 6,
+        moneyness_range: float = 0.2,
+        session: Session | None = None,
+    ) -> VolatilitySurface:
+        """Build an implied volatility grid of strike by expiration.
+
+        The nearest ``max_expirations`` chains are downloaded concurrently
+        through one ``yf.Ticker``. Each cell holds the volatility re-solved
+        from the out-of-the-money contract at that strike (puts below the
+        underlying price, calls at or above it), the side quoted most
+        actively; Yahoo's quoted volatility fills in where there is no
+        solution.
+
+        Args:
+            ticker: Stock ticker symbol.
+            max_expirations: Number of nearest expirations to include.
+            moneyness_range: Strikes within this fraction of the underlying
+                price are included, e.g. 0.2 keeps 80%-120%.
+            session: Optional HTTP session for request handling.
+
+        Returns:
+            The surface, with rows per expiration and columns per strike.
+
+        Raises:
+            DataUnavailableError: If there are no chains or underlying price.
+        """
+        stock = yf.Ticker(ticker, session=session)
+        expirations = self._get_expirations(stock, ticker)[:max_expirations]
+        chains = gather(
+            {
+                expiration: (
+                    lambda expiration=expiration: self._get_option_chain_for_expiration(stock, ticker, expiration)
+                )
+                for expiration in expirations
+            },
+            max_workers=_MAX_CONCURRENT_CHAINS,
+        )
+        chains = {
+            expiration: chain
+            for expiration, chain in chains.items()
+            if chain is not None and not (chain.calls.empty and chain.puts.empty)
+        }
+        if not chains:
+            raise DataUnavailableError(f"No options data available for {ticker}.")
+        spot = self._get_underlying_price(stock, next(iter(chains.values())))
+        if not spot:
+            raise DataUnavailableError(f"Could not get current stock price for {ticker}.")
+
+        low, high = spot * (1 - moneyness_range), spot * (1 + moneyness_range)
+        rows: dict[str, tuple[float, np.ndarray, np.ndarray]] = {}
+        for expiration, chain in chains.items():
+            contracts = chain.stacked()
+            strike = contracts.values("strike")
+            out_of_the_money = np.where(
+                contracts["is_call"], (strike >= spot) & (strike <= high), (strike < spot) & (strike >= low)
+            )
+            contracts = contracts.select(out_of_the_money)
+            if contracts.empty:
+                continue
+            years = self._years_to_expiry(date.fromisoformat(expiration))
+            _, solved = self._solve_implied_volatility(
+                contracts, spot, years, black_scholes.DEFAULT_RISK_FREE_RATE, 0.0
+            )
+            quoted = contracts.values("impliedVolatility")
+            rows[expiration] = (
+                years,
+                contracts.values("strike"),
+                np.where(np.isnan(solved) & (quoted > 0), quoted, solved),
+            )
+        if not rows:
+            raise DataUnavailableError(f"No strikes within {moneyness_range:.0%} of the price for {ticker}.")
+
+        strikes = np.unique(np.concatenate([strike for _, strike, _ in rows.values()]))
+        grid = np.full((len(rows), len(strikes)), np.nan)
+        for row, (_, strike, volatility) in enumerate(rows.values()):
+            grid[row, np.searchsorted(strikes, strike)] = volatility
+        return VolatilitySurface(
+            underlying_price=spot,
+            expirations=[date.fromisoformat(expiration) for expiration in rows],
+            time_to_expiry=[years for years, _, _ in rows.values()],
+            strikes=strikes.tolist(),
+            moneyness=(strikes / spot).tolist(),
+            implied_volatility=np.where(np.isnan(grid), None, grid).tolist(),
+        )
+
+    def get_options_positioning(
+        self,
+        ticker: str,
+        expiration_date: str | None = None,
+        top_n: int = 5,
+        session: Session | None = None,
+    ) -> OptionsPositioning:
+        """Summarise open-interest positioning for one expiration.
+
+        Computes max pain, dealer gamma exposure by strike and the largest
+        open-interest strikes over the whole chain in a few array
+        operations, so callers need not page through every contract.
+
+        Gamma exposure follows the common convention that dealers are long
+        the calls and short the puts customers trade: call gamma counts
+        positive, put gamma negative. Each strike's value is the dollar
+        change in dealer delta for a 1% move in the underlying.
+
+        Args:
+            ticker: Stock ticker symbol.
+            expiration_date: Option expiration date. Uses nearest if None.
+            top_n: Number of strikes to report per ranking.
+            session: Optional HTTP session for request handling.
+
+        Returns:
+            Max pain, gamma exposure and open-interest walls.
+
+        Raises:
+            DataUnavailableError: If there is no chain or underlying price.
+        """
+        expires, spot, _, contracts = self._get_priced_contracts(
+            ticker, expiration_date, black_scholes.DEFAULT_RISK_FREE_RATE, 0.0, session
+        )
+        contracts = contracts.select(~np.isnan(contracts.values("strike")))
+        is_call = contracts["is_call"]
+        open_interest = np.nan_to_num(contracts.values("openInterest"))
+        gamma = np.nan_to_num(contracts["gamma"])
+        strikes, strike_index = np.unique(contracts.values("strike"), return_inverse=True)
+
+        def by_strike(weights: np.ndarray) -> np.ndarray:
+            return np.bincount(strike_index, weights=weights, minlength=len(strikes))
+
+        call_oi = by_strike(np.where(is_call, open_interest, 0.0))
+        put_oi = by_strike(np.where(is_call, 0.0, open_interest))
+        sign = np.where(is_call, 1.0, -1.0)
+        gex = by_strike(sign * gamma * open_interest * _CONTRACT_MULTIPLIER * spot * spot * 0.01)
+
+        # Payout to holders if the underlying settles at each strike: rows
+        # are settlement prices, columns the contracts' strikes.
+        settle = strikes[:, None]
+        payout = (np.maximum(settle - strikes, 0.0) * call_oi).sum(axis=1) + (
+            np.maximum(strikes - settle, 0.0) * put_oi
+        ).sum(axis=1)
+        has_open_interest = bool(call_oi.sum() + put_oi.sum())
+        max_pain = float(strikes[np.argmin(payout)]) if has_open_interest else None
+
+        largest_gex = np.sort(np.argsort(-np.abs(gex), kind="stable")[:top_n])
+        return OptionsPositioning(
+            expiration=expires,
+            underlying_price=spot,
+            max_pain=max_pain,
+            total_call_open_interest=float(call_oi.sum()),
+            total_put_open_interest=float(put_oi.sum()),
+            net_gamma_exposure=float(gex.sum()),
+            gamma_exposure_by_strike=[
+                StrikeGammaExposure(strike=strikes[index], gamma_exposure=gex[index]) for index in largest_gex
+            ],
+            call_walls=self._open_interest_walls(strikes, call_oi, top_n),
+            put_walls=self._open_interest_walls(strikes, put_oi, top_n),
+        )
+
+    def get_options_scan(
+        self,
+        tickers: list[str],
+        sort_by: OptionsScanMetric = "put_call_ratio_oi",
+        session: Session | None = None,
+    ) -> OptionsScan:
+        """Rank tickers by a metric of their nearest-expiration chain.
+
+        Chains are downloaded concurrently, at most
+        ``_MAX_CONCURRENT_CHAINS`` at a time, and go through the shared
+        cache, so a follow-up call on one of the tickers is free.
+
+        Args:
+            tickers: Ticker symbols to scan; duplicates are ignored.
+            sort_by: Metric to rank by, highest first.
+            session: Optional HTTP session for request handling.
+
+        Returns:
+            One row per ticker with options, and the tickers without.
+        """
+        symbols = list(dict.fromkeys(ticker.upper() for ticker in tickers))
+        scanned = gather(
+            {symbol: (lambda symbol=symbol: self._scan_ticker(symbol, session)) for symbol in symbols},
+            max_workers=_MAX_CONCURRENT_CHAINS,
+        )
+        rows = [row for row in scanned.values() if row is not None]
+        # Stable sort: ties and tickers missing the metric keep input order.
+        rows.sort(key=lambda row: (getattr(row, sort_by) is None, -(getattr(row, sort_by) or 0.0)))
+        return OptionsScan(
+            sort_by=sort_by,
+            rows=rows,
+            unavailable=[symbol for symbol, row in scanned.items() if row is None],
+        )
+
+    def _scan_ticker(self, ticker: str, session: Session | None) -> OptionsScanRow | None:
+        """Compute the scan metrics of one ticker's nearest expiration.
+
+        Args:
+            ticker: Ticker symbol.
+            session: Optional HTTP session for request handling.
+
+        Returns:
+            The ticker's row, or None when it has no usable chain.
+        """
+        stock = yf.Ticker(ticker, session=session)
+        try:
+            expiration = next(iter(self._get_expirations(stock, ticker)), None)
+            if expiration is None:
+                return None
+            option_chain = self._get_option_chain_for_expiration(stock, ticker, expiration)
+            if option_chain is None or (option_chain.calls.empty and option_chain.puts.empty):
+                return None
+            # The scan only needs a spot for ATM volatility; a quote summary
+            # download per ticker is not worth it.
+            spot = self._get_quoted_price(stock, option_chain)
+            return OptionsScanRow(
+                ticker=ticker,
+                expiration=date.fromisoformat(expiration),
+                underlying_price=spot,
+                atm_implied_volatility=self._atm_implied_volatility(option_chain.stacked(), spot),
+                **self._volume_analysis(option_chain).model_dump(),
+            )
+        except _SCAN_ERRORS:
+            # One failing ticker is reported as unavailable, not a failed scan.
+            logger.debug("Options scan of %s failed.", ticker, exc_info=True)
+            return None
+
+    def _atm_implied_volatility(self, contracts: _ContractColumns, spot: float | None) -> float | None:
+        """Return the mean quoted implied volatility at the strike nearest ``spot``.
+
+        Args:
+            contracts: Calls and puts of one expiration.
+            spot: Underlying price.
+
+        Returns:
+            The volatility, or None without a price or quoted volatility.
+        """
+        volatility = contracts.values("impliedVolatility")
+        strike = contracts.values("strike")
+        quoted = (volatility > 0) & ~np.isnan(strike)
+        if not spot or not quoted.any():
+            return None
+        distance = np.abs(strike[quoted] - spot)
+        return float(volatility[quoted][distance == distance.min()].mean())
+
+    def _get_priced_contracts(
+        self,
+        ticker: str,
+        expiration_date: str | None,
+        risk_free_rate: float,
+        dividend_yield: float,
+        session: Session | None,
+    ) -> tuple[date, float, float, _ContractColumns]:
+        """Fetch one expiration's chain with implied volatility and Greeks added.
+
+        Args:
+            ticker: Stock ticker symbol.
+            expiration_date: Option expiration date. Uses nearest if None.
+            risk_free_rate: Annual risk-free rate.
+            dividend_yield: Annual continuous dividend yield.
+            session: Optional HTTP session for request handling.
+
+        Returns:
+            The expiration, underlying price, time to expiry in years, and
+            calls followed by puts as returned by :meth:`_add_greeks`.
+
+        Raises:
+            DataUnavailableError: If there is no chain or underlying price.
+        """
+        stock = yf.Ticker(ticker, session=session)
+        expiration_str = expiration_date or next(iter(self._get_expirations(stock, ticker)), None)
+        if expiration_str is None:
+            raise DataUnavailableError(f"No options data available for {ticker}.")
+        option_chain = self._get_option_chain_for_expiration(stock, ticker, expiration_str)
+        if option_chain is None or (option_chain.calls.empty and option_chain.puts.empty):
+            raise DataUnavailableError(f"No options data available for {ticker}.")
+        spot = self._get_underlying_price(stock, option_chain)
+        if not spot:
+            raise DataUnavailableError(f"Could not get current stock price for {ticker}.")
+
+        expires = date.fromisoformat(expiration_str)
+        years = self._years_to_expiry(expires)
+        return (
+            expires,
+            spot,
+            years,
+            self._add_greeks(option_chain.stacked(), spot, years, risk_free_rate, dividend_yield),
+        )
+
+    def _open_interest_walls(
+        self, strikes: np.ndarray, open_interest: np.ndarray, top_n: int
+    ) -> list[StrikeOpenInterest]:
+        """Return the ``top_n`` strikes with the most open interest, largest first."""
+        largest = np.argsort(-open_interest, kind="stable")[:top_n]
+        return [
+            StrikeOpenInterest(strike=strikes[index], open_interest=open_interest[index])
+            for index in largest
+            if open_interest[index] > 0
+        ]
+
+    def _add_greeks(
+        self, contracts: _ContractColumns, spot: float, years: float, risk_free_rate: float, dividend_yield: float
+    ) -> _ContractColumns:
+        """Add market price, re-solved implied volatility and Greeks columns.
+
+        Every column is computed for all contracts at once by the
+        vectorized routines in :mod:`openmarkets.core.black_scholes`.
+
+        Args:
+            contracts: Contracts with an ``is_call`` column.
+            spot: Underlying price.
+            years: Time to expiry in years.
+            risk_free_rate: Annual risk-free rate.
+            dividend_yield: Annual continuous dividend yield.
+
+        Returns:
+            ``contracts`` with ``market_price``, ``implied_volatility`` and
+            one column per Greek added.
+        """
+        market_price, solved_iv = self._solve_implied_volatility(contracts, spot, years, risk_free_rate, dividend_yield)
+        quoted_iv = contracts.values("impliedVolatility")
+        volatility = np.where(np.isnan(solved_iv) & (quoted_iv > 0), quoted_iv, solved_iv)
+        greeks = black_scholes.greeks(
+            contracts["is_call"], spot, contracts.values("strike"), years, risk_free_rate, volatility, dividend_yield
+        )
+        return contracts.with_columns(
+            market_price=market_price,
+            implied_volatility=solved_iv,
+            **{name: greeks[name] for name in _GREEK_COLUMNS},
+        )
+
+    def _solve_implied_volatility(
+        self, contracts: _ContractColumns, spot: float, years: float, risk_free_rate: float, dividend_yield: float
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Solve implied volatility from each contract's market price.
+
+        The market price is the bid/ask midpoint, or the last price when the
+        quote is one-sided.
+
+        Args:
+            contracts: Contracts with an ``is_call`` column.
+            spot: Underlying price.
+            years: Time to expiry in years.
+            risk_free_rate: Annual risk-free rate.
+            dividend_yield: Annual continuous dividend yield.
+
+        Returns:
+            Market prices and implied volatilities, NaN where there is none.
+        """
+        bid = contracts.values("bid")
+        ask = contracts.values("ask")
+        last = contracts.values("lastPrice")
+        two_sided = (bid > 0) & (ask >= bid)
+        market_price = np.where(two_sided, (bid + ask) / 2, np.where(last > 0, last, np.nan))
+        solved = black_scholes.implied_volatility(
+            market_price,
+            contracts["is_call"],
+            spot,
+            contracts.values("strike"),
+            years,
+            risk_free_rate,
+            dividend_yield,
+        )
+        return market_price, solved
+
+    def _get_underlying_price(self, stock, option_chain: _OptionChain | None = None) -> float | None:
+        """Resolve the underlying price from the cheapest source that has it.
+
+        The quote embedded in an already-downloaded chain costs nothing;
+        ``fast_info.last_price`` is one small chart request; the full
+        ``info`` quote summary is the last resort.
+
+        Args:
+            stock: yfinance Ticker of the underlying.
+            option_chain: A chain already fetched for the ticker, if any.
+
+        Returns:
+            The price, or None when no source has one.
+        """
+        price = self._get_quoted_price(stock, option_chain)
+        if price is not None:
+            return price
+        info = stock.info or {}
+        return info.get("currentPrice") or info.get("regularMarketPrice")
+
+    def _get_quoted_price(self, stock, option_chain: _OptionChain | None = None) -> float | None:
+        """Resolve the underlying price without downloading the quote summary.
+
+        Args:
+            stock: yfinance Ticker of the underlying.
+            option_chain: A chain already fetched for the ticker, if any.
+
+        Returns:
+            The chain's embedded quote or ``fast_info.last_price``, or None
+            when neither has one.
+        """
+        if option_chain is not None:
+            price = option_chain.underlying.get("regularMarketPrice")
+            if price:
+                return float(price)
+        try:
+            price = stock.fast_info.last_price
+        except Exception:
+            price = None
+        if price and np.isfinite(price):
+            return float(price)
+        return None
+
+    def _years_to_expiry(self, expiration: date) -> float:
+        """Return the time from now to the close of ``expiration`` in years."""
+        expires_at = datetime.combine(expiration, datetime.min.time(), tzinfo=timezone.utc) + _EXPIRY_TIME_UTC
+        seconds = (expires_at - datetime.now(timezone.utc)).total_seconds()
+        return max(seconds / (365 * 24 * 3600), _MIN_YEARS_TO_EXPIRY)
+
+    def _extract_skew(self, contracts: _ContractColumns) -> list[dict] | None:
         """Extract skew (implied volatility by strike) from an option side.
 
         Args:
-            contracts: DataFrame of either call or put contracts.
+            contracts: Either call or put contracts.
 
         Returns:
             A list of strike/impliedVolatility records, an empty list when
@@ -253,31 +1010,74 @@ class YFinanceOptionsRepository:
             return []
         if "strike" not in contracts.columns or "impliedVolatility" not in contracts.columns:
             return None
-        return contracts[["strike", "impliedVolatility"]].to_dict("records")
+        return contracts.records(["strike", "impliedVolatility"])
 
-    def _get_option_chain_for_expiration(self, stock, expiration_date: str | None):
-        """Helper to get option chain for a given expiration date or first available."""
-        if expiration_date:
-            try:
-                return stock.option_chain(expiration_date)
-            except Exception:
-                return None
-        expirations = getattr(stock, "options", None)
-        if not expirations:
+    def _get_option_chain(self, ticker: str, expiration: date | None, session: Session | None) -> _OptionChain | None:
+        """Return the chain for an expiration, or the nearest one when None.
+
+        Unlike :meth:`_get_option_chain_for_expiration`, upstream errors
+        propagate, so an unknown expiration is reported to the caller.
+
+        Args:
+            ticker: Stock ticker symbol.
+            expiration: Option expiration date. Uses nearest if None.
+            session: Optional HTTP session for request handling.
+
+        Returns:
+            The chain, or None when the ticker has no listed options.
+        """
+        stock = yf.Ticker(ticker, session=session)
+        expiration_str = str(expiration) if expiration else next(iter(self._get_expirations(stock, ticker)), None)
+        if expiration_str is None:
             return None
+        return self._get_cached_chain(stock, ticker, expiration_str)
+
+    def _get_option_chain_for_expiration(self, stock, ticker: str, expiration_date: str | None) -> _OptionChain | None:
+        """Helper to get option chain for a given expiration date or first available."""
         try:
-            return stock.option_chain(expirations[0])
+            if not expiration_date:
+                expiration_date = next(iter(self._get_expirations(stock, ticker)), None)
+                if expiration_date is None:
+                    return None
+            return self._get_cached_chain(stock, ticker, expiration_date)
         except Exception:
             return None
 
+    def _get_expirations(self, stock, ticker: str) -> tuple[str, ...]:
+        """Return the ticker's expiration dates, shared through the cache."""
+        cache = get_cache()
+        return cache.get_or_set(
+            ("options.expirations", ticker.upper()),
+            lambda: tuple(getattr(stock, "options", None) or ()),
+            ttl=cache.default_ttl * _EXPIRATIONS_TTL_FACTOR,
+        )
+
+    def _get_cached_chain(self, stock, ticker: str, expiration: str) -> _OptionChain:
+        """Return the chain for one expiration, shared through the cache.
+
+        The download is converted to :class:`_ContractColumns` once, here;
+        yfinance reports a ticker without options as ``None`` sides, which
+        become empty columns.
+        """
+
+        def download() -> _OptionChain:
+            chain = stock.option_chain(expiration)
+            return _OptionChain(
+                calls=_ContractColumns.from_frame(chain.calls),
+                puts=_ContractColumns.from_frame(chain.puts),
+                underlying=dict(getattr(chain, "underlying", None) or {}),
+            )
+
+        return get_cache().get_or_set(("options.chain", ticker.upper(), expiration), download)
+
     def _safe_ratio(self, numerator: float, denominator: float) -> float | None:
         """Safely compute ratio, returning None if denominator is zero."""
         if denominator == 0:
             return None
         return numerator / denominator
 
-    def _get_column_sum(self, dataframe, column_name: str) -> float:
+    def _get_column_sum(self, contracts: _ContractColumns, column_name: str) -> float:
         """Get sum of column if it exists, otherwise return 0."""
-        if column_name not in dataframe.columns:
+        if column_name not in contracts.columns:
             return 0
-        return dataframe[column_name].sum()
+        return float(np.nansum(contracts[column_name]))
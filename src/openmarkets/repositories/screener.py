@@ -14,6 +14,7 @@ from typing import Literal, get_args
 import yfinance as yf
 from curl_cffi.requests import Session
 
+from openmarkets.core.tracing import traced_repository
 from openmarkets.schemas.screener import ScreenerResult
 
 #: Named screens yfinance ships as yf.PREDEFINED_SCREENER_QUERIES.
@@ -65,6 +66,7 @@ def _assert_known_screens_are_current() -> None:
 _assert_known_screens_are_current()
 
 
+@traced_repository
 class YFinanceScreenerRepository:
     """Repository for screening equities, ETFs and mutual funds via yfinance."""
 
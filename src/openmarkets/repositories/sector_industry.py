@@ -20,6 +20,7 @@ import yfinance as yf
 from curl_cffi.requests import Session
 
 from openmarkets.core.exceptions import DataUnavailableError
+from openmarkets.core.tracing import traced_repository
 from openmarkets.schemas.sector_industry import (
     SECTOR_INDUSTRY_MAPPING,
     IndustryOverview,
@@ -36,6 +37,7 @@ from openmarkets.schemas.sector_industry import (
 DEFAULT_REGION = "US"
 
 
+@traced_repository
 class YFinanceSectorIndustryRepository:
     """Repository for accessing sector and industry data from yfinance."""
 
@@ -4,18 +4,24 @@ Fetches stock information, historical prices, dividends, splits, and other
 stock-level data from yfinance.
 """
 
-from typing import Protocol
+from typing import Protocol, get_args
 
 import pandas as pd
 import yfinance as yf
 from curl_cffi.requests import Session
+from pydantic import ValidationError
 
-from openmarkets.core.types import Interval, Period, ValuationFrequency
+from openmarkets.core.cache import get_cache
+from openmarkets.core.concurrency import gather
+from openmarkets.core.tracing import traced_repository
+from openmarkets.core.types import FundamentalMetric, Interval, Period, ValuationFrequency
 from openmarkets.schemas.stock import (
     CorporateActions,
     DividendSummary,
     ExtendedFinancialSummary,
     FinancialSummary,
+    FundamentalsComparison,
+    FundamentalsRow,
     NewsItem,
     PriceTarget,
     QuickTechnicalIndicators,
@@ -28,6 +34,12 @@ from openmarkets.schemas.stock import (
     ValuationMeasuresEntry,
 )
 
+# Quote summaries downloaded at once by one multi-ticker call.
+_MAX_CONCURRENT_INFO = 8
+
+#: Metrics compared when the caller names none: every supported metric.
+DEFAULT_FUNDAMENTAL_METRICS: tuple[FundamentalMetric, ...] = get_args(FundamentalMetric)
+
 
 class StockRepository(Protocol):
     """Structural type for stock data access.
@@ -81,7 +93,33 @@ class StockRepository(Protocol):
         session: Session | None = None,
     ) -> list[ValuationMeasuresEntry]: ...
 
+    def get_last_price(self, ticker: str, session: Session | None = None) -> float | None: ...
+
+    def compare_fundamentals(
+        self,
+        tickers: list[str],
+        metrics: list[FundamentalMetric] | None = None,
+        session: Session | None = None,
+    ) -> FundamentalsComparison: ...
+
+
+def _get_info(ticker: str, session: Session | None) -> dict:
+    """Return the quote summary for a ticker, shared through the cache.
+
+    Most stock tools are projections of the same ``Ticker.info`` payload, so
+    one download serves all of them while the entry is fresh.
+
+    Args:
+        ticker: Stock ticker symbol.
+        session: Optional HTTP session for request handling.
+
+    Returns:
+        The raw ``info`` mapping.
+    """
+    return get_cache().get_or_set(("stock.info", ticker.upper()), lambda: yf.Ticker(ticker, session=session).info)
+
 
+@traced_repository
 class YFinanceStockRepository:
     """Repository for accessing stock data from yfinance."""
 
@@ -109,8 +147,7 @@ class YFinanceStockRepository:
         Returns:
             Detailed stock information.
         """
-        ticker_obj = yf.Ticker(ticker, session=session)
-        info = ticker_obj.info
+        info = _get_info(ticker, session)
         return StockInfo(**info)
 
     def get_history(
@@ -188,8 +225,7 @@ class YFinanceStockRepository:
             "return_on_equity",
             "debt_to_equity",
         }
-        ticker_obj = yf.Ticker(ticker, session=session)
-        data = ticker_obj.info
+        data = _get_info(ticker, session)
         stock_info = StockInfo(**data)
         return FinancialSummary.model_validate(stock_info.model_dump(include=include_fields, by_alias=True))
 
@@ -212,8 +248,7 @@ class YFinanceStockRepository:
             "overall_risk",
             "share_holder_rights_risk",
         }
-        ticker_obj = yf.Ticker(ticker, session=session)
-        data = ticker_obj.info
+        data = _get_info(ticker, session)
         stock_info = StockInfo(**data)
         return RiskMetrics.model_validate(stock_info.model_dump(include=include_fields, by_alias=True))
 
@@ -238,8 +273,7 @@ class YFinanceStockRepository:
             "last_dividend_date",
             "last_dividend_value",
         }
-        ticker_obj = yf.Ticker(ticker, session=session)
-        data = ticker_obj.info
+        data = _get_info(ticker, session)
         stock_info = StockInfo(**data)
         return DividendSummary.model_validate(stock_info.model_dump(include=include_fields, by_alias=True))
 
@@ -262,8 +296,7 @@ class YFinanceStockRepository:
             "recommendation_key",
             "number_of_analyst_opinions",
         }
-        ticker_obj = yf.Ticker(ticker, session=session)
-        data = ticker_obj.info
+        data = _get_info(ticker, session)
         stock_info = StockInfo(**data)
         return PriceTarget.model_validate(stock_info.model_dump(include=include_fields, by_alias=True))
 
@@ -303,8 +336,7 @@ class YFinanceStockRepository:
             "return_on_equity",
             "debt_to_equity",
         }
-        ticker_obj = yf.Ticker(ticker, session=session)
-        data = ticker_obj.info
+        data = _get_info(ticker, session)
         stock_info = StockInfo(**data)
         return ExtendedFinancialSummary.model_validate(stock_info.model_dump(include=include_fields, by_alias=True))
 
@@ -329,8 +361,7 @@ class YFinanceStockRepository:
             "fifty_two_week_low",
             "fifty_two_week_high",
         }
-        ticker_obj = yf.Ticker(ticker, session=session)
-        data = ticker_obj.info
+        data = _get_info(ticker, session)
         stock_info = StockInfo(**data)
         return QuickTechnicalIndicators.model_validate(stock_info.model_dump(include=include_fields, by_alias=True))
 
@@ -409,3 +440,79 @@ class YFinanceStockRepository:
             return []
         records = measures.T.reset_index().rename(columns={"index": "period"}).to_dict("records")
         return [ValuationMeasuresEntry(**record) for record in records]
+
+    def get_last_price(self, ticker: str, session: Session | None = None) -> float | None:
+        """Retrieve the last traded price of a ticker.
+
+        Reads only ``fast_info.last_price``, not the whole fast-info
+        snapshot, so it suits repeated polling.
+
+        Args:
+            ticker: Ticker symbol of a stock, fund or cryptocurrency.
+            session: Optional HTTP session for request handling.
+
+        Returns:
+            The last price, or None when there is none.
+        """
+        price = yf.Ticker(ticker, session=session).fast_info.last_price
+        if price is None or price != price:  # NaN is the only float that is != itself
+            return None
+        return float(price)
+
+    def compare_fundamentals(
+        self,
+        tickers: list[str],
+        metrics: list[FundamentalMetric] | None = None,
+        session: Session | None = None,
+    ) -> FundamentalsComparison:
+        """Tabulate fundamentals of several tickers side by side.
+
+        Quote summaries are downloaded concurrently, at most
+        ``_MAX_CONCURRENT_INFO`` at a time, through the same cache entry as
+        the single-ticker tools, so tickers already looked at cost nothing.
+
+        Args:
+            tickers: Ticker symbols to compare; duplicates are ignored.
+            metrics: Metrics to tabulate, in column order. Defaults to
+                every supported metric.
+            session: Optional HTTP session for request handling.
+
+        Returns:
+            One row per ticker with a quote summary, values aligned with
+            ``metrics``, and the tickers without one.
+        """
+        symbols = list(dict.fromkeys(ticker.upper() for ticker in tickers))
+        columns = list(dict.fromkeys(metrics or DEFAULT_FUNDAMENTAL_METRICS))
+        infos = gather(
+            {symbol: (lambda symbol=symbol: self._try_get_info(symbol, session)) for symbol in symbols},
+            max_workers=_MAX_CONCURRENT_INFO,
+        )
+        rows = []
+        unavailable = []
+        for symbol, info in infos.items():
+            try:
+                values = StockInfo(**info).model_dump(include=set(columns)) if info else None
+            except ValidationError:
+                # A malformed quote summary costs only its own row.
+                values = None
+            if values is None:
+                unavailable.append(symbol)
+            else:
+                rows.append(FundamentalsRow(ticker=symbol, values=[values[column] for column in columns]))
+        return FundamentalsComparison(metrics=columns, rows=rows, unavailable=unavailable)
+
+    def _try_get_info(self, ticker: str, session: Session | None) -> dict | None:
+        """Return a ticker's quote summary, or None when it cannot be fetched.
+
+        Args:
+            ticker: Stock ticker symbol.
+            session: Optional HTTP session for request handling.
+
+        Returns:
+            The raw ``info`` mapping, or None for an unknown ticker or a
+            failed download, so one bad ticker cannot fail the comparison.
+        """
+        try:
+            return _get_info(ticker, session)
+        except Exception:
+            return None
@@ -7,6 +7,7 @@ including indicators, volatility metrics, and support/resistance levels.
 import yfinance as yf
 from curl_cffi.requests import Session
 
+from openmarkets.core.tracing import traced_repository
 from openmarkets.core.types import Period
 from openmarkets.schemas.technical_analysis import (
     SupportResistanceLevelsDict,
@@ -15,6 +16,7 @@ from openmarkets.schemas.technical_analysis import (
 )
 
 
+@traced_repository
 class YFinanceTechnicalAnalysisRepository:
     """YFinance-based implementation of technical analysis repository."""
 
@@ -64,3 +64,23 @@ class CryptoSentiment(BaseModel):
     )
     crypto_data: list[CryptoSentimentEntry] = Field(..., description="Per-asset supporting data.")
     note: str = Field(..., description="Caveat describing how the proxy is derived.")
+
+
+class CryptoSentimentPoint(BaseModel):
+    """Sentiment proxy on a single day."""
+
+    date: datetime = Field(..., description="Day of the closing prices.")
+    sentiment_proxy: str = Field(..., description="Sentiment label for the day, as for the current proxy.")
+    average_weekly_change: float = Field(..., description="Mean trailing 7-day percentage change across the basket.")
+    assets: int = Field(..., description="Number of assets with a value on this day.")
+
+
+class CryptoSentimentHistory(BaseModel):
+    """Daily series of the crypto sentiment proxy."""
+
+    tickers: list[str] = Field(..., description="Basket the proxy was computed over.")
+    period: str = Field(..., description="Period of daily closes downloaded.")
+    points: list[CryptoSentimentPoint] = Field(
+        ..., description="One point per day, oldest first; days before the first full week are omitted."
+    )
+    note: str = Field(..., description="Caveat describing how the proxy is derived.")
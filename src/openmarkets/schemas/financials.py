@@ -1,7 +1,9 @@
 from datetime import date, datetime
 
 import pandas as pd
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, SerializerFunctionWrapHandler, field_validator, model_serializer
+
+from openmarkets.core.types import FinancialRatio
 
 
 class FinancialCalendar(BaseModel):
@@ -40,7 +42,25 @@ class SecFilingRecord(BaseModel):
     max_age: int | None = Field(None, alias="maxAge", description="Maximum age of the filing data")
 
 
-class TTMCashFlowStatementEntry(BaseModel):
+class StatementEntry(BaseModel):
+    """Base of the per-period statement schemas.
+
+    Line items never set on an entry, because the statement did not report
+    them or they were not requested, are left out of its output instead of
+    being sent as null.
+    """
+
+    @model_serializer(mode="wrap")
+    def _omit_unset_line_items(self, handler: SerializerFunctionWrapHandler):
+        data = handler(self)
+        for name, field in type(self).model_fields.items():
+            if name not in self.model_fields_set:
+                data.pop(name, None)
+                data.pop(field.alias, None)
+        return data
+
+
+class TTMCashFlowStatementEntry(StatementEntry):
     """Schema for trailing twelve months (TTM) cash flow statement data."""
 
     date: datetime = Field(..., alias="index", description="Date of the TTM cash flow statement entry")
@@ -186,7 +206,7 @@ class TTMCashFlowStatementEntry(BaseModel):
     )
 
 
-class TTMIncomeStatementEntry(BaseModel):
+class TTMIncomeStatementEntry(StatementEntry):
     """Schema for ticker trailing twelve months (TTM) income statement data."""
 
     date: datetime = Field(..., alias="index", description="Date of the TTM income statement entry")
@@ -291,7 +311,7 @@ class TTMIncomeStatementEntry(BaseModel):
     operating_revenue: float | None = Field(None, alias="Operating Revenue", description="Operating revenue")
 
 
-class IncomeStatementEntry(BaseModel):
+class IncomeStatementEntry(StatementEntry):
     """Schema for a single income statement entry for a ticker."""
 
     date: datetime = Field(..., description="Date of the income statement entry", alias="index")
@@ -331,7 +351,7 @@ class IncomeStatementEntry(BaseModel):
     )
 
 
-class BalanceSheetEntry(BaseModel):
+class BalanceSheetEntry(StatementEntry):
     """Schema for a single balance sheet entry for a ticker."""
 
     date: datetime = Field(..., description="Date of the balance sheet entry", alias="index")
@@ -540,3 +560,68 @@ class FullFinancials(BaseModel):
     financial_calendar: FinancialCalendar = Field(..., description="Upcoming financial events.")
     sec_filings: list[SecFilingRecord] = Field(..., description="SEC filing records.")
     eps_history: list[EPSHistoryEntry] = Field(..., description="Historical earnings-per-share records.")
+
+
+class FinancialRatioPeriod(BaseModel):
+    """Financial ratios of one statement period."""
+
+    period: date = Field(..., description="Statement period end date.")
+    values: list[float | None] = Field(
+        ..., description="Value of each ratio, in ratio order; None where a required line item is missing."
+    )
+
+
+class FinancialRatios(BaseModel):
+    """A period x ratio table derived from a ticker's statements."""
+
+    ticker: str = Field(..., description="Ticker symbol.")
+    freq: str = Field(..., description="Statement frequency of the periods: 'annual' or 'quarterly'.")
+    ratios: list[FinancialRatio] = Field(..., description="Ratio of each column of every period's values.")
+    periods: list[FinancialRatioPeriod] = Field(..., description="One row per period, newest first.")
+
+
+class EarningsSurpriseRow(BaseModel):
+    """A ticker's recent EPS surprises and its next report."""
+
+    ticker: str = Field(..., description="Ticker symbol.")
+    next_report_date: datetime | None = Field(None, description="Next scheduled earnings report, if announced.")
+    last_report_date: datetime | None = Field(None, description="Most recent reported earnings date.")
+    last_surprise_pct: float | None = Field(None, description="EPS surprise of the most recent report, in percent.")
+    average_surprise_pct: float | None = Field(
+        None, description="Mean EPS surprise over the summarised quarters, in percent."
+    )
+    beats: int = Field(..., description="Summarised quarters with reported EPS above the estimate.")
+    misses: int = Field(..., description="Summarised quarters with reported EPS below the estimate.")
+    streak: int = Field(
+        ...,
+        description="Consecutive beats (positive) or misses (negative) up to the most recent report; 0 if it was in line.",
+    )
+
+
+class EarningsSurprises(BaseModel):
+    """EPS surprise summaries across tickers."""
+
+    quarters: int = Field(..., description="Most recent reported quarters summarised per ticker.")
+    rows: list[EarningsSurpriseRow] = Field(..., description="One row per ticker, in request order.")
+    unavailable: list[str] = Field(..., description="Tickers with no earnings dates or whose download failed.")
+
+
+class UpcomingEvent(BaseModel):
+    """A dated earnings or dividend event of a ticker."""
+
+    ticker: str = Field(..., description="Ticker symbol.")
+    event: str = Field(..., description="'earnings', 'ex_dividend' or 'dividend' (payment).")
+    event_date: date = Field(..., description="Event date; for an earnings window, its first day.")
+
+
+class CalendarEvents(BaseModel):
+    """Events of the indexed ticker universe within a date range."""
+
+    start: date = Field(..., description="First day of the range.")
+    end: date = Field(..., description="Last day of the range.")
+    events: list[UpcomingEvent] = Field(..., description="Events in date order.")
+    universe_size: int = Field(..., description="Number of tickers in the indexed universe.")
+    built_at: datetime | None = Field(
+        None, description="When the index was last rebuilt, UTC; None before the first build."
+    )
+    note: str | None = Field(None, description="Why the index holds no events, when it does not.")
@@ -305,3 +305,65 @@ class FundOverview(BaseModel):
     category_name: str | None = Field(None, description="Category name of the fund.", alias="categoryName")
     family: str | None = Field(None, description="Fund family.", alias="family")
     legal_type: str | None = Field(None, description="Legal type of the fund.", alias="legalType")
+
+
+class FundProfile(BaseModel):
+    """Every section of a fund's data, read from a single download."""
+
+    ticker: str = Field(..., description="Fund ticker symbol.")
+    overview: FundOverview | None = Field(None, description="Category, family and legal type.")
+    operations: FundOperations | None = Field(None, description="Expense ratio, turnover and net assets.")
+    asset_classes: FundAssetClassHolding | None = Field(None, description="Allocation across asset classes.")
+    sector_weighting: FundSectorWeighting | None = Field(None, description="Allocation across equity sectors.")
+    top_holdings: list[FundTopHolding] = Field(default_factory=list, description="Largest positions of the fund.")
+    equity_holdings: list[FundEquityHolding] = Field(
+        default_factory=list, description="Valuation and growth metrics of the equity holdings."
+    )
+    bond_holdings: list[FundBondHolding] = Field(
+        default_factory=list, description="Duration, maturity and credit quality of the bond holdings."
+    )
+
+
+class LookThroughHolding(BaseModel):
+    """A stock held through one or more funds of a portfolio."""
+
+    symbol: str = Field(..., description="Ticker symbol of the holding.")
+    name: str | None = Field(None, description="Name of the holding.")
+    weight: float = Field(..., description="Effective share of the portfolio held in this stock, as a fraction.")
+    funds: list[str] = Field(..., description="Funds whose top holdings include this stock.")
+
+
+class SectorExposure(BaseModel):
+    """Effective share of a portfolio in one sector."""
+
+    sector: str = Field(..., description="Sector name.")
+    weight: float = Field(..., description="Effective share of the portfolio in this sector, as a fraction.")
+
+
+class FundLookThrough(BaseModel):
+    """Effective stock and sector exposure of a portfolio of funds."""
+
+    weights: dict[str, float] = Field(..., description="Normalised portfolio weight of each fund.")
+    holdings: list[LookThroughHolding] = Field(..., description="Largest effective holdings, largest first.")
+    holdings_coverage: float = Field(
+        ...,
+        description="Share of the portfolio covered by the funds' disclosed top holdings; the rest is in "
+        "positions outside each fund's top holdings.",
+    )
+    sectors: list[SectorExposure] = Field(..., description="Effective sector exposure, largest first.")
+    unavailable: list[str] = Field(..., description="Funds with no holdings or sector data, or whose download failed.")
+
+
+class FundOverlap(BaseModel):
+    """Pairwise holdings overlap of several funds."""
+
+    tickers: list[str] = Field(..., description="Funds in matrix order, those with top holdings in request order.")
+    overlap: list[list[float]] = Field(
+        ...,
+        description="Symmetric matrix of the weight two funds hold in common, as a fraction: the sum over shared "
+        "stocks of the smaller of the two weights. The diagonal is each fund's weight in its top holdings.",
+    )
+    shared_holdings: list[list[int]] = Field(
+        ..., description="Symmetric matrix of the number of top holdings two funds share."
+    )
+    unavailable: list[str] = Field(..., description="Funds with no top holdings, or whose download failed.")
@@ -1,4 +1,5 @@
-from datetime import datetime
+from datetime import date, datetime
+from typing import Literal
 
 import pandas as pd
 from pydantic import BaseModel, Field, field_validator
@@ -241,11 +242,41 @@ class PutOption(BaseModel):
         return value
 
 
+class OptionContractColumns(BaseModel):
+    """Option contracts as parallel arrays, one element per contract.
+
+    The columnar counterpart of :class:`CallOption` and :class:`PutOption`;
+    missing values are None.
+    """
+
+    contract_symbol: list[str | None] = Field(..., description="Option contract symbols.", alias="contractSymbol")
+    last_trade_date: list[datetime | None] = Field(..., description="Last trade dates.", alias="lastTradeDate")
+    strike: list[float | None] = Field(..., description="Strike prices.", alias="strike")
+    last_price: list[float | None] = Field(..., description="Last traded prices.", alias="lastPrice")
+    bid: list[float | None] = Field(..., description="Bid prices.", alias="bid")
+    ask: list[float | None] = Field(..., description="Ask prices.", alias="ask")
+    change: list[float | None] = Field(..., description="Changes in price.", alias="change")
+    percent_change: list[float | None] = Field(..., description="Percent changes in price.", alias="percentChange")
+    volume: list[float | None] = Field(..., description="Trading volumes.", alias="volume")
+    open_interest: list[float | None] = Field(..., description="Open interest.", alias="openInterest")
+    implied_volatility: list[float | None] = Field(..., description="Implied volatilities.", alias="impliedVolatility")
+    in_the_money: list[bool | None] = Field(..., description="Whether each option is in the money.", alias="inTheMoney")
+    contract_size: list[str | None] = Field(..., description="Contract sizes.", alias="contractSize")
+    currency: list[str | None] = Field(..., description="Currencies of the contracts.", alias="currency")
+
+
 class OptionContractChain(BaseModel):
-    """Schema for the options chain data of a ticker."""
+    """Schema for the options chain data of a ticker.
+
+    Contracts are given either per contract in ``calls`` and ``puts`` or,
+    when columns are requested, as arrays in ``call_columns`` and
+    ``put_columns``.
+    """
 
     calls: list[CallOption] | None = Field(None, description="Call option contracts.", alias="calls")
     puts: list[PutOption] | None = Field(None, description="Put option contracts.", alias="puts")
+    call_columns: OptionContractColumns | None = Field(None, description="Call option contracts as columns.")
+    put_columns: OptionContractColumns | None = Field(None, description="Put option contracts as columns.")
     underlying: OptionUnderlying | None = Field(None, description="Underlying asset information.", alias="underlying")
 
 
@@ -297,3 +328,131 @@ class OptionsSkew(BaseModel):
     warning: str | None = Field(
         None, description="Set when one side was malformed and returned empty; the other side is still valid."
     )
+
+
+class OptionGreeks(BaseModel):
+    """Black-Scholes Greeks of a single contract."""
+
+    contract_symbol: str = Field(..., description="Option contract symbol.")
+    option_type: Literal["call", "put"] = Field(..., description="Contract type.")
+    strike: float = Field(..., description="Strike price.")
+    market_price: float | None = Field(
+        None,
+        description="Bid/ask midpoint, or last price when the quote is one-sided; the price the IV is solved from.",
+    )
+    quoted_implied_volatility: float | None = Field(None, description="Implied volatility as reported by Yahoo.")
+    implied_volatility: float | None = Field(
+        None, description="Implied volatility re-solved from the market price, None when it has no solution."
+    )
+    delta: float | None = Field(None, description="Price change per 1.00 move in the underlying.")
+    gamma: float | None = Field(None, description="Delta change per 1.00 move in the underlying.")
+    theta: float | None = Field(None, description="Price change per calendar day.")
+    vega: float | None = Field(None, description="Price change per 1 point of volatility.")
+    rho: float | None = Field(None, description="Price change per 1 percentage point of the risk-free rate.")
+    volume: float | None = Field(None, description="Trading volume.")
+    open_interest: float | None = Field(None, description="Open interest.")
+
+
+class OptionGreeksColumns(BaseModel):
+    """Greeks of many contracts as parallel arrays, one element per contract.
+
+    The columnar counterpart of :class:`OptionGreeks`.
+    """
+
+    contract_symbol: list[str] = Field(..., description="Option contract symbols.")
+    option_type: list[Literal["call", "put"]] = Field(..., description="Contract types.")
+    strike: list[float] = Field(..., description="Strike prices.")
+    market_price: list[float | None] = Field(..., description="Prices the implied volatilities are solved from.")
+    quoted_implied_volatility: list[float | None] = Field(..., description="Implied volatilities reported by Yahoo.")
+    implied_volatility: list[float | None] = Field(..., description="Implied volatilities re-solved from the prices.")
+    delta: list[float | None] = Field(..., description="Price changes per 1.00 move in the underlying.")
+    gamma: list[float | None] = Field(..., description="Delta changes per 1.00 move in the underlying.")
+    theta: list[float | None] = Field(..., description="Price changes per calendar day.")
+    vega: list[float | None] = Field(..., description="Price changes per 1 point of volatility.")
+    rho: list[float | None] = Field(..., description="Price changes per 1 percentage point of the risk-free rate.")
+    volume: list[float | None] = Field(..., description="Trading volumes.")
+    open_interest: list[float | None] = Field(..., description="Open interest.")
+
+
+class OptionGreeksChain(BaseModel):
+    """Greeks for every contract of one expiration.
+
+    Contracts are given either per contract in ``contracts`` or, when
+    columns are requested, as arrays in ``columns``.
+    """
+
+    expiration: date = Field(..., description="Expiration date of the contracts.")
+    underlying_price: float = Field(..., description="Underlying price the Greeks were computed at.")
+    time_to_expiry: float = Field(..., description="Time to expiry in years.")
+    risk_free_rate: float = Field(..., description="Annual risk-free rate used.")
+    dividend_yield: float = Field(..., description="Annual continuous dividend yield used.")
+    contracts: list[OptionGreeks] | None = Field(None, description="Calls followed by puts, by strike.")
+    columns: OptionGreeksColumns | None = Field(None, description="The same contracts in the same order, as columns.")
+
+
+class VolatilitySurface(BaseModel):
+    """Implied volatility on a grid of expiration by strike."""
+
+    underlying_price: float = Field(..., description="Underlying price strikes are normalised against.")
+    expirations: list[date] = Field(..., description="Grid rows, nearest expiration first.")
+    time_to_expiry: list[float] = Field(..., description="Time to expiry in years of each row.")
+    strikes: list[float] = Field(..., description="Grid columns, ascending.")
+    moneyness: list[float] = Field(..., description="Each column's strike divided by the underlying price.")
+    implied_volatility: list[list[float | None]] = Field(
+        ..., description="One row per expiration, one value per strike; None where the expiration lists no contract."
+    )
+
+
+class StrikeOpenInterest(BaseModel):
+    """Open interest at a single strike."""
+
+    strike: float = Field(..., description="Strike price.")
+    open_interest: float = Field(..., description="Open interest in contracts.")
+
+
+class StrikeGammaExposure(BaseModel):
+    """Net dealer gamma exposure at a single strike."""
+
+    strike: float = Field(..., description="Strike price.")
+    gamma_exposure: float = Field(..., description="Dealer delta change, in dollars, per 1% move in the underlying.")
+
+
+class OptionsPositioning(BaseModel):
+    """Open-interest positioning summary for one expiration."""
+
+    expiration: date = Field(..., description="Expiration date of the contracts.")
+    underlying_price: float = Field(..., description="Underlying price used.")
+    max_pain: float | None = Field(
+        None, description="Settlement strike minimising the total payout to option holders; None without open interest."
+    )
+    total_call_open_interest: float = Field(..., description="Summed call open interest.")
+    total_put_open_interest: float = Field(..., description="Summed put open interest.")
+    net_gamma_exposure: float = Field(
+        ..., description="Net dealer gamma exposure across all strikes; positive damps moves, negative amplifies them."
+    )
+    gamma_exposure_by_strike: list[StrikeGammaExposure] = Field(
+        ..., description="Strikes with the largest absolute gamma exposure, by strike."
+    )
+    call_walls: list[StrikeOpenInterest] = Field(..., description="Strikes with the most call open interest.")
+    put_walls: list[StrikeOpenInterest] = Field(..., description="Strikes with the most put open interest.")
+
+
+class OptionsScanRow(OptionsVolumeAnalysis):
+    """Nearest-expiration volume and open-interest metrics of one ticker."""
+
+    ticker: str = Field(..., description="Ticker symbol.")
+    expiration: date = Field(..., description="Expiration date the metrics were computed for.")
+    underlying_price: float | None = Field(None, description="Underlying price, None when unavailable.")
+    atm_implied_volatility: float | None = Field(
+        None, description="Mean quoted implied volatility of the strike nearest the underlying price."
+    )
+
+
+class OptionsScan(BaseModel):
+    """Tickers ranked by one options metric."""
+
+    sort_by: str = Field(..., description="Metric the rows are ranked by, highest first.")
+    rows: list[OptionsScanRow] = Field(
+        ..., description="One row per ticker with options, highest first; tickers without the metric last."
+    )
+    unavailable: list[str] = Field(..., description="Tickers with no listed options or whose chain failed to load.")
@@ -4,6 +4,7 @@ from typing import Any
 import pandas as pd
 from pydantic import BaseModel, Field, field_validator
 
+from openmarkets.core.types import FundamentalMetric
 from openmarkets.schemas.company import CompanyOfficer
 
 
@@ -629,3 +630,38 @@ class ValuationMeasuresEntry(BaseModel):
         if isinstance(value, float) and value != value:  # NaN is the only float that is != itself
             return None
         return value
+
+
+class LivePrice(BaseModel):
+    """Latest polled price of a watched symbol."""
+
+    symbol: str = Field(..., description="Ticker symbol.")
+    price: float | None = Field(None, description="Last traded price, None when none could be fetched.")
+    updated_at: datetime | None = Field(None, description="When the price last changed, UTC.")
+    uri: str = Field(..., description="Resource URI whose updated notifications announce a new price.")
+
+
+class LivePriceWatch(BaseModel):
+    """A registered price watch and the current prices of its symbols."""
+
+    prices: list[LivePrice] = Field(..., description="Current price of each watched symbol.")
+    expires_in: float = Field(..., description="Seconds until the watch lapses unless renewed.")
+    poll_interval: float = Field(..., description="Seconds between server-side price polls.")
+    note: str = Field(..., description="How to receive the streamed updates.")
+
+
+class FundamentalsRow(BaseModel):
+    """One ticker's fundamentals, aligned with the comparison's metrics."""
+
+    ticker: str = Field(..., description="Ticker symbol.")
+    values: list[float | None] = Field(
+        ..., description="Value of each compared metric, in metric order; None where not reported."
+    )
+
+
+class FundamentalsComparison(BaseModel):
+    """A ticker x metric matrix of fundamentals."""
+
+    metrics: list[FundamentalMetric] = Field(..., description="Metric of each column of every row's values.")
+    rows: list[FundamentalsRow] = Field(..., description="One row per ticker, in request order.")
+    unavailable: list[str] = Field(..., description="Tickers whose quote summary could not be fetched.")
@@ -1,7 +1,7 @@
 """Service layer for cryptocurrency operations.
 
 Provides business logic for retrieving cryptocurrency information, historical data,
-top cryptocurrencies by market cap, and sentiment indicators. Acts as an intermediary
+top cryptocurrencies by market cap, and current and historical sentiment indicators. Acts as an intermediary
 between the MCP tools layer and repository layer.
 """
 
@@ -10,7 +10,7 @@ from curl_cffi.requests import Session
 from openmarkets.core.http import get_session
 from openmarkets.core.types import Interval, Period, Ticker
 from openmarkets.repositories.crypto import YFinanceCryptoRepository
-from openmarkets.schemas.crypto import CryptoFastInfo, CryptoHistory, CryptoSentiment
+from openmarkets.schemas.crypto import CryptoFastInfo, CryptoHistory, CryptoSentiment, CryptoSentimentHistory
 from openmarkets.services.utils import ToolRegistrationMixin, tool
 
 
@@ -95,5 +95,21 @@ class CryptoService(ToolRegistrationMixin):
         """
         return self.repository.get_crypto_fear_greed_proxy(tickers, session=self.session)
 
+    @tool
+    def get_crypto_sentiment_history(
+        self, tickers: list[str] | None = None, period: Period = "3mo"
+    ) -> CryptoSentimentHistory:
+        """
+        Retrieve the crypto fear and greed proxy as a daily series over a period.
+
+        Args:
+            tickers (list[str] | None, optional): List of crypto tickers to include. If None, uses a default set.
+            period (str, optional): Time period of the series (e.g., '1mo', '3mo', '1y'). Defaults to '3mo'.
+
+        Returns:
+            CryptoSentimentHistory: Daily sentiment label and average trailing weekly change.
+        """
+        return self.repository.get_crypto_sentiment_history(tickers, period, session=self.session)
+
 
 crypto_service = CryptoService()
@@ -1,28 +1,43 @@
 """Service layer for financial statements and data operations.
 
 Provides business logic for retrieving balance sheets, income statements,
-cash flow statements, financial calendars, SEC filings, and EPS history.
+cash flow statements, derived financial ratios, financial calendars, SEC
+filings, EPS history, and the indexed calendar of a ticker universe.
 Acts as an intermediary between the MCP tools layer and repository layer.
 """
 
+from datetime import date, timedelta
+from typing import Annotated
+
 from curl_cffi.requests import Session
+from pydantic import Field
 
+from openmarkets.core.calendar_index import CalendarEventKind, CalendarIndex
 from openmarkets.core.concurrency import gather
 from openmarkets.core.http import get_session
-from openmarkets.core.types import Ticker
+from openmarkets.core.types import BalanceSheetFrequency, FinancialRatio, StatementFrequency, Ticker
 from openmarkets.repositories.financials import YFinanceFinancialsRepository
 from openmarkets.schemas.financials import (
     BalanceSheetEntry,
+    CalendarEvents,
+    EarningsSurprises,
     EPSHistoryEntry,
     FinancialCalendar,
+    FinancialRatios,
     FullFinancials,
     IncomeStatementEntry,
     SecFilingRecord,
     TTMCashFlowStatementEntry,
     TTMIncomeStatementEntry,
+    UpcomingEvent,
 )
 from openmarkets.services.utils import ToolRegistrationMixin, tool
 
+# Range get_calendar_events covers when no end is given, and the longest
+# range it accepts.
+_DEFAULT_CALENDAR_RANGE = timedelta(days=7)
+_MAX_CALENDAR_RANGE = timedelta(days=366)
+
 
 class FinancialsService(ToolRegistrationMixin):
     """
@@ -39,6 +54,7 @@ class FinancialsService(ToolRegistrationMixin):
         """
         self.repository = repository or YFinanceFinancialsRepository()
         self._session = session
+        self.calendar_index = CalendarIndex(self._calendar_dates)
 
     @property
     def session(self) -> Session:
@@ -50,56 +66,92 @@ class FinancialsService(ToolRegistrationMixin):
         return self._session if self._session is not None else get_session()
 
     @tool
-    def get_balance_sheet(self, ticker: Ticker) -> list[BalanceSheetEntry]:
+    def get_balance_sheet(
+        self,
+        ticker: Ticker,
+        freq: BalanceSheetFrequency = "annual",
+        periods: Annotated[int, Field(ge=1)] | None = None,
+        items: list[str] | None = None,
+    ) -> list[BalanceSheetEntry]:
         """
         Retrieve the balance sheet for a given ticker.
 
         Args:
             ticker (str): The symbol of the security.
+            freq (str, optional): 'annual' or 'quarterly'. Defaults to 'annual'.
+            periods (int | None, optional): Number of periods to return, newest first. Defaults to all.
+            items (list[str] | None, optional): Line items to return, by field name or alias (e.g.
+                "total_debt" or "TotalDebt"); the others are left empty. Defaults to every line item.
 
         Returns:
-            list[BalanceSheetEntry]: List of balance sheet entries.
+            list[BalanceSheetEntry]: Balance sheet entries, newest first.
         """
-        return self.repository.get_balance_sheet(ticker, session=self.session)
+        return self.repository.get_balance_sheet(ticker, freq, periods, items, session=self.session)
 
     @tool
-    def get_income_statement(self, ticker: Ticker) -> list[IncomeStatementEntry]:
+    def get_income_statement(
+        self,
+        ticker: Ticker,
+        freq: StatementFrequency = "annual",
+        periods: Annotated[int, Field(ge=1)] | None = None,
+        items: list[str] | None = None,
+    ) -> list[IncomeStatementEntry]:
         """
         Retrieve the income statement for a given ticker.
 
         Args:
             ticker (str): The symbol of the security.
+            freq (str, optional): 'annual', 'quarterly' or 'ttm' (trailing twelve months). Defaults to 'annual'.
+            periods (int | None, optional): Number of periods to return, newest first. Defaults to all.
+            items (list[str] | None, optional): Line items to return, by field name or alias (e.g.
+                "total_revenue" or "TotalRevenue"); the others are left empty. Defaults to every line item.
 
         Returns:
-            list[IncomeStatementEntry]: List of income statement entries.
+            list[IncomeStatementEntry]: Income statement entries, newest first.
         """
-        return self.repository.get_income_statement(ticker, session=self.session)
+        return self.repository.get_income_statement(ticker, freq, periods, items, session=self.session)
 
     @tool
-    def get_ttm_income_statement(self, ticker: Ticker) -> list[TTMIncomeStatementEntry]:
+    def get_ttm_income_statement(
+        self,
+        ticker: Ticker,
+        periods: Annotated[int, Field(ge=1)] | None = None,
+        items: list[str] | None = None,
+    ) -> list[TTMIncomeStatementEntry]:
         """
         Retrieve the trailing twelve months (TTM) income statement for a given ticker.
 
         Args:
             ticker (str): The symbol of the security.
+            periods (int | None, optional): Number of periods to return, newest first. Defaults to all.
+            items (list[str] | None, optional): Line items to return, by field name or alias (e.g.
+                "total_revenue" or "Total Revenue"); the others are left empty. Defaults to every line item.
 
         Returns:
-            list[TTMIncomeStatementEntry]: List of TTM income statement entries.
+            list[TTMIncomeStatementEntry]: TTM income statement entries, newest first.
         """
-        return self.repository.get_ttm_income_statement(ticker, session=self.session)
+        return self.repository.get_ttm_income_statement(ticker, periods, items, session=self.session)
 
     @tool
-    def get_ttm_cash_flow_statement(self, ticker: Ticker) -> list[TTMCashFlowStatementEntry]:
+    def get_ttm_cash_flow_statement(
+        self,
+        ticker: Ticker,
+        periods: Annotated[int, Field(ge=1)] | None = None,
+        items: list[str] | None = None,
+    ) -> list[TTMCashFlowStatementEntry]:
         """
         Retrieve the trailing twelve months (TTM) cash flow statement for a given ticker.
 
         Args:
             ticker (str): The symbol of the security.
+            periods (int | None, optional): Number of periods to return, newest first. Defaults to all.
+            items (list[str] | None, optional): Line items to return, by field name or alias (e.g.
+                "free_cash_flow" or "Free Cash Flow"); the others are left empty. Defaults to every line item.
 
         Returns:
-            list[TTMCashFlowStatementEntry]: List of TTM cash flow statement entries.
+            list[TTMCashFlowStatementEntry]: TTM cash flow statement entries, newest first.
         """
-        return self.repository.get_ttm_cash_flow_statement(ticker, session=self.session)
+        return self.repository.get_ttm_cash_flow_statement(ticker, periods, items, session=self.session)
 
     @tool
     def get_financial_calendar(self, ticker: Ticker) -> FinancialCalendar:
@@ -140,6 +192,93 @@ class FinancialsService(ToolRegistrationMixin):
         """
         return self.repository.get_eps_history(ticker, session=self.session)
 
+    @tool
+    def get_earnings_surprises(
+        self,
+        tickers: Annotated[list[str], Field(min_length=1, max_length=100)],
+        quarters: Annotated[int, Field(ge=1, le=8)] = 8,
+    ) -> EarningsSurprises:
+        """
+        Summarise recent EPS surprises and the next report date for a list of tickers in one call.
+
+        Use this to screen a universe for consistent beats or misses instead of calling get_eps_history per ticker.
+
+        Args:
+            tickers (list[str]): Ticker symbols, up to 100.
+            quarters (int, optional): Most recent reported quarters to summarise, up to 8. Defaults to 8.
+
+        Returns:
+            EarningsSurprises: Per ticker, the last and average surprise %, beats, misses, current streak and next
+                report date, plus the tickers without earnings data.
+        """
+        return self.repository.get_earnings_surprises(tickers, quarters, session=self.session)
+
+    @tool
+    def get_calendar_events(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        tickers: list[str] | None = None,
+        kinds: list[CalendarEventKind] | None = None,
+    ) -> CalendarEvents:
+        """
+        Retrieve upcoming earnings and dividend dates across the server's configured ticker universe in one call.
+
+        Answers questions such as "who reports this week among my holdings" from a background-refreshed index
+        instead of calling get_financial_calendar per ticker. Only tickers in the calendar_universe setting are
+        indexed.
+
+        Args:
+            start (date | None, optional): First day of the range. Defaults to today.
+            end (date | None, optional): Last day of the range, at most a year after start. Defaults to a week
+                after start.
+            tickers (list[str] | None, optional): Keep only these tickers. Defaults to the whole universe.
+            kinds (list[str] | None, optional): Keep only these events: 'earnings', 'ex_dividend' or 'dividend'.
+                Defaults to all.
+
+        Returns:
+            CalendarEvents: The events in the range in date order, and when the index was last rebuilt.
+        """
+        start = start or date.today()
+        end = end or start + _DEFAULT_CALENDAR_RANGE
+        if end < start:
+            raise ValueError("end must not be before start.")
+        if end - start > _MAX_CALENDAR_RANGE:
+            raise ValueError(f"The range may span at most {_MAX_CALENDAR_RANGE.days} days.")
+        index = self.calendar_index
+        note = None
+        if not index.tickers:
+            note = "No ticker universe is indexed; set calendar_universe to the tickers to track."
+        elif index.built_at is None:
+            note = "The index is still being built; try again shortly."
+        return CalendarEvents(
+            start=start,
+            end=end,
+            events=[
+                UpcomingEvent(ticker=event.ticker, event=event.kind, event_date=event.date)
+                for event in index.events_between(start, end, tickers, kinds)
+            ],
+            universe_size=len(index.tickers),
+            built_at=index.built_at,
+            note=note,
+        )
+
+    def _calendar_dates(self, ticker: str) -> dict[CalendarEventKind, list[date]]:
+        """Return a ticker's event dates by kind, for the calendar index.
+
+        Args:
+            ticker: Stock ticker symbol.
+
+        Returns:
+            Event dates by kind; an earnings window is indexed by its first day.
+        """
+        calendar = self.repository.get_financial_calendar(ticker, session=self.session)
+        return {
+            "earnings": (calendar.earnings_date or [])[:1],
+            "ex_dividend": [calendar.ex_dividend_date] if calendar.ex_dividend_date else [],
+            "dividend": [calendar.dividend_date] if calendar.dividend_date else [],
+        }
+
     @tool
     def get_full_financials(self, ticker: Ticker) -> FullFinancials:
         """
@@ -168,5 +307,33 @@ class FinancialsService(ToolRegistrationMixin):
             )
         )
 
+    @tool
+    def get_financial_ratios(
+        self,
+        ticker: Ticker,
+        ratios: list[FinancialRatio] | None = None,
+        freq: BalanceSheetFrequency = "annual",
+        periods: Annotated[int, Field(ge=1)] | None = None,
+    ) -> FinancialRatios:
+        """
+        Retrieve profitability, return, coverage, liquidity and quality ratios per annual or quarterly period.
+
+        Derived from the income statement, balance sheet and cash flow statement, so ratios such as ROIC,
+        interest coverage, FCF margin, Altman Z' and Piotroski F need no line-item arithmetic.
+
+        Args:
+            ticker (str): The symbol of the security.
+            ratios (list[str] | None, optional): Ratios to include, in column order. Defaults to every
+                supported ratio.
+            freq (str, optional): 'annual' for fiscal years or 'quarterly' for fiscal quarters. Quarterly flow
+                ratios such as ROE use a single quarter's income. Defaults to 'annual'.
+            periods (int | None, optional): Number of most recent periods to return. Defaults to every period
+                reported.
+
+        Returns:
+            FinancialRatios: A period x ratio table, newest period first.
+        """
+        return self.repository.get_financial_ratios(ticker, ratios, freq, periods, session=self.session)
+
 
 financials_service = FinancialsService()
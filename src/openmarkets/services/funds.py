@@ -5,7 +5,10 @@ operations data, and fund overviews. Acts as an intermediary between the MCP too
 layer and repository layer.
 """
 
+from typing import Annotated
+
 from curl_cffi.requests import Session
+from pydantic import Field
 
 from openmarkets.core.http import get_session
 from openmarkets.core.types import Ticker
@@ -15,8 +18,11 @@ from openmarkets.schemas.funds import (
     FundBondHolding,
     FundEquityHolding,
     FundInfo,
+    FundLookThrough,
     FundOperations,
+    FundOverlap,
     FundOverview,
+    FundProfile,
     FundSectorWeighting,
     FundTopHolding,
 )
@@ -152,5 +158,62 @@ class FundsService(ToolRegistrationMixin):
         """
         return self.repository.get_fund_asset_class_holdings(ticker, session=self.session)
 
+    @tool
+    def get_full_fund_profile(self, ticker: Ticker) -> FundProfile:
+        """
+        Retrieve a fund's overview, operations, allocations and holdings in one call.
+
+        Prefer this over calling the individual fund tools one by one: every section comes from a single
+        upstream download.
+
+        Args:
+            ticker (str): The symbol of the fund.
+
+        Returns:
+            FundProfile: Overview, operations, asset classes, sector weighting, and top, equity and bond holdings.
+        """
+        return self.repository.get_full_fund_profile(ticker, session=self.session)
+
+    @tool
+    def get_fund_look_through(
+        self,
+        funds: Annotated[dict[str, Annotated[float, Field(gt=0)]], Field(min_length=1, max_length=50)],
+        top: Annotated[int, Field(ge=1, le=100)] = 25,
+    ) -> FundLookThrough:
+        """
+        Retrieve the effective stock and sector exposure of a portfolio of ETFs or mutual funds.
+
+        Use this instead of calling get_fund_top_holdings and get_fund_sector_weighting per fund and adding
+        the weights up: the funds are fetched concurrently and aggregated in one call. Stock exposure only
+        covers each fund's disclosed top holdings; holdings_coverage reports how much of the portfolio that is.
+
+        Args:
+            funds (dict[str, float]): Portfolio weight by fund ticker, up to 50 funds, e.g. {"SPY": 60, "QQQ": 40}.
+                Weights are normalised to sum to 1.
+            top (int, optional): Number of effective holdings to return, up to 100. Defaults to 25.
+
+        Returns:
+            FundLookThrough: Largest effective holdings with the funds holding them, sector exposure, and the
+                funds that could not be used.
+        """
+        return self.repository.get_fund_look_through(funds, top, session=self.session)
+
+    @tool
+    def get_fund_overlap(self, tickers: Annotated[list[str], Field(min_length=2, max_length=50)]) -> FundOverlap:
+        """
+        Retrieve the pairwise holdings overlap of several ETFs or mutual funds as a matrix.
+
+        Use this to find redundant funds instead of comparing holdings lists pair by pair. The overlap of two funds
+        is the weight they hold in common among their disclosed top holdings.
+
+        Args:
+            tickers (list[str]): Fund ticker symbols to compare, 2 to 50.
+
+        Returns:
+            FundOverlap: Symmetric overlap-by-weight and shared-holding-count matrices, in the order of tickers,
+                plus the funds without top holdings.
+        """
+        return self.repository.get_fund_overlap(tickers, session=self.session)
+
 
 funds_service = FundsService()
@@ -1,25 +1,34 @@
 """Service layer for options data operations.
 
 Provides business logic for retrieving option chains, expiration dates,
-call/put options, volume analysis, moneyness filtering, and options skew.
+call/put options, volume analysis, moneyness filtering, options skew, and
+Black-Scholes Greeks, implied volatility surfaces, and multi-ticker scans.
 Acts as an intermediary between the MCP tools layer and repository layer.
 """
 
 from datetime import date
+from typing import Annotated
 
 from curl_cffi import Session
+from pydantic import Field
 
+from openmarkets.core.black_scholes import DEFAULT_RISK_FREE_RATE
 from openmarkets.core.http import get_session
-from openmarkets.core.types import Ticker
-from openmarkets.repositories.options import OptionsRepository, YFinanceOptionsRepository
+from openmarkets.core.types import ContractLayout, Ticker
+from openmarkets.repositories.options import OptionsRepository, OptionsScanMetric, YFinanceOptionsRepository
 from openmarkets.schemas.options import (
     CallOption,
     OptionContractChain,
+    OptionContractColumns,
     OptionExpirationDate,
+    OptionGreeksChain,
     OptionsByMoneyness,
+    OptionsPositioning,
+    OptionsScan,
     OptionsSkew,
     OptionsVolumeAnalysis,
     PutOption,
+    VolatilitySurface,
 )
 from openmarkets.services.utils import ToolRegistrationMixin, tool
 
@@ -63,46 +72,61 @@ class OptionsService(ToolRegistrationMixin):
         return self.repository.get_option_expiration_dates(ticker, session=self.session)
 
     @tool
-    def get_option_chain(self, ticker: Ticker, expiration: date | None = None) -> OptionContractChain:
+    def get_option_chain(
+        self, ticker: Ticker, expiration: date | None = None, layout: ContractLayout = "rows"
+    ) -> OptionContractChain:
         """
         Retrieve the option contract chain for a given ticker and expiration date.
 
         Args:
             ticker (str): The symbol of the security.
             expiration (date | None, optional): The expiration date. If None, uses the nearest expiration.
+            layout (str, optional): 'rows' for one object per contract, or 'columns' for one array per field,
+                which is much smaller and faster for large chains. Defaults to 'rows'.
 
         Returns:
-            OptionContractChain: The option contract chain data.
+            OptionContractChain: The option contract chain data, in calls/puts for 'rows' or
+                call_columns/put_columns for 'columns'.
         """
-        return self.repository.get_option_chain(ticker, expiration, session=self.session)
+        return self.repository.get_option_chain(ticker, expiration, layout, session=self.session)
 
     @tool
-    def get_call_options(self, ticker: Ticker, expiration: date | None = None) -> list[CallOption] | None:
+    def get_call_options(
+        self, ticker: Ticker, expiration: date | None = None, layout: ContractLayout = "rows"
+    ) -> list[CallOption] | OptionContractColumns | None:
         """
         Retrieve call options for a given ticker and expiration date.
 
         Args:
             ticker (str): The symbol of the security.
             expiration (date | None, optional): The expiration date. If None, uses the nearest expiration.
+            layout (str, optional): 'rows' for one object per contract, or 'columns' for one array per field,
+                which is much smaller and faster for large chains. Defaults to 'rows'.
 
         Returns:
-            list[CallOption] | None: List of call options or None if unavailable.
+            list[CallOption] | OptionContractColumns | None: Call options in the requested layout, or None if
+                unavailable.
         """
-        return self.repository.get_call_options(ticker, expiration, session=self.session)
+        return self.repository.get_call_options(ticker, expiration, layout, session=self.session)
 
     @tool
-    def get_put_options(self, ticker: Ticker, expiration: date | None = None) -> list[PutOption] | None:
+    def get_put_options(
+        self, ticker: Ticker, expiration: date | None = None, layout: ContractLayout = "rows"
+    ) -> list[PutOption] | OptionContractColumns | None:
         """
         Retrieve put options for a given ticker and expiration date.
 
         Args:
             ticker (str): The symbol of the security.
             expiration (date | None, optional): The expiration date. If None, uses the nearest expiration.
+            layout (str, optional): 'rows' for one object per contract, or 'columns' for one array per field,
+                which is much smaller and faster for large chains. Defaults to 'rows'.
 
         Returns:
-            list[PutOption] | None: List of put options or None if unavailable.
+            list[PutOption] | OptionContractColumns | None: Put options in the requested layout, or None if
+                unavailable.
         """
-        return self.repository.get_put_options(ticker, expiration, session=self.session)
+        return self.repository.get_put_options(ticker, expiration, layout, session=self.session)
 
     @tool
     def get_options_volume_analysis(self, ticker: Ticker, expiration_date: str | None = None) -> OptionsVolumeAnalysis:
@@ -152,5 +176,100 @@ class OptionsService(ToolRegistrationMixin):
         """
         return self.repository.get_options_skew(ticker, expiration_date, session=self.session)
 
+    @tool
+    def get_option_greeks(
+        self,
+        ticker: Ticker,
+        expiration: date | None = None,
+        risk_free_rate: float = DEFAULT_RISK_FREE_RATE,
+        dividend_yield: float = 0.0,
+        layout: ContractLayout = "rows",
+    ) -> OptionGreeksChain:
+        """
+        Compute Black-Scholes Greeks (delta, gamma, theta, vega, rho) for every contract of an expiration.
+
+        Implied volatility is re-solved from each contract's bid/ask midpoint before the Greeks are computed.
+
+        Args:
+            ticker (str): The symbol of the security.
+            expiration (date | None, optional): The expiration date. If None, uses the nearest expiration.
+            risk_free_rate (float, optional): Annual risk-free rate as a decimal. Defaults to 0.04.
+            dividend_yield (float, optional): Annual continuous dividend yield as a decimal. Defaults to 0.0.
+            layout (str, optional): 'rows' for one object per contract, or 'columns' for one array per field,
+                which is much smaller and faster for large chains. Defaults to 'rows'.
+
+        Returns:
+            OptionGreeksChain: Per-contract implied volatility and Greeks, in contracts for 'rows' or columns for
+                'columns'; theta is per day, vega and rho per point.
+        """
+        return self.repository.get_option_greeks(
+            ticker, expiration, risk_free_rate, dividend_yield, layout, session=self.session
+        )
+
+    @tool
+    def get_volatility_surface(
+        self,
+        ticker: Ticker,
+        max_expirations: Annotated[int, Field(ge=1, le=24)] = 6,
+        moneyness_range: Annotated[float, Field(gt=0, le=1)] = 0.2,
+    ) -> VolatilitySurface:
+        """
+        Retrieve the implied volatility surface (strike x expiration grid) for a given ticker.
+
+        The nearest expirations are fetched concurrently; each cell is the implied volatility of the
+        out-of-the-money contract at that strike, and strikes are also given as moneyness (strike / price).
+
+        Args:
+            ticker (str): The symbol of the security.
+            max_expirations (int, optional): Number of nearest expirations to include. Defaults to 6.
+            moneyness_range (float, optional): Include strikes within this fraction of the price. Defaults to 0.2.
+
+        Returns:
+            VolatilitySurface: Implied volatility with one row per expiration and one column per strike.
+        """
+        return self.repository.get_volatility_surface(ticker, max_expirations, moneyness_range, session=self.session)
+
+    @tool
+    def get_options_positioning(
+        self,
+        ticker: Ticker,
+        expiration_date: str | None = None,
+        top_n: Annotated[int, Field(ge=1, le=50)] = 5,
+    ) -> OptionsPositioning:
+        """
+        Retrieve max pain, dealer gamma exposure by strike, and open-interest walls for an expiration.
+
+        Computed server-side over the full chain, so there is no need to fetch and scan every contract.
+
+        Args:
+            ticker (str): The symbol of the security.
+            expiration_date (str | None, optional): The expiration date as a string. If None, uses the nearest expiration.
+            top_n (int, optional): Number of strikes to report in each ranking. Defaults to 5.
+
+        Returns:
+            OptionsPositioning: Max pain strike, net and per-strike gamma exposure, and top call/put open-interest strikes.
+        """
+        return self.repository.get_options_positioning(ticker, expiration_date, top_n, session=self.session)
+
+    @tool
+    def get_options_scan(
+        self,
+        tickers: Annotated[list[str], Field(min_length=1, max_length=100)],
+        sort_by: OptionsScanMetric = "put_call_ratio_oi",
+    ) -> OptionsScan:
+        """
+        Rank a list of tickers by a metric of their nearest-expiration option chain.
+
+        Answers questions such as "which of these names has the highest put/call open-interest ratio" in one call.
+
+        Args:
+            tickers (list[str]): Ticker symbols to scan, up to 100.
+            sort_by (str, optional): Metric to rank by, highest first. Defaults to "put_call_ratio_oi".
+
+        Returns:
+            OptionsScan: Volume, open interest, put/call ratios and at-the-money implied volatility per ticker, ranked.
+        """
+        return self.repository.get_options_scan(tickers, sort_by, session=self.session)
+
 
 options_service = OptionsService()
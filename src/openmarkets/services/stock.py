@@ -2,20 +2,27 @@
 
 Provides business logic for retrieving stock information, historical prices,
 dividends, financial summaries, risk metrics, technical indicators, splits,
-corporate actions, and news. Acts as an intermediary between the MCP tools
-layer and repository layer.
+corporate actions, news, and streamed live prices. Acts as an intermediary
+between the MCP tools layer and repository layer.
 """
 
+from typing import Annotated
+
 from curl_cffi.requests import Session
+from pydantic import Field
 
 from openmarkets.core.http import get_session
-from openmarkets.core.types import Interval, Period, Ticker, ValuationFrequency
+from openmarkets.core.streaming import PriceStreamer, StreamedPrice, quote_uri
+from openmarkets.core.types import FundamentalMetric, Interval, Period, Ticker, ValuationFrequency
 from openmarkets.repositories.stock import StockRepository, YFinanceStockRepository
 from openmarkets.schemas.stock import (
     CorporateActions,
     DividendSummary,
     ExtendedFinancialSummary,
     FinancialSummary,
+    FundamentalsComparison,
+    LivePrice,
+    LivePriceWatch,
     NewsItem,
     PriceTarget,
     QuickTechnicalIndicators,
@@ -45,6 +52,7 @@ class StockService(ToolRegistrationMixin):
         """
         self.repository = repository or YFinanceStockRepository()
         self._session = session
+        self.streamer = PriceStreamer(lambda symbol: self.repository.get_last_price(symbol, session=self.session))
 
     @property
     def session(self) -> Session:
@@ -260,5 +268,83 @@ class StockService(ToolRegistrationMixin):
         """
         return self.repository.get_valuation_history(ticker, freq, periods, session=self.session)
 
+    @tool
+    def compare_fundamentals(
+        self,
+        tickers: Annotated[list[str], Field(min_length=1, max_length=100)],
+        metrics: list[FundamentalMetric] | None = None,
+    ) -> FundamentalsComparison:
+        """
+        Compare valuation, profitability, growth and balance-sheet metrics across tickers in one call.
+
+        Use this for peer comparisons instead of calling get_extended_financial_summary once per ticker.
+
+        Args:
+            tickers (list[str]): Ticker symbols to compare, up to 100.
+            metrics (list[str] | None, optional): Metrics to include, in column order. Defaults to every
+                supported metric.
+
+        Returns:
+            FundamentalsComparison: A ticker x metric matrix, plus the tickers that could not be fetched.
+        """
+        return self.repository.compare_fundamentals(tickers, metrics, session=self.session)
+
+    @tool
+    def get_live_prices(
+        self,
+        symbols: Annotated[list[str], Field(min_length=1, max_length=50)],
+        watch_seconds: Annotated[float, Field(gt=0, le=3600)] = 300,
+    ) -> LivePriceWatch:
+        """
+        Retrieve current prices and keep them streaming instead of polling a quote tool in a loop.
+
+        The server polls the symbols for watch_seconds, once per symbol however many clients watch it, and
+        publishes a resource-updated notification on each symbol's quote:// URI when its price changes. Listen
+        for those URIs with subscriptions/listen and read the resource on each notification. Call again before
+        the watch expires to extend it.
+
+        Args:
+            symbols (list[str]): Stock, fund or crypto symbols to watch, up to 50.
+            watch_seconds (float, optional): Seconds to keep streaming. Defaults to 300.
+
+        Returns:
+            LivePriceWatch: Current prices, their resource URIs, and the watch expiry.
+        """
+        prices = self.streamer.watch(symbols, watch_seconds)
+        return LivePriceWatch(
+            prices=[self._live_price(symbol, price) for symbol, price in prices.items()],
+            expires_in=watch_seconds,
+            poll_interval=self.streamer.interval,
+            note="Listen for resource-updated notifications on each uri, then read the quote:// resource.",
+        )
+
+    def read_live_price(self, symbol: str) -> LivePrice:
+        """Return the latest streamed price of a symbol, for the quote:// resource.
+
+        Args:
+            symbol: Ticker symbol.
+
+        Returns:
+            The latest polled price; without a live watch, fetched on demand.
+        """
+        latest = self.streamer.latest(symbol)
+        if latest is None:
+            return LivePrice(
+                symbol=symbol.upper(),
+                price=self.repository.get_last_price(symbol, session=self.session),
+                updated_at=None,
+                uri=quote_uri(symbol),
+            )
+        return self._live_price(symbol, latest)
+
+    def _live_price(self, symbol: str, price: StreamedPrice | None) -> LivePrice:
+        """Convert a streamed price to its schema."""
+        return LivePrice(
+            symbol=symbol.upper(),
+            price=price.price if price else None,
+            updated_at=price.updated_at if price else None,
+            uri=quote_uri(symbol),
+        )
+
 
 stock_service = StockService()
@@ -62,6 +62,16 @@ class ToolRegistrationMixin:
         Args:
             tool_registrar: MCP server instance with a tool() decorator method.
         """
+        for method in self.tool_methods():
+            tool_registrar.tool()(method)
+
+    def tool_methods(self) -> list[Callable[..., Any]]:
+        """Return the bound methods this service publishes.
+
+        Returns:
+            Bound methods marked with :func:`tool`, in name order.
+        """
+        methods: list[Callable[..., Any]] = []
         for attribute_name in dir(type(self)):
             class_attribute = getattr(type(self), attribute_name, None)
             if not is_tool(class_attribute):
@@ -71,7 +81,8 @@ class ToolRegistrationMixin:
             if not inspect.ismethod(method) or method.__self__ is not self:
                 continue
 
-            tool_registrar.tool()(method)
+            methods.append(method)
+        return methods
 
     def tool_names(self) -> list[str]:
         """Return the names of the methods this service publishes.
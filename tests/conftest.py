@@ -5,6 +5,30 @@ from typing import Any, Callable
 
 import pytest
 
+from openmarkets.core.cache import reset_cache
+from openmarkets.core.config import get_settings
+
+
+@pytest.fixture(autouse=True)
+def _isolate_cache():
+    """Give every test a fresh process-wide data cache."""
+    reset_cache()
+    yield
+    reset_cache()
+
+
+@pytest.fixture(autouse=True)
+def _isolate_cache_dir(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    """Keep schema artifacts and other cache files out of the user's cache directory.
+
+    The setting is passed through the environment so servers started as
+    subprocesses by the end-to-end tests use the same directory.
+    """
+    monkeypatch.setenv("CACHE_DIR", str(tmp_path / "cache"))
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
 
 @pytest.fixture
 def patch_yf(monkeypatch: pytest.MonkeyPatch) -> Callable[[type], None]:
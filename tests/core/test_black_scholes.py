@@ -0,0 +1,80 @@
+import math
+
+import numpy as np
+import pytest
+
+from openmarkets.core import black_scholes
+
+
+def test_norm_cdf_matches_math_erfc():
+    x = np.linspace(-8, 8, 161)
+    expected = np.array([0.5 * math.erfc(-value / math.sqrt(2)) for value in x])
+
+    assert np.max(np.abs(black_scholes.norm_cdf(x) - expected)) < 1e-7
+
+
+def test_price_matches_textbook_example():
+    """Hull, Options, Futures and Other Derivatives, example 15.6."""
+    call, put = black_scholes.price([True, False], 42, 40, 0.5, 0.1, 0.2)
+
+    assert call == pytest.approx(4.76, abs=0.005)
+    assert put == pytest.approx(0.81, abs=0.005)
+
+
+def test_greeks_match_closed_form_and_put_call_parity():
+    greeks = black_scholes.greeks([True, False], 42, 40, 0.5, 0.1, 0.2)
+
+    assert greeks["delta"][0] == pytest.approx(0.7791, abs=1e-4)
+    # Put delta is call delta minus one; gamma and vega are shared.
+    assert greeks["delta"][1] == pytest.approx(greeks["delta"][0] - 1)
+    assert greeks["gamma"][0] == pytest.approx(greeks["gamma"][1])
+    assert greeks["vega"][0] == pytest.approx(greeks["vega"][1])
+    assert greeks["gamma"][0] == pytest.approx(0.0500, abs=1e-4)
+    assert greeks["vega"][0] == pytest.approx(0.0881, abs=1e-4)
+
+
+def test_greeks_match_finite_differences():
+    args = dict(spot=100.0, strike=105.0, years=0.3, rate=0.03, dividend_yield=0.01)
+    greeks = black_scholes.greeks(True, volatility=0.25, **args)
+
+    def call_price(**overrides):
+        return float(black_scholes.price(True, **{**args, "volatility": 0.25, **overrides}))
+
+    h = 1e-3
+    assert greeks["delta"] == pytest.approx((call_price(spot=100 + h) - call_price(spot=100 - h)) / (2 * h), rel=1e-4)
+    assert greeks["vega"] == pytest.approx((call_price(volatility=0.26) - call_price(volatility=0.24)) / 2, rel=1e-3)
+    assert greeks["rho"] == pytest.approx((call_price(rate=0.04) - call_price(rate=0.02)) / 2, rel=1e-3)
+    assert greeks["theta"] == pytest.approx(
+        (call_price(years=0.3 - 1 / 365) - call_price(years=0.3 + 1 / 365)) / 2, rel=1e-3
+    )
+
+
+def test_implied_volatility_recovers_volatility_across_a_chain():
+    rng = np.random.default_rng(0)
+    n = 5000
+    strike = rng.uniform(60, 140, n)
+    years = rng.uniform(0.02, 2, n)
+    volatility = rng.uniform(0.05, 1.5, n)
+    is_call = rng.random(n) < 0.5
+    prices = black_scholes.price(is_call, 100, strike, years, 0.04, volatility, 0.01)
+    vega = black_scholes.greeks(is_call, 100, strike, years, 0.04, volatility, 0.01)["vega"]
+
+    solved = black_scholes.implied_volatility(prices, is_call, 100, strike, years, 0.04, 0.01)
+
+    # Contracts with negligible vega carry no volatility information.
+    informative = vega > 1e-3
+    assert np.isfinite(solved[informative]).all()
+    assert np.max(np.abs(solved[informative] - volatility[informative])) < 1e-4
+
+
+def test_implied_volatility_is_nan_outside_arbitrage_bounds():
+    solved = black_scholes.implied_volatility(
+        [1.0, 150.0, 0.0, np.nan, 5.0],
+        [True, True, True, True, True],
+        [110, 100, 100, 100, 100],
+        [100, 100, 100, 100, 100],
+        [0.5, 0.5, 0.5, 0.5, 0.0],
+        0.04,
+    )
+
+    assert np.isnan(solved).all()
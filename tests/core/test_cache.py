@@ -0,0 +1,142 @@
+"""Tests for the process- and host-level data caches."""
+
+import shutil
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from openmarkets.core import cache
+
+
+@pytest.fixture(params=["memory", "file"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        return cache.MemoryCache(default_ttl=60)
+    return cache.FileCache(tmp_path / "data", default_ttl=60)
+
+
+def test_get_or_set_computes_once(backend):
+    factory = mock.Mock(return_value={"price": 1.0})
+
+    assert backend.get_or_set(("info", "AAPL"), factory) == {"price": 1.0}
+    assert backend.get_or_set(("info", "AAPL"), factory) == {"price": 1.0}
+
+    factory.assert_called_once()
+    assert (backend.hits, backend.misses) == (1, 1)
+
+
+def test_none_is_cached(backend):
+    backend.set("key", None)
+
+    assert backend.get("key") is None
+
+
+def test_expired_entries_are_missing(backend, monkeypatch):
+    backend.set("key", 1, ttl=10)
+    now = time.time()
+    monkeypatch.setattr(cache.time, "time", lambda: now + 11)
+
+    assert backend.get("key") is cache.MISSING
+
+
+def test_non_positive_ttl_stores_nothing(backend):
+    backend.set("key", 1, ttl=0)
+
+    assert backend.get("key") is cache.MISSING
+
+
+def test_clear_removes_entries(backend):
+    backend.set("key", 1)
+    backend.clear()
+
+    assert backend.get("key") is cache.MISSING
+
+
+def test_concurrent_misses_are_coalesced(backend):
+    release = threading.Event()
+    calls = []
+
+    def factory():
+        calls.append(1)
+        release.wait(1)
+        return "value"
+
+    threads = [threading.Thread(target=backend.get_or_set, args=("key", factory)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert not backend._key_locks
+
+
+def test_key_locks_are_dropped_after_the_miss(backend):
+    for index in range(100):
+        backend.get_or_set(("info", index), lambda: None, ttl=0)
+
+    assert not backend._key_locks
+
+
+def test_memory_cache_evicts_least_recently_used():
+    memory = cache.MemoryCache(max_entries=2)
+    memory.set("a", 1)
+    memory.set("b", 2)
+    memory.get("a")
+    memory.set("c", 3)
+
+    assert memory.get("b") is cache.MISSING
+    assert memory.get("a") == 1
+    assert len(memory) == 2
+
+
+def test_file_cache_is_shared_between_instances(tmp_path):
+    """Separate instances model separate worker processes on one host."""
+    cache.FileCache(tmp_path).set(("info", "MSFT"), {"price": 2.0})
+
+    assert cache.FileCache(tmp_path).get(("info", "MSFT")) == {"price": 2.0}
+
+
+def test_file_cache_discards_corrupt_entries(tmp_path):
+    files = cache.FileCache(tmp_path)
+    files.set("key", 1)
+    next(tmp_path.glob("*.pkl")).write_bytes(b"garbage")
+
+    assert files.get("key") is cache.MISSING
+    assert not list(tmp_path.glob("*.pkl"))
+
+
+def test_file_cache_skips_unpicklable_values(tmp_path):
+    files = cache.FileCache(tmp_path)
+
+    assert files.get_or_set("key", lambda: threading.Lock()) is not None
+    assert not list(tmp_path.iterdir())
+
+
+def test_file_cache_survives_a_removed_directory(tmp_path):
+    files = cache.FileCache(tmp_path / "data")
+    shutil.rmtree(tmp_path / "data")
+
+    assert files.get_or_set("key", lambda: 1) == 1
+
+
+@pytest.mark.parametrize(
+    ("workers", "shared", "expected"),
+    [(1, False, cache.MemoryCache), (1, True, cache.FileCache), (4, False, cache.FileCache)],
+)
+def test_configure_cache_selects_backend(tmp_path, workers, shared, expected):
+    settings = mock.Mock(workers=workers, shared_cache=shared, cache_ttl=5.0, cache_dir=str(tmp_path))
+
+    configured = cache.configure_cache(settings)
+
+    assert isinstance(configured, expected)
+    assert configured.default_ttl == 5.0
+    assert cache.get_cache() is configured
+
+
+def test_get_cache_defaults_to_memory():
+    assert isinstance(cache.get_cache(), cache.MemoryCache)
+    assert cache.get_cache() is cache.get_cache()
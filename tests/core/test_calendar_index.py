@@ -0,0 +1,91 @@
+"""Tests for the background calendar index."""
+
+import time
+from datetime import date
+
+from openmarkets.core.calendar_index import CalendarEvent, CalendarIndex
+
+_CALENDARS = {
+    "AAPL": {"earnings": [date(2026, 10, 29)], "ex_dividend": [date(2026, 11, 10)]},
+    "MSFT": {"earnings": [date(2026, 10, 28)], "dividend": [date(2026, 12, 11)]},
+}
+
+
+def _fetch(ticker):
+    if ticker == "BAD":
+        raise ValueError("not found")
+    return _CALENDARS[ticker]
+
+
+def test_events_between_reads_the_days_in_range(tmp_path):
+    index = CalendarIndex(_fetch)
+    index.path = tmp_path / "index.json"
+    index.tickers = ["AAPL", "MSFT", "BAD"]
+
+    index.refresh()
+
+    assert index.events_between(date(2026, 10, 26), date(2026, 11, 1)) == [
+        CalendarEvent("MSFT", "earnings", date(2026, 10, 28)),
+        CalendarEvent("AAPL", "earnings", date(2026, 10, 29)),
+    ]
+    assert index.events_between(date(2026, 10, 1), date(2026, 12, 31), tickers=["aapl"], kinds=["ex_dividend"]) == [
+        CalendarEvent("AAPL", "ex_dividend", date(2026, 11, 10)),
+    ]
+
+
+def test_stored_index_is_reused_instead_of_refetched(tmp_path):
+    fetched = []
+
+    def fetch(ticker):
+        fetched.append(ticker)
+        return _CALENDARS[ticker]
+
+    path = tmp_path / "index.json"
+    first = CalendarIndex(fetch)
+    first.start(["AAPL", "MSFT"], path, interval=3600)
+    while first.built_at is None:
+        time.sleep(0.01)
+    first.stop()
+
+    second = CalendarIndex(fetch)
+    second.start(["aapl", "msft"], path, interval=3600)
+    second.stop()
+
+    assert sorted(fetched) == ["AAPL", "MSFT"]
+    assert second.built_at == first.built_at
+    assert len(second.events_between(date(2026, 10, 1), date(2026, 12, 31))) == 4
+
+
+def test_stored_index_of_another_universe_is_ignored(tmp_path):
+    path = tmp_path / "index.json"
+    built = CalendarIndex(_fetch)
+    built.path, built.tickers = path, ["AAPL"]
+    built.refresh()
+
+    other = CalendarIndex(_fetch)
+    other.path, other.tickers = path, ["MSFT"]
+    other._load()
+
+    assert other.built_at is None
+
+
+def test_indexes_starting_together_fetch_the_universe_once(tmp_path):
+    """Separate instances model worker processes starting on one host."""
+    fetched = []
+
+    def fetch(ticker):
+        fetched.append(ticker)
+        time.sleep(0.05)
+        return _CALENDARS[ticker]
+
+    path = tmp_path / "index.json"
+    indexes = [CalendarIndex(fetch) for _ in range(3)]
+    for index in indexes:
+        index.start(["AAPL", "MSFT"], path, interval=3600)
+    while any(index.built_at is None for index in indexes):
+        time.sleep(0.01)
+    for index in indexes:
+        index.stop()
+
+    assert sorted(fetched) == ["AAPL", "MSFT"]
+    assert len({index.built_at for index in indexes}) == 1
@@ -1,5 +1,6 @@
 """Tests for the concurrent fan-out helper."""
 
+import threading
 import time
 
 import pytest
@@ -35,3 +36,21 @@ def test_gather_propagates_the_first_exception():
 
     with pytest.raises(ValueError, match="upstream failed"):
         gather({"ok": lambda: 1, "bad": boom})
+
+
+def test_gather_bounds_calls_in_flight():
+    lock = threading.Lock()
+    in_flight = peak = 0
+
+    def call():
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.05)
+        with lock:
+            in_flight -= 1
+
+    gather({str(index): call for index in range(6)}, max_workers=2)
+
+    assert peak == 2
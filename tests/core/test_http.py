@@ -1,6 +1,7 @@
 """Tests for the shared HTTP session helper."""
 
 import gc
+from types import SimpleNamespace
 
 from curl_cffi.requests import Session
 
@@ -58,3 +59,17 @@ def test_services_share_the_session_but_honour_injection():
     finally:
         injected.close()
         http.close_session()
+
+
+def test_session_records_upstream_latency(monkeypatch):
+    from openmarkets.core import metrics
+
+    response = SimpleNamespace(status_code=200, content=b"{}")
+    monkeypatch.setattr(Session, "request", lambda self, method, url, *args, **kwargs: response)
+    session = http.InstrumentedSession()
+    endpoint = "/v8/finance/chart"
+    before = metrics.UPSTREAM_LATENCY.count(endpoint=endpoint)
+
+    assert session.get("https://query2.finance.yahoo.com/v8/finance/chart/AAPL") is response
+    assert metrics.UPSTREAM_LATENCY.count(endpoint=endpoint) == before + 1
+    session.close()
@@ -0,0 +1,99 @@
+"""Tests for the slow-call log and the per-tool profiling hook."""
+
+import json
+import logging
+import pstats
+import time
+from unittest import mock
+
+from openmarkets.core import instrumentation, mcpserver
+from openmarkets.core.concurrency import gather
+from openmarkets.core.instrumentation import instrument_tool, record_upstream_time
+
+
+def get_slow_quote(ticker: str) -> dict:
+    """Simulate two concurrent upstream requests followed by conversion."""
+
+    def fetch():
+        time.sleep(0.01)
+        record_upstream_time(0.01)
+        return 1
+
+    results = gather({"a": fetch, "b": fetch})
+    return {"ticker": ticker, "total": sum(results.values())}
+
+
+def _slow_records(caplog):
+    prefix = "Slow tool call: "
+    return [json.loads(r.getMessage()[len(prefix) :]) for r in caplog.records if r.getMessage().startswith(prefix)]
+
+
+def test_slow_call_record_breaks_down_time(caplog):
+    wrapped = instrument_tool(get_slow_quote, slow_call_threshold=1e-9)
+
+    with caplog.at_level(logging.WARNING, logger=instrumentation.__name__):
+        wrapped(ticker="AAPL")
+
+    (record,) = _slow_records(caplog)
+    assert record["tool"] == "get_slow_quote"
+    assert record["arguments"] == {"ticker": "AAPL"}
+    assert record["upstream_requests"] == 2
+    assert record["upstream_seconds"] == 0.02
+    assert record["failed"] is False
+    assert {"total_seconds", "conversion_seconds"} <= record.keys()
+    assert "serialization_seconds" not in record
+
+
+def test_fast_calls_and_disabled_threshold_do_not_log(caplog):
+    with caplog.at_level(logging.WARNING, logger=instrumentation.__name__):
+        instrument_tool(get_slow_quote, slow_call_threshold=60)(ticker="AAPL")
+        instrument_tool(get_slow_quote)(ticker="AAPL")
+
+    assert _slow_records(caplog) == []
+
+
+def test_slow_failures_are_logged(caplog):
+    def get_broken(ticker: str) -> None:
+        raise ValueError(ticker)
+
+    with caplog.at_level(logging.WARNING, logger=instrumentation.__name__):
+        try:
+            instrument_tool(get_broken, slow_call_threshold=1e-9)(ticker="X")
+        except ValueError:
+            pass
+
+    (record,) = _slow_records(caplog)
+    assert record["failed"] is True
+
+
+def test_upstream_time_outside_a_call_is_ignored():
+    record_upstream_time(1.0)
+
+
+def test_profiled_call_writes_profile(tmp_path):
+    wrapped = instrument_tool(get_slow_quote, profile_dir=tmp_path / "profiles")
+
+    assert wrapped(ticker="AAPL") == {"ticker": "AAPL", "total": 2}
+
+    (profile,) = (tmp_path / "profiles").glob("get_slow_quote-*.prof")
+    assert pstats.Stats(str(profile)).total_calls > 0
+
+
+def test_concurrent_profiling_falls_back_to_plain_call(tmp_path):
+    with instrumentation._profiler_lock:
+        result = instrument_tool(get_slow_quote, profile_dir=tmp_path)(ticker="AAPL")
+
+    assert result["total"] == 2
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_profile_tools_setting_selects_tools(tmp_path):
+    config = mock.Mock(profile_tools=" get_a, get_b ", profile_dir=None, cache_dir=str(tmp_path), slow_call_threshold=0)
+    instrument = mock.Mock()
+
+    with mock.patch.object(mcpserver, "instrument_tool", instrument):
+        for name in ("get_a", "get_c"):
+            mcpserver._instrument(mock.Mock(__name__=name), config)
+
+    assert instrument.call_args_list[0].kwargs["profile_dir"] == tmp_path / "profiles"
+    assert instrument.call_args_list[1].kwargs["profile_dir"] is None
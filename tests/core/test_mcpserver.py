@@ -1,6 +1,8 @@
 from unittest import mock
 
+import anyio
 import pytest
+from mcp.types import CompletionArgument, ResourceTemplateReference
 
 import openmarkets.core.mcpserver as mcpserver
 
@@ -19,7 +21,7 @@ _SERVICE_NAMES = [
 
 
 def _stub_all_services(monkeypatch, *, failing: str | None = None) -> None:
-    """Replace every service's register_tool_methods with a mock.
+    """Replace every service's tool_methods with a mock publishing nothing.
 
     Args:
         monkeypatch: pytest monkeypatch fixture.
@@ -29,8 +31,8 @@ def _stub_all_services(monkeypatch, *, failing: str | None = None) -> None:
         side_effect = Exception("fail") if name == failing else None
         monkeypatch.setattr(
             getattr(mcpserver, name),
-            "register_tool_methods",
-            mock.Mock(side_effect=side_effect),
+            "tool_methods",
+            mock.Mock(return_value=[], side_effect=side_effect),
         )
 
 
@@ -82,7 +84,7 @@ def test_cors_middleware_defaults_to_wildcard(monkeypatch, make_middleware_spy_a
 
 
 def test_create_mcp_registers_all(monkeypatch):
-    config = mock.Mock(cors_allow_origins="*")
+    config = mock.Mock(cors_allow_origins="*", tool_schema_cache=False, profile_tools="", slow_call_threshold=0)
     mcp_instance = mock.Mock()
     monkeypatch.setattr(mcpserver, "CORSMCPServer", mock.Mock(return_value=mcp_instance))
     monkeypatch.setattr(mcpserver, "get_settings", mock.Mock(return_value=config))
@@ -95,7 +97,7 @@ def test_create_mcp_registers_all(monkeypatch):
 
 def test_create_mcp_passes_configured_origins(monkeypatch):
     """The factory forwards settings-derived origins to the server."""
-    config = mock.Mock()
+    config = mock.Mock(tool_schema_cache=False, profile_tools="", slow_call_threshold=0)
     config.name = "Test Server"
     config.cors_allow_origins = "https://a.example,https://b.example"
     server_factory = mock.Mock(return_value=mock.Mock())
@@ -145,7 +147,9 @@ def test_parse_allowed_origins_preserves_first_occurrence_order():
 def test_create_mcp_uses_get_settings_when_not_provided(monkeypatch):
     mcp_instance = mock.Mock()
     monkeypatch.setattr(mcpserver, "CORSMCPServer", mock.Mock(return_value=mcp_instance))
-    get_settings_mock = mock.Mock(return_value=mock.Mock(cors_allow_origins="*"))
+    get_settings_mock = mock.Mock(
+        return_value=mock.Mock(cors_allow_origins="*", tool_schema_cache=False, profile_tools="", slow_call_threshold=0)
+    )
     monkeypatch.setattr(mcpserver, "get_settings", get_settings_mock)
     _stub_all_services(monkeypatch)
 
@@ -156,7 +160,7 @@ def test_create_mcp_uses_get_settings_when_not_provided(monkeypatch):
 
 
 def test_create_mcp_register_exception(monkeypatch):
-    config = mock.Mock(cors_allow_origins="*")
+    config = mock.Mock(cors_allow_origins="*", tool_schema_cache=False, profile_tools="", slow_call_threshold=0)
     mcp_instance = mock.Mock()
     monkeypatch.setattr(mcpserver, "CORSMCPServer", mock.Mock(return_value=mcp_instance))
     monkeypatch.setattr(mcpserver, "get_settings", mock.Mock(return_value=config))
@@ -167,6 +171,28 @@ def test_create_mcp_register_exception(monkeypatch):
         mcpserver.create_mcp(config)
 
 
+def test_create_mcp_writes_then_reuses_schema_cache(monkeypatch, tmp_path):
+    """A cold start generates and stores schemas; a warm start loads them."""
+    config = mock.Mock(
+        cors_allow_origins="*", tool_schema_cache=True, cache_dir=str(tmp_path), profile_tools="", slow_call_threshold=0
+    )
+    config.name = "Test Server"
+    server_factory = mock.Mock(return_value=mock.Mock())
+    monkeypatch.setattr(mcpserver, "CORSMCPServer", server_factory)
+    monkeypatch.setattr(mcpserver, "_SERVICES", [mcpserver.options_service])
+    generate = mock.Mock(wraps=mcpserver.generate_tools)
+    monkeypatch.setattr(mcpserver, "generate_tools", generate)
+
+    mcpserver.create_mcp(config)
+    cold_tools = server_factory.call_args.kwargs["tools"]
+    mcpserver.create_mcp(config)
+    warm_tools = server_factory.call_args.kwargs["tools"]
+
+    assert generate.call_count == 1
+    assert len(list(tmp_path.glob("tool-schemas-*.json"))) == 1
+    assert [tool.parameters for tool in warm_tools] == [tool.parameters for tool in cold_tools]
+
+
 def test_published_tool_surface_is_explicit():
     """Every service tool is opt-in and the surface is stable.
 
@@ -177,7 +203,70 @@ def test_published_tool_surface_is_explicit():
 
     published = {name: getattr(services, name).tool_names() for name in services.__all__}
 
-    assert sum(len(names) for names in published.values()) == 74
+    assert sum(len(names) for names in published.values()) == 87
     for names in published.values():
         assert names, "every service must publish at least one tool"
         assert all(name.startswith(("get_", "list_", "search_", "compare_")) for name in names)
+
+
+@pytest.mark.parametrize(("enabled", "status"), [(True, 200), (False, 404)])
+def test_metrics_route_follows_setting(enabled, status):
+    from starlette.testclient import TestClient
+
+    config = mock.Mock(cors_allow_origins="*", metrics=enabled)
+    config.name = "Test Server"
+    app = mcpserver._create_server(config).streamable_http_app()
+
+    response = TestClient(app).get("/metrics")
+
+    assert response.status_code == status
+    if enabled:
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert "# TYPE openmarkets_tool_calls_total counter" in response.text
+
+
+def test_registered_tools_are_instrumented(monkeypatch):
+    config = mock.Mock(cors_allow_origins="*", tool_schema_cache=False, profile_tools="", slow_call_threshold=0)
+    config.name = "Test Server"
+    monkeypatch.setattr(mcpserver, "_SERVICES", [mcpserver.options_service])
+
+    tools = mcpserver._build_all_tools(config)
+
+    assert all(hasattr(tool.fn, "__wrapped__") for tool in tools)
+    assert [tool.name for tool in tools] == mcpserver.options_service.tool_names()
+
+
+def test_server_serves_streamed_prices_as_resources():
+    config = mock.Mock(cors_allow_origins="*", metrics=False, price_poll_interval=2.5)
+    config.name = "Test Server"
+
+    server = mcpserver._create_server(config)
+    templates = anyio.run(server.list_resource_templates)
+
+    assert [template.uri_template for template in templates] == ["quote://{symbol}"]
+    assert mcpserver.stock_service.streamer.interval == 2.5
+
+
+def test_quote_symbol_completes_from_watched_symbols(monkeypatch):
+    monkeypatch.setattr(mcpserver.stock_service.streamer, "watched_symbols", lambda: ["AAPL", "AMD", "BTC-USD"])
+    ref = ResourceTemplateReference(type="ref/resource", uri="quote://{symbol}")
+
+    completion = anyio.run(mcpserver._complete_watched_symbol, ref, CompletionArgument(name="symbol", value="a"), None)
+    other = anyio.run(mcpserver._complete_watched_symbol, ref, CompletionArgument(name="owner", value="a"), None)
+
+    assert completion.values == ["AAPL", "AMD"]
+    assert other is None
+
+
+@pytest.mark.parametrize(("universe", "expected"), [("aapl, msft,,", ["aapl", "msft"]), ("", None)])
+def test_start_calendar_index_only_with_a_universe(monkeypatch, tmp_path, universe, expected):
+    start = mock.Mock()
+    monkeypatch.setattr(mcpserver.financials_service.calendar_index, "start", start)
+    config = mock.Mock(calendar_universe=universe, cache_dir=str(tmp_path), calendar_refresh_interval=60.0)
+
+    mcpserver.start_calendar_index(config)
+
+    if expected is None:
+        start.assert_not_called()
+    else:
+        start.assert_called_once_with(expected, tmp_path / "calendar-index.json", 60.0)
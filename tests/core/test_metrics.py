@@ -0,0 +1,134 @@
+"""Tests for the Prometheus metrics registry and tool instrumentation."""
+
+import anyio
+import pytest
+
+from openmarkets.core import metrics
+from openmarkets.core.cache import get_cache, reset_cache
+from openmarkets.core.exceptions import DataUnavailableError
+from openmarkets.core.instrumentation import instrument_tool
+
+
+def test_counter_and_gauge_render():
+    registry = metrics.MetricsRegistry()
+    counter = registry.register(metrics.Counter("calls_total", "Calls.", ("tool",)))
+    gauge = registry.register(metrics.Gauge("depth", "Depth."))
+    counter.inc(tool="get_info")
+    counter.inc(2, tool="get_info")
+    gauge.set(3)
+    gauge.dec()
+
+    text = registry.render()
+
+    assert "# TYPE calls_total counter" in text
+    assert 'calls_total{tool="get_info"} 3' in text
+    assert "depth 2" in text
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = metrics.Histogram("latency_seconds", "Latency.", ("tool",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 5.0):
+        histogram.observe(value, tool="t")
+
+    samples = {(name, labels.get("le")): value for name, labels, value in histogram.samples()}
+
+    assert samples[("latency_seconds_bucket", "0.1")] == 2
+    assert samples[("latency_seconds_bucket", "1")] == 3
+    assert samples[("latency_seconds_bucket", "+Inf")] == 4
+    assert samples[("latency_seconds_count", None)] == 4
+    assert samples[("latency_seconds_sum", None)] == pytest.approx(5.65)
+
+
+def test_label_values_are_escaped():
+    registry = metrics.MetricsRegistry()
+    registry.register(metrics.Counter("c", "C.", ("exception",))).inc(exception='a"b\\c')
+
+    assert 'c{exception="a\\"b\\\\c"} 1' in registry.render()
+
+
+def test_mismatched_labels_are_rejected():
+    with pytest.raises(ValueError):
+        metrics.Counter("c", "C.", ("tool",)).inc(endpoint="x")
+
+
+def test_duplicate_registration_is_rejected():
+    registry = metrics.MetricsRegistry()
+    registry.register(metrics.Counter("c", "C."))
+
+    with pytest.raises(ValueError):
+        registry.register(metrics.Counter("c", "C."))
+
+
+def test_failing_function_metric_is_omitted():
+    registry = metrics.MetricsRegistry()
+    registry.register(metrics.Gauge("broken", "Broken.", function=lambda: 1 / 0))
+    registry.register(metrics.Gauge("ok", "Ok.", function=lambda: 1))
+
+    text = registry.render()
+
+    assert "broken" not in text
+    assert "ok 1" in text
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("https://query2.finance.yahoo.com/v10/finance/quoteSummary/AAPL?modules=x", "/v10/finance/quoteSummary"),
+        ("https://query1.finance.yahoo.com/v7/finance/options/MSFT", "/v7/finance/options"),
+        ("https://query1.finance.yahoo.com/v1/test/getcrumb", "/v1/test"),
+        ("https://fc.yahoo.com", "/"),
+    ],
+)
+def test_upstream_endpoint_drops_symbols(url, expected):
+    assert metrics.upstream_endpoint(url) == expected
+
+
+def test_cache_metrics_follow_process_cache():
+    hits, misses = metrics.CACHE_HITS.value(), metrics.CACHE_MISSES.value()
+    cache = get_cache()
+    cache.get_or_set("k", lambda: 1)
+    cache.get("k")
+
+    assert (metrics.CACHE_HITS.value(), metrics.CACHE_MISSES.value()) == (hits + 1, misses + 1)
+    assert f"openmarkets_cache_hits_total {int(hits) + 1}" in metrics.REGISTRY.render()
+
+
+def test_cache_counters_survive_clearing_the_cache():
+    cache = get_cache()
+    cache.get_or_set("k", lambda: 1)
+    cache.get("k")
+    hits = metrics.CACHE_HITS.value()
+
+    cache.clear()
+    reset_cache()
+
+    assert metrics.CACHE_HITS.value() == hits
+    assert 0.0 < metrics._cache_hit_ratio() < 1.0
+
+
+def test_executor_queue_depth_is_read_in_event_loop():
+    async def scrape():
+        return metrics.REGISTRY.render()
+
+    assert "openmarkets_executor_queue_depth 0" in anyio.run(scrape)
+
+
+def test_instrumented_tool_records_calls_and_errors():
+    def get_thing(ticker: str) -> str:
+        """Docs."""
+        if ticker == "BAD":
+            raise DataUnavailableError("none")
+        return ticker
+
+    wrapped = instrument_tool(get_thing)
+    before = metrics.TOOL_CALLS.value(tool="get_thing")
+
+    assert wrapped("AAPL") == "AAPL"
+    with pytest.raises(DataUnavailableError):
+        wrapped("BAD")
+
+    assert wrapped.__name__ == "get_thing"
+    assert wrapped.__doc__ == "Docs."
+    assert metrics.TOOL_CALLS.value(tool="get_thing") == before + 2
+    assert metrics.TOOL_ERRORS.value(tool="get_thing", exception="DataUnavailableError") >= 1
+    assert metrics.TOOL_LATENCY.count(tool="get_thing") >= 2
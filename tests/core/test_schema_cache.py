@@ -0,0 +1,135 @@
+"""Tests for the precomputed tool definition cache."""
+
+import json
+
+import pytest
+from mcp.server.mcpserver import Context
+
+from openmarkets.core import schema_cache
+from openmarkets.services.options import OptionsService
+
+
+@pytest.fixture
+def methods():
+    return OptionsService().tool_methods()
+
+
+def test_round_trip_matches_live_generation(methods, tmp_path):
+    path = tmp_path / "tools.json"
+    live = schema_cache.generate_tools(methods)
+
+    schema_cache.save_tools(live, path, "abc")
+    cached = schema_cache.load_tools(methods, path, "abc")
+
+    assert cached is not None
+    for generated, loaded in zip(live, cached, strict=True):
+        assert loaded.name == generated.name
+        assert loaded.description == generated.description
+        assert loaded.parameters == generated.parameters
+        assert loaded.output_schema == generated.output_schema
+        assert loaded.fn_metadata.wrap_output == generated.fn_metadata.wrap_output
+        assert loaded.is_async == generated.is_async
+        assert loaded.context_kwarg == generated.context_kwarg
+
+
+def test_typed_dict_outputs_round_trip(tmp_path):
+    """TypedDict returns are rebuilt the way the installed SDK derived them."""
+    from openmarkets.services.technical_analysis import TechnicalAnalysisService
+
+    methods = TechnicalAnalysisService().tool_methods()
+    path = tmp_path / "tools.json"
+    live = schema_cache.generate_tools(methods)
+    schema_cache.save_tools(live, path, "abc")
+
+    cached = schema_cache.load_tools(methods, path, "abc")
+
+    assert cached is not None
+    assert [tool.output_schema for tool in cached] == [tool.output_schema for tool in live]
+
+
+def test_fingerprint_mismatch_falls_back(methods, tmp_path):
+    path = tmp_path / "tools.json"
+    schema_cache.save_tools(schema_cache.generate_tools(methods), path, "old")
+
+    assert schema_cache.load_tools(methods, path, "new") is None
+
+
+def test_tool_set_mismatch_falls_back(methods, tmp_path):
+    path = tmp_path / "tools.json"
+    schema_cache.save_tools(schema_cache.generate_tools(methods[1:]), path, "abc")
+
+    assert schema_cache.load_tools(methods, path, "abc") is None
+
+
+@pytest.mark.parametrize("content", ["not json", json.dumps({"fingerprint": "abc"}), "[]"])
+def test_unusable_artifact_falls_back(methods, tmp_path, content):
+    path = tmp_path / "tools.json"
+    path.write_text(content)
+
+    assert schema_cache.load_tools(methods, path, "abc") is None
+
+
+def test_missing_artifact_falls_back(methods, tmp_path):
+    assert schema_cache.load_tools(methods, tmp_path / "absent.json", "abc") is None
+
+
+def test_cache_path_is_keyed_by_version_and_fingerprint(tmp_path):
+    path = schema_cache.schema_cache_path(tmp_path, "f" * 64)
+
+    assert path.parent == tmp_path
+    assert schema_cache.__version__ in path.name
+    assert "f" * 16 in path.name
+
+
+def test_fingerprint_is_stable():
+    assert schema_cache.schema_fingerprint() == schema_cache.schema_fingerprint()
+
+
+def test_round_trip_rebuilds_equivalent_output_models(methods, tmp_path):
+    path = tmp_path / "tools.json"
+    live = schema_cache.generate_tools(methods)
+    schema_cache.save_tools(live, path, "abc")
+
+    for generated, loaded in zip(live, schema_cache.load_tools(methods, path, "abc"), strict=True):
+        if generated.fn_metadata.output_schema is None:
+            assert loaded.fn_metadata.output_model is None
+        elif generated.fn_metadata.wrap_output:
+            assert loaded.fn_metadata.output_model.__name__ == generated.fn_metadata.output_model.__name__
+        else:
+            assert loaded.fn_metadata.output_model is generated.fn_metadata.output_model
+
+
+def test_async_tools_taking_a_context_round_trip(tmp_path):
+    """Execution details are derived from the method, not assumed."""
+
+    async def get_quote(ticker: str, ctx: Context) -> str:
+        """Return a quote."""
+        return ticker
+
+    path = tmp_path / "tools.json"
+    live = schema_cache.generate_tools([get_quote])
+    schema_cache.save_tools(live, path, "abc")
+
+    cached = schema_cache.load_tools([get_quote], path, "abc")
+
+    assert cached is not None
+    (loaded,) = cached
+
+    assert loaded.is_async is True
+    assert loaded.context_kwarg == "ctx"
+    assert loaded.parameters == live[0].parameters
+    assert "ctx" not in loaded.fn_metadata.arg_model.model_fields
+
+
+def test_save_removes_stale_artifacts(methods, tmp_path):
+    stale = schema_cache.schema_cache_path(tmp_path, "a" * 64)
+    stale.write_text("{}")
+    unrelated = tmp_path / "calendar-index.json"
+    unrelated.write_text("{}")
+    path = schema_cache.schema_cache_path(tmp_path, "b" * 64)
+
+    schema_cache.save_tools(schema_cache.generate_tools(methods), path, "b" * 64)
+
+    assert path.exists()
+    assert not stale.exists()
+    assert unrelated.exists()
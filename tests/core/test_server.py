@@ -13,9 +13,15 @@ def stub_startup(monkeypatch):
     transport and yields the dict recording which runner was invoked.
     """
 
-    def _install(transport: str) -> dict[str, bool]:
-        monkeypatch.setattr(server, "get_settings", mock.Mock(return_value=mock.Mock(transport=transport)))
+    def _install(transport: str, workers: int = 1) -> dict[str, bool]:
+        settings = mock.Mock(transport=transport, workers=workers)
+        monkeypatch.setattr(server, "get_settings", mock.Mock(return_value=settings))
         monkeypatch.setattr(server, "create_mcp", mock.Mock(return_value=mock.Mock()))
+        monkeypatch.setattr(server, "configure_cache", mock.Mock())
+        monkeypatch.setattr(server, "configure_tracing", mock.Mock())
+        monkeypatch.setattr(
+            server, "start_calendar_index", mock.Mock(side_effect=lambda settings: called.setdefault("index", True))
+        )
 
         called: dict[str, bool] = {}
         monkeypatch.setattr(server, "run_stdio_server", lambda mcp: called.setdefault("stdio", True))
@@ -36,6 +42,18 @@ def test_main_selects_transport(stub_startup, transport):
     assert not called.get(other)
 
 
+@pytest.mark.parametrize(
+    ("transport", "workers", "indexed"), [("stdio", 4, True), ("http", 1, True), ("http", 4, False)]
+)
+def test_main_leaves_the_calendar_index_to_workers(stub_startup, transport, workers, indexed):
+    """A multi-worker supervisor serves no requests, so only its workers start the index."""
+    called = stub_startup(transport, workers)
+
+    server.main()
+
+    assert called.get("index", False) is indexed
+
+
 def test_main_invalid(monkeypatch, stub_startup):
     stub_startup("invalid")
     monkeypatch.setattr(server, "logger", mock.Mock())
@@ -58,7 +76,7 @@ def test_run_stdio_server_exception(monkeypatch):
 def test_run_http_server_delegates_to_sdk():
     """Transport configuration is passed to the SDK runner, not to uvicorn."""
     mcp = mock.Mock()
-    settings = mock.Mock(host="127.0.0.1", port=9999)
+    settings = mock.Mock(host="127.0.0.1", port=9999, workers=1)
 
     server.run_http_server(mcp, settings)
 
@@ -85,7 +103,7 @@ def test_run_http_server_keyboard(monkeypatch):
     monkeypatch.setattr(server, "logger", logger_mock)
 
     with pytest.raises(SystemExit) as excinfo:
-        server.run_http_server(mcp, mock.Mock(host="127.0.0.1", port=8000))
+        server.run_http_server(mcp, mock.Mock(host="127.0.0.1", port=8000, workers=1))
 
     assert excinfo.value.code == 0
     assert logger_mock.info.called
@@ -98,7 +116,45 @@ def test_run_http_server_exception(monkeypatch):
     monkeypatch.setattr(server, "logger", logger_mock)
 
     with pytest.raises(SystemExit) as excinfo:
-        server.run_http_server(mcp, mock.Mock(host="127.0.0.1", port=8000))
+        server.run_http_server(mcp, mock.Mock(host="127.0.0.1", port=8000, workers=1))
 
     assert excinfo.value.code == 1
     assert logger_mock.exception.called
+
+
+def test_run_http_server_with_workers_delegates_to_uvicorn(monkeypatch):
+    """Multiple workers are supervised by uvicorn and build their own apps."""
+    uvicorn_run = mock.Mock()
+    monkeypatch.setattr("uvicorn.run", uvicorn_run)
+    mcp = mock.Mock()
+    settings = mock.Mock(host="0.0.0.0", port=8080, workers=4, shutdown_timeout=0, debug=False)
+
+    server.run_http_server(mcp, settings)
+
+    mcp.run.assert_not_called()
+    args, kwargs = uvicorn_run.call_args
+    assert args == (server.HTTP_APP_FACTORY,)
+    assert kwargs["factory"] is True
+    assert kwargs["workers"] == 4
+    assert kwargs["timeout_graceful_shutdown"] == 0
+
+
+def test_create_http_app_builds_stateless_app(monkeypatch):
+    settings = mock.Mock(debug=False)
+    mcp = mock.Mock()
+    configure = mock.Mock()
+    monkeypatch.setattr(server, "get_settings", mock.Mock(return_value=settings))
+    monkeypatch.setattr(server, "configure_cache", configure)
+    monkeypatch.setattr(server, "configure_tracing", mock.Mock())
+    monkeypatch.setattr(server, "create_mcp", mock.Mock(return_value=mcp))
+    start_calendar_index = mock.Mock()
+    monkeypatch.setattr(server, "start_calendar_index", start_calendar_index)
+
+    app = server.create_http_app()
+
+    assert app is mcp.streamable_http_app.return_value
+    configure.assert_called_once_with(settings)
+    start_calendar_index.assert_called_once_with(settings)
+    kwargs = mcp.streamable_http_app.call_args.kwargs
+    assert kwargs["stateless_http"] is True
+    assert kwargs["transport_security"].enable_dns_rebinding_protection is False
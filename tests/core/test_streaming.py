@@ -0,0 +1,81 @@
+"""Tests for the coalesced price streamer."""
+
+import anyio
+import anyio.to_thread
+
+from openmarkets.core.streaming import PriceStreamer, quote_uri
+
+
+def _run_watching(streamer: PriceStreamer, watches: list[tuple[list[str], float]], wait: float) -> list:
+    """Register watches from worker threads, as tool calls do, and collect published events."""
+    events = []
+    streamer.bus.subscribe(events.append)
+
+    async def main():
+        for symbols, duration in watches:
+            await anyio.to_thread.run_sync(streamer.watch, symbols, duration)
+        await anyio.sleep(wait)
+
+    anyio.run(main)
+    return events
+
+
+def test_quote_uri_normalises_symbol():
+    assert quote_uri("btc-usd") == "quote://BTC-USD"
+
+
+def test_watchers_of_one_symbol_share_one_poll():
+    fetched = []
+
+    def fetch(symbol):
+        fetched.append(symbol)
+        return 1.0
+
+    streamer = PriceStreamer(fetch, interval=0.01)
+
+    _run_watching(streamer, [(["BTC-USD", "ETH-USD"], 0.2), (["btc-usd"], 0.2)], wait=0.1)
+
+    # However many clients watch BTC-USD, each poll fetches it once.
+    assert fetched.count("BTC-USD") == fetched.count("ETH-USD") > 1
+
+
+def test_only_price_changes_are_published():
+    prices = iter([100.0, 100.0, 101.0])
+
+    streamer = PriceStreamer(lambda symbol: next(prices, 101.0), interval=0.01)
+
+    events = _run_watching(streamer, [(["BTC-USD"], 0.2)], wait=0.1)
+
+    assert [event.uri for event in events] == ["quote://BTC-USD"]
+    assert streamer.latest("btc-usd").price == 101.0
+
+
+def test_poller_stops_once_every_watch_lapses():
+    fetched = []
+    streamer = PriceStreamer(lambda symbol: fetched.append(symbol) or 1.0, interval=0.01)
+
+    _run_watching(streamer, [(["BTC-USD"], 0.03)], wait=0.15)
+    polls = len(fetched)
+
+    assert streamer.watched_symbols() == []
+    assert streamer.latest("BTC-USD") is None
+    assert streamer._task.done()
+    assert polls < 10
+
+
+def test_failing_symbol_does_not_stop_the_others():
+    def fetch(symbol):
+        if symbol == "BAD":
+            raise RuntimeError("upstream failed")
+        return 5.0
+
+    streamer = PriceStreamer(fetch, interval=0.01)
+    result = {}
+
+    async def main():
+        result.update(await anyio.to_thread.run_sync(streamer.watch, ["BAD", "GOOD"], 0.05))
+
+    anyio.run(main)
+
+    assert result["BAD"] is None
+    assert result["GOOD"].price == 5.0
@@ -0,0 +1,142 @@
+"""Tests for OpenTelemetry tracing of tools, repositories and caches."""
+
+import sys
+from unittest import mock
+
+import pytest
+from opentelemetry import trace
+
+from openmarkets.core import tracing
+from openmarkets.core.cache import get_cache
+from openmarkets.core.concurrency import gather
+from openmarkets.core.instrumentation import instrument_tool
+
+
+@tracing.traced_repository
+class _Repository:
+    def get_quote(self, ticker: str, session=None) -> str:
+        return get_cache().get_or_set(("quote", ticker), lambda: ticker.lower())
+
+    def get_market(self) -> str:
+        return "open"
+
+    def _helper(self) -> str:
+        return "private"
+
+
+@pytest.fixture(scope="module")
+def exporter():
+    sdk_trace = pytest.importorskip("opentelemetry.sdk.trace")
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+    provider = trace.get_tracer_provider()
+    if not isinstance(provider, sdk_trace.TracerProvider):
+        provider = sdk_trace.TracerProvider()
+        trace.set_tracer_provider(provider)
+    memory = InMemorySpanExporter()
+    provider.add_span_processor(SimpleSpanProcessor(memory))
+    return memory
+
+
+@pytest.fixture
+def spans(exporter):
+    exporter.clear()
+    yield exporter.get_finished_spans
+    exporter.clear()
+
+
+@pytest.mark.parametrize(
+    ("args", "kwargs", "expected"),
+    [(("aapl",), {}, "AAPL"), ((), {"ticker": "msft"}, "MSFT"), ((), {}, None), ((1,), {}, None)],
+)
+def test_ticker_argument(args, kwargs, expected):
+    def get_info(ticker=None, session=None):
+        return ticker
+
+    assert tracing.ticker_argument(get_info, args, kwargs) == expected
+
+
+def test_traced_repository_wraps_public_methods_only():
+    assert hasattr(_Repository.get_quote, "__wrapped__")
+    assert not hasattr(_Repository._helper, "__wrapped__")
+    assert _Repository().get_market() == "open"
+
+
+def test_aggregate_tool_span_tree(spans):
+    """Sub-calls run by gather() in worker threads are children of the tool span."""
+    repository = _Repository()
+
+    def get_full_quote(ticker: str) -> dict:
+        return gather({"quote": lambda: repository.get_quote(ticker), "market": repository.get_market})
+
+    instrument_tool(get_full_quote)("AAPL")
+    instrument_tool(get_full_quote)("AAPL")
+
+    finished = spans()
+    tools = [span for span in finished if span.name == "tool get_full_quote"]
+    quotes = [span for span in finished if span.name == "_Repository.get_quote"]
+    assert len(tools) == 2
+    assert tools[0].attributes[tracing.TICKER_ATTRIBUTE] == "AAPL"
+    assert {span.parent.span_id for span in finished if span.name.startswith("_Repository")} == {
+        tool.context.span_id for tool in tools
+    }
+    assert quotes[0].attributes[tracing.TICKER_ATTRIBUTE] == "AAPL"
+    assert [span.attributes[tracing.CACHE_HIT_ATTRIBUTE] for span in quotes] == [False, True]
+
+
+def test_upstream_request_span(spans, monkeypatch):
+    from curl_cffi.requests import Session
+
+    from openmarkets.core.http import InstrumentedSession
+
+    response = mock.Mock(status_code=200, content=b"{}")
+    monkeypatch.setattr(Session, "request", lambda self, method, url, *args, **kwargs: response)
+
+    session = InstrumentedSession()
+    session.get("https://query2.finance.yahoo.com/v10/finance/quoteSummary/AAPL?modules=price")
+    session.close()
+
+    (span,) = spans()
+    assert span.name == "GET /v10/finance/quoteSummary"
+    assert span.kind == trace.SpanKind.CLIENT
+    assert span.attributes[tracing.TICKER_ATTRIBUTE] == "AAPL"
+    assert span.attributes["http.response.body.size"] == 2
+
+
+def test_configure_tracing_none_installs_nothing(monkeypatch):
+    install = mock.Mock()
+    monkeypatch.setattr(trace, "set_tracer_provider", install)
+
+    tracing.configure_tracing(mock.Mock(tracing="none"))
+
+    install.assert_not_called()
+
+
+def test_configure_tracing_console_installs_provider(monkeypatch):
+    sdk_trace = pytest.importorskip("opentelemetry.sdk.trace")
+    install = mock.Mock()
+    monkeypatch.setattr(trace, "set_tracer_provider", install)
+
+    tracing.configure_tracing(mock.Mock(tracing="console", otlp_endpoint=None))
+
+    assert isinstance(install.call_args.args[0], sdk_trace.TracerProvider)
+
+
+def test_configure_tracing_without_sdk_fails_clearly(monkeypatch):
+    monkeypatch.setitem(sys.modules, "opentelemetry.sdk.resources", None)
+
+    with pytest.raises(RuntimeError, match="OpenTelemetry SDK"):
+        tracing.configure_tracing(mock.Mock(tracing="console", otlp_endpoint=None))
+
+
+def test_noop_tracer_stands_in_without_the_api():
+    with tracing._NoopTracer().start_as_current_span("tool x", attributes={"a": 1}) as span:
+        assert not span.is_recording()
+        span.set_attribute(tracing.TICKER_ATTRIBUTE, "AAPL")
+
+
+def test_cache_status_is_ignored_without_the_api(monkeypatch):
+    monkeypatch.setattr(tracing, "trace", None)
+
+    tracing.record_cache_status(True)
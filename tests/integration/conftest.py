@@ -14,9 +14,13 @@ def uv_index() -> str:
 
 @pytest.fixture
 def mcp_server_params(uv_index: str) -> StdioServerParameters:
-    """Create StdioServerParameters for MCP server startup."""
+    """Create StdioServerParameters for MCP server startup.
+
+    Only a few variables are inherited by stdio servers, so the test cache
+    directory is passed on explicitly.
+    """
     return StdioServerParameters(
         command="uv",
         args=["run", "openmarkets", "--transport", "stdio"],
-        env={"UV_INDEX": uv_index},
+        env={"UV_INDEX": uv_index, "CACHE_DIR": os.environ["CACHE_DIR"]},
     )
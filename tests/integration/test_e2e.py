@@ -71,17 +71,7 @@ async def test_server_starts_and_lists_resources(mcp_server_params: StdioServerP
                 template = templates.resource_templates[0]
                 result = await session.complete(
                     ref=ResourceTemplateReference(type="ref/resource", uri=template.uri_template),
-                    argument={"name": "owner", "value": "model"},
-                )
-                assert hasattr(result, "completion")
-                assert hasattr(result.completion, "values")
-                assert isinstance(result.completion.values, list)
-
-                # Complete with context - repo suggestions based on owner
-                result = await session.complete(
-                    ref=ResourceTemplateReference(type="ref/resource", uri=template.uri_template),
-                    argument={"name": "repo", "value": ""},
-                    context_arguments={"owner": "modelcontextprotocol"},
+                    argument={"name": "symbol", "value": "btc"},
                 )
                 assert hasattr(result, "completion")
                 assert hasattr(result.completion, "values")
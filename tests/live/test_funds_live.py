@@ -55,3 +55,24 @@ def test_get_fund_equity_holdings_against_real_api():
 def test_get_fund_asset_class_holdings_against_real_api():
     with tolerate_network_errors("get_fund_asset_class_holdings"):
         FundsService().get_fund_asset_class_holdings(STABLE_FUND)
+
+
+def test_get_full_fund_profile_against_real_api():
+    with tolerate_network_errors("get_full_fund_profile"):
+        result = FundsService().get_full_fund_profile(STABLE_FUND)
+
+    assert result.ticker == STABLE_FUND
+
+
+def test_get_fund_look_through_against_real_api():
+    with tolerate_network_errors("get_fund_look_through"):
+        result = FundsService().get_fund_look_through({STABLE_FUND: 60, "QQQ": 40})
+
+    assert set(result.weights) == {STABLE_FUND, "QQQ"}
+
+
+def test_get_fund_overlap_against_real_api():
+    with tolerate_network_errors("get_fund_overlap"):
+        result = FundsService().get_fund_overlap([STABLE_FUND, "VOO"])
+
+    assert len(result.overlap) == len(result.tickers)
@@ -48,44 +48,11 @@ def stock_repository() -> YFinanceStockRepository:
     return YFinanceStockRepository()
 
 
-class FakeDataFrame:
-    """Fake DataFrame for options testing."""
+class FakeDataFrame(pd.DataFrame):
+    """DataFrame built from row dictionaries for options testing."""
 
     def __init__(self, rows: list[dict[str, Any]] | None = None):
-        self._rows = rows or []
-        self.columns = list(self._rows[0].keys()) if self._rows else []
-
-    @property
-    def empty(self) -> bool:
-        return len(self._rows) == 0
-
-    def iterrows(self):
-        for i, r in enumerate(self._rows):
-
-            class Row:
-                def __init__(self, d: dict[str, Any]):
-                    self._d = d
-
-                def to_dict(self) -> dict[str, Any]:
-                    return dict(self._d)
-
-            yield i, Row(r)
-
-    def to_dict(self, orient: str | None = None) -> dict[int, dict[str, Any]] | list[dict[str, Any]]:
-        if orient == "records":
-            return [dict(r) for r in self._rows]
-        return {i: dict(r) for i, r in enumerate(self._rows)}
-
-    def __getitem__(self, key: str):
-        class Col:
-            def __init__(self, rows: list[dict[str, Any]], key: str):
-                self._rows = rows
-                self._key = key
-
-            def sum(self) -> float:
-                return sum(r.get(self._key, 0) for r in self._rows)
-
-        return Col(self._rows, key)
+        super().__init__(rows or [])
 
 
 @pytest.fixture
@@ -1,8 +1,10 @@
 """Unit tests for YFinanceCryptoRepository."""
 
+import numpy as np
 import pandas as pd
 import pytest
 
+from openmarkets.core.cache import get_cache
 from openmarkets.core.exceptions import APIError
 from openmarkets.repositories.crypto import YFinanceCryptoRepository
 from openmarkets.schemas.crypto import CryptoFastInfo, CryptoHistory
@@ -191,6 +193,94 @@ class TestYFinanceCryptoRepository:
         assert out.average_weekly_change is None
         assert out.sentiment_proxy == "Unknown"
 
+    def test_fear_greed_proxy_computes_every_symbol_of_a_basket(self, monkeypatch):
+        """Each symbol keeps its own changes, in input order; short histories are dropped."""
+        closes = {
+            "AAA-USD": [100.0, None, 104.0, 110.0],
+            "BBB-USD": [50.0, 40.0],
+            "CCC-USD": [10.0],
+        }
+
+        class T:
+            def __init__(self, t, session=None):
+                self._hist = pd.DataFrame({"Close": closes[t]})
+
+            def history(self, period="7d"):
+                return self._hist
+
+        monkeypatch.setattr("openmarkets.repositories.crypto.yf", type("Y", (), {"Ticker": T}))
+
+        out = self.repo.get_crypto_fear_greed_proxy(["AAA-USD", "BBB-USD", "CCC-USD", "AAA-USD"])
+
+        assert [entry.symbol for entry in out.crypto_data] == ["AAA-USD", "BBB-USD"]
+        assert out.crypto_data[0].weekly_change_percent == pytest.approx(10.0)
+        assert out.crypto_data[0].daily_change_percent == pytest.approx(110 / 104 * 100 - 100)
+        assert out.crypto_data[1].weekly_change_percent == pytest.approx(-20.0)
+        assert out.average_weekly_change == pytest.approx(-5.0)
+
+    def test_get_crypto_sentiment_history(self, monkeypatch):
+        """Each day averages the trailing weekly change of the assets with a full week."""
+        days = pd.date_range("2025-01-01", periods=10, freq="D", tz="UTC")
+        closes = {
+            "AAA-USD": pd.Series([100.0] * 7 + [108.0, 120.0, 130.0], index=days),
+            "BBB-USD": pd.Series([100.0] * 8 + [80.0, 80.0], index=days).iloc[1:],
+        }
+        downloads = []
+
+        class T:
+            def __init__(self, t, session=None):
+                self._t = t
+
+            def history(self, period="7d"):
+                downloads.append((self._t, period))
+                return pd.DataFrame({"Close": closes[self._t]})
+
+        monkeypatch.setattr("openmarkets.repositories.crypto.yf", type("Y", (), {"Ticker": T}))
+
+        out = self.repo.get_crypto_sentiment_history(["AAA-USD", "BBB-USD"], period="1mo")
+
+        assert [point.date.day for point in out.points] == [8, 9, 10]
+        assert [point.assets for point in out.points] == [1, 2, 2]
+        assert out.points[0].average_weekly_change == pytest.approx(8.0)
+        assert out.points[0].sentiment_proxy == "Greed"
+        assert out.points[1].average_weekly_change == pytest.approx((20.0 - 20.0) / 2)
+        assert out.points[2].average_weekly_change == pytest.approx((30.0 - 20.0) / 2)
+        assert sorted(downloads) == [("AAA-USD", "1d"), ("AAA-USD", "1mo"), ("BBB-USD", "1d"), ("BBB-USD", "1mo")]
+
+        # A repeat request is served from the cache.
+        self.repo.get_crypto_sentiment_history(["AAA-USD", "BBB-USD"], period="1mo")
+        assert len(downloads) == 4
+
+    def test_get_crypto_sentiment_history_only_refetches_the_current_day(self, monkeypatch):
+        """Settled days are cached until midnight; later requests recompute today from the latest close."""
+        days = pd.date_range(end=pd.Timestamp.now(tz="UTC").normalize(), periods=9, freq="D")
+        closes = pd.Series([100.0] * 8 + [110.0], index=days)
+        downloads = []
+
+        class T:
+            def __init__(self, t, session=None):
+                pass
+
+            def history(self, period="7d"):
+                downloads.append(period)
+                return pd.DataFrame({"Close": closes if period != "1d" else closes.tail(1)})
+
+        monkeypatch.setattr("openmarkets.repositories.crypto.yf", type("Y", (), {"Ticker": T}))
+        # Expire default-lifetime entries at once, as if the request came later in the day.
+        get_cache().default_ttl = 0
+
+        first = self.repo.get_crypto_sentiment_history(["AAA-USD"], period="1mo")
+        closes.iloc[-1] = 120.0
+        second = self.repo.get_crypto_sentiment_history(["AAA-USD"], period="1mo")
+
+        assert downloads == ["1mo", "1d", "1d"]
+        assert [point.average_weekly_change for point in first.points] == [pytest.approx(0.0), pytest.approx(10.0)]
+        assert [point.average_weekly_change for point in second.points] == [pytest.approx(0.0), pytest.approx(20.0)]
+
+    def test_get_crypto_sentiment_history_invalid_period(self):
+        with pytest.raises(ValueError):
+            self.repo.get_crypto_sentiment_history(["BTC-USD"], period="2w")
+
     def test_zero_baseline_price_yields_none_not_nan(self):
         """A zero close price must not produce NaN.
 
@@ -198,10 +288,10 @@ class TestYFinanceCryptoRepository:
         which failed every comparison in _determine_sentiment_label and so
         fell through to "Extreme Fear" - a maximally alarming, wrong signal.
         """
-        history = pd.DataFrame({"Close": [0.0, 0.0]})
+        changes = self.repo._percentage_changes(np.array([0.0, 1.0, 110.0]), np.array([0.0, np.nan, 100.0]))
 
-        assert self.repo._calculate_weekly_change(history) is None
-        assert self.repo._calculate_daily_change(history) is None
+        assert changes[:2] == [None, None]
+        assert changes[2] == pytest.approx(10.0)
 
     def test_unusable_change_does_not_poison_average(self):
         """Entries without a usable change are excluded from the average."""
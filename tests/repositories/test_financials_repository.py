@@ -1,10 +1,17 @@
 """Unit tests for YFinanceFinancialsRepository."""
 
+from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
 
 import pandas as pd
+import pytest
 
-from openmarkets.repositories.financials import YFinanceFinancialsRepository
+from openmarkets.core.exceptions import DataUnavailableError
+from openmarkets.repositories.financials import (
+    _UNSCHEDULED_REPORT_TTL,
+    YFinanceFinancialsRepository,
+    _report_ttl,
+)
 
 
 class TestYFinanceFinancialsRepository:
@@ -37,6 +44,61 @@ class TestYFinanceFinancialsRepository:
         assert isinstance(result, list)
         assert len(result) > 0
 
+    @patch("yfinance.Ticker")
+    def test_get_balance_sheet_maps_every_period(self, mock_ticker):
+        """Test each period column becomes one entry, with missing values left unset."""
+        df = pd.DataFrame(
+            {"2024-12-31": [300.0, 100.0, 7.0], "2023-12-31": [250.0, float("nan"), 7.0]},
+            index=["TotalAssets", "TotalDebt", "NotAField"],
+        )
+        mock_ticker.return_value.get_balance_sheet.return_value = df
+
+        result = self.repo.get_balance_sheet(self.ticker)
+
+        assert [(entry.date.year, entry.total_assets, entry.total_debt) for entry in result] == [
+            (2024, 300.0, 100.0),
+            (2023, 250.0, None),
+        ]
+
+    @patch("yfinance.Ticker")
+    def test_get_balance_sheet_selects_line_items(self, mock_ticker):
+        """Test only the requested line items are kept, by field name or alias."""
+        df = pd.DataFrame({"2024-12-31": [300.0, 100.0, 50.0]}, index=["TotalAssets", "TotalDebt", "NetDebt"])
+        mock_ticker.return_value.get_balance_sheet.return_value = df
+
+        (entry,) = self.repo.get_balance_sheet(self.ticker, items=["total_assets", "TotalDebt"])
+
+        assert (entry.total_assets, entry.total_debt, entry.net_debt) == (300.0, 100.0, None)
+        # Unselected line items are left out of the output, not sent as null.
+        assert entry.model_dump(mode="json", by_alias=True) == {
+            "index": "2024-12-31T00:00:00",
+            "TotalAssets": 300.0,
+            "TotalDebt": 100.0,
+        }
+
+    @patch("yfinance.Ticker")
+    def test_get_balance_sheet_rejects_unknown_line_items(self, mock_ticker):
+        """Test an item that is not a balance sheet field is reported."""
+        mock_ticker.return_value.get_balance_sheet.return_value = pd.DataFrame()
+
+        with pytest.raises(ValueError, match="total_revenue"):
+            self.repo.get_balance_sheet(self.ticker, items=["total_revenue"])
+
+    @patch("yfinance.Ticker")
+    def test_get_income_statement_caches_each_frequency(self, mock_ticker):
+        """Test quarterly periods are fetched once, newest first, and cut to ``periods``."""
+        quarters = ["2024-03-31", "2024-09-30", "2024-06-30"]
+        df = pd.DataFrame({quarter: [float(index)] for index, quarter in enumerate(quarters)}, index=["TotalRevenue"])
+        mock_ticker.return_value.get_income_stmt.return_value = df
+        mock_ticker.return_value.get_calendar.return_value = {}
+
+        latest = self.repo.get_income_statement(self.ticker, freq="quarterly", periods=2)
+        everything = self.repo.get_income_statement(self.ticker, freq="quarterly")
+
+        assert [entry.date.month for entry in latest] == [9, 6]
+        assert [entry.total_revenue for entry in everything] == [1.0, 2.0, 0.0]
+        mock_ticker.return_value.get_income_stmt.assert_called_once_with(pretty=False, freq="quarterly")
+
     @patch("yfinance.Ticker")
     def test_get_ttm_income_statement(self, mock_ticker):
         """Test TTM income statement retrieval."""
@@ -44,7 +106,7 @@ class TestYFinanceFinancialsRepository:
             [[100000], [20000]], index=["TotalRevenue", "NetIncome"], columns=[pd.Timestamp("2024-01-01")]
         )
         mock_instance = MagicMock()
-        mock_instance.ttm_income_stmt = df
+        mock_instance.get_income_stmt.return_value = df
         mock_ticker.return_value = mock_instance
 
         result = self.repo.get_ttm_income_statement(self.ticker)
@@ -59,7 +121,7 @@ class TestYFinanceFinancialsRepository:
             [[50000], [30000]], index=["OperatingCashFlow", "FreeCashFlow"], columns=[pd.Timestamp("2024-01-01")]
         )
         mock_instance = MagicMock()
-        mock_instance.ttm_cash_flow = df
+        mock_instance.get_cash_flow.return_value = df
         mock_ticker.return_value = mock_instance
 
         result = self.repo.get_ttm_cash_flow_statement(self.ticker)
@@ -114,3 +176,130 @@ class TestYFinanceFinancialsRepository:
         result = self.repo.get_eps_history(self.ticker)
 
         assert result == []
+
+    @patch("yfinance.Ticker")
+    def test_get_financial_ratios(self, mock_ticker):
+        """Test ratios are derived for every period, newest first."""
+        periods = [pd.Timestamp("2024-12-31"), pd.Timestamp("2023-12-31")]
+        income = pd.DataFrame(
+            {periods[0]: [1000.0, 400.0, 200.0, 150.0, 10.0, 0.25], periods[1]: [800.0, 300.0, 100.0, 60.0, 0.0, 0.2]},
+            index=["TotalRevenue", "GrossProfit", "EBIT", "NetIncome", "InterestExpense", "TaxRateForCalcs"],
+        )
+        balance = pd.DataFrame(
+            {periods[0]: [2000.0, 1000.0], periods[1]: [2000.0, 800.0]},
+            index=["TotalAssets", "InvestedCapital"],
+        )
+        cash_flow = pd.DataFrame({periods[0]: [100.0], periods[1]: [40.0]}, index=["FreeCashFlow"])
+        mock_ticker.return_value.get_income_stmt.return_value = income
+        mock_ticker.return_value.get_balance_sheet.return_value = balance
+        mock_ticker.return_value.get_cash_flow.return_value = cash_flow
+
+        result = self.repo.get_financial_ratios(self.ticker, ["fcf_margin", "roic", "interest_coverage", "roa"])
+
+        assert result.ratios == ["fcf_margin", "roic", "interest_coverage", "roa"]
+        assert [period.period.isoformat() for period in result.periods] == ["2024-12-31", "2023-12-31"]
+        assert result.periods[0].values == [0.1, 0.15, 20.0, 0.075]
+        # Zero interest expense yields no coverage rather than infinity.
+        assert result.periods[1].values == [0.05, 0.1, None, 0.03]
+        latest = self.repo.get_financial_ratios(self.ticker, ["roa"], periods=1)
+        assert [(period.period.year, period.values) for period in latest.periods] == [(2024, [0.075])]
+
+    @patch("yfinance.Ticker")
+    def test_get_financial_ratios_piotroski_needs_prior_period(self, mock_ticker):
+        """Test the F-score compares each period with the one before it."""
+        periods = [pd.Timestamp("2024-12-31"), pd.Timestamp("2023-12-31")]
+        income = pd.DataFrame(
+            {periods[0]: [1200.0, 600.0, 120.0], periods[1]: [1000.0, 400.0, 80.0]},
+            index=["TotalRevenue", "GrossProfit", "NetIncome"],
+        )
+        balance = pd.DataFrame(
+            {periods[0]: [1000.0, 100.0, 500.0, 200.0, 50.0], periods[1]: [1000.0, 200.0, 400.0, 200.0, 50.0]},
+            index=["TotalAssets", "LongTermDebt", "CurrentAssets", "CurrentLiabilities", "OrdinarySharesNumber"],
+        )
+        cash_flow = pd.DataFrame({periods[0]: [150.0], periods[1]: [60.0]}, index=["OperatingCashFlow"])
+        mock_ticker.return_value.get_income_stmt.return_value = income
+        mock_ticker.return_value.get_balance_sheet.return_value = balance
+        mock_ticker.return_value.get_cash_flow.return_value = cash_flow
+
+        result = self.repo.get_financial_ratios(self.ticker, ["piotroski_f"])
+
+        assert [period.values for period in result.periods] == [[9.0]]
+
+    @patch("yfinance.Ticker")
+    def test_get_financial_ratios_without_statements(self, mock_ticker):
+        """Test a ticker without statements is reported as unavailable."""
+        mock_ticker.return_value.get_income_stmt.return_value = pd.DataFrame()
+        mock_ticker.return_value.get_balance_sheet.return_value = pd.DataFrame()
+        mock_ticker.return_value.get_cash_flow.return_value = pd.DataFrame()
+
+        with pytest.raises(DataUnavailableError):
+            self.repo.get_financial_ratios(self.ticker)
+
+    @patch("yfinance.Ticker")
+    def test_statements_are_cached_across_calls(self, mock_ticker):
+        """Test a second statement request is served without a download."""
+        df = pd.DataFrame([[100000], [20000]], index=["TotalRevenue", "NetIncome"], columns=["2023-12-31"])
+        mock_ticker.return_value.get_income_stmt.return_value = df
+        mock_ticker.return_value.get_calendar.return_value = {}
+
+        self.repo.get_income_statement(self.ticker)
+        self.repo.get_income_statement(self.ticker)
+
+        assert mock_ticker.return_value.get_income_stmt.call_count == 1
+
+    @patch("yfinance.Ticker")
+    def test_get_earnings_surprises(self, mock_ticker):
+        """Test surprises, streaks and next report dates are summarised per ticker."""
+        now = pd.Timestamp.now(tz="UTC").normalize()
+        earnings = pd.DataFrame(
+            {
+                "EPS Estimate": [1.5, 1.0, 1.0, 1.0, 1.0],
+                "Reported EPS": [float("nan"), 1.2, 1.1, 0.9, 1.05],
+                "Surprise(%)": [float("nan"), 20.0, 10.0, -10.0, 5.0],
+            },
+            index=pd.DatetimeIndex([now + pd.Timedelta(days=d) for d in (30, -60, -150, -240, -330)]),
+        )
+
+        def ticker(symbol, session=None):
+            stock = MagicMock()
+            stock.get_calendar.return_value = {}
+            stock.get_earnings_dates.return_value = None if symbol == "NONE" else earnings
+            return stock
+
+        mock_ticker.side_effect = ticker
+
+        result = self.repo.get_earnings_surprises(["msft", "none", "MSFT"], quarters=3)
+
+        (row,) = result.rows
+        assert (row.ticker, row.beats, row.misses, row.streak) == ("MSFT", 2, 1, 2)
+        assert (row.last_surprise_pct, row.average_surprise_pct) == (20.0, 20 / 3)
+        assert row.next_report_date == (now + pd.Timedelta(days=30)).to_pydatetime()
+        assert row.last_report_date == (now - pd.Timedelta(days=60)).to_pydatetime()
+        assert result.unavailable == ["NONE"]
+
+
+@pytest.mark.parametrize(
+    ("report_offsets", "expected_days"),
+    [
+        ([10], 12),
+        ([-1], 1),
+        ([-1, 90], 1),
+        ([-5, 85], 87),
+        ([-5], None),
+        ([], None),
+    ],
+)
+@patch("yfinance.Ticker")
+def test_report_ttl_runs_to_the_next_report(mock_ticker, report_offsets, expected_days):
+    """Statements stay valid until the next report's grace window ends."""
+    today = datetime.now(timezone.utc).date()
+    mock_ticker.return_value.get_calendar.return_value = {
+        "Earnings Date": [today + timedelta(days=offset) for offset in report_offsets]
+    }
+
+    ttl = _report_ttl("AAPL", None)
+
+    if expected_days is None:
+        assert ttl == _UNSCHEDULED_REPORT_TTL
+    else:
+        assert timedelta(days=expected_days - 1) < timedelta(seconds=ttl) <= timedelta(days=expected_days)
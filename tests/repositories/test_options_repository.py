@@ -1,10 +1,14 @@
 """Unit tests for YFinanceOptionsRepository."""
 
+import logging
+from types import SimpleNamespace
+
 import pandas as pd
 import pytest
+from yfinance.exceptions import YFException
 
 from openmarkets.core.exceptions import DataUnavailableError
-from openmarkets.repositories.options import YFinanceOptionsRepository
+from openmarkets.repositories.options import YFinanceOptionsRepository, _ContractColumns, _OptionChain
 from openmarkets.schemas.options import OptionExpirationDate
 
 
@@ -93,7 +97,7 @@ def test_get_call_put_options_nonempty(
     chain = dummy_option_chain(calls=calls, puts=puts, underlying={"symbol": "AAPL"})
     monkeypatch.setattr(
         "openmarkets.repositories.options.yf",
-        type("Y", (), {"Ticker": lambda t, session=None: dummy_ticker(option_chain=chain)}),
+        type("Y", (), {"Ticker": lambda t, session=None: dummy_ticker(options=["2023-01-01"], option_chain=chain)}),
     )
     calls_res = options_repository.get_call_options("AAPL")
     puts_res = options_repository.get_put_options("AAPL")
@@ -101,6 +105,51 @@ def test_get_call_put_options_nonempty(
     assert isinstance(puts_res, list) and puts_res[0].strike == 90
 
 
+def test_get_option_chain_no_expirations(options_repository, monkeypatch, dummy_ticker):
+    """A ticker without listed options is reported rather than crashing."""
+    monkeypatch.setattr(
+        "openmarkets.repositories.options.yf",
+        type("Y", (), {"Ticker": lambda t, session=None: dummy_ticker(options=[])}),
+    )
+    with pytest.raises(DataUnavailableError):
+        options_repository.get_option_chain("AAPL")
+    assert options_repository.get_call_options("AAPL") is None
+
+
+def test_options_tools_share_one_chain_download(
+    options_repository, monkeypatch, dummy_option_chain, sample_call_option_data, sample_put_option_data
+):
+    """Exploring one expiration across tools downloads the chain and expiration list once."""
+    downloads = {"options": 0, "chains": []}
+
+    class CountingTicker:
+        def __init__(self, t, session=None):
+            self.info = {"currentPrice": 100}
+
+        @property
+        def options(self):
+            downloads["options"] += 1
+            return ("2023-01-01", "2023-02-01")
+
+        def option_chain(self, date=None):
+            downloads["chains"].append(date)
+            return dummy_option_chain(
+                calls=pd.DataFrame([sample_call_option_data]),
+                puts=pd.DataFrame([sample_put_option_data]),
+                underlying={"regularMarketPrice": 100.0},
+            )
+
+    monkeypatch.setattr("openmarkets.repositories.options.yf", type("Y", (), {"Ticker": CountingTicker}))
+
+    options_repository.get_option_chain("AAPL")
+    options_repository.get_options_volume_analysis("AAPL")
+    options_repository.get_options_by_moneyness("AAPL", "2023-01-01")
+    options_repository.get_options_skew("AAPL")
+    options_repository.get_option_expiration_dates("aapl")
+
+    assert downloads == {"options": 1, "chains": ["2023-01-01"]}
+
+
 def test_get_options_volume_analysis_no_expirations(options_repository, monkeypatch, dummy_ticker):
     """Test volume analysis when no expirations available."""
     monkeypatch.setattr(
@@ -160,6 +209,49 @@ def test_get_options_by_moneyness_success(options_repository, monkeypatch, dummy
     assert res.calls and res.puts
 
 
+def test_get_options_by_moneyness_prefers_chain_quote(options_repository, monkeypatch, dummy_option_chain):
+    """The price embedded in the chain response spares the quote summary download."""
+    chain = dummy_option_chain(
+        calls=pd.DataFrame([{"strike": 105.0}]),
+        puts=pd.DataFrame([{"strike": 95.0}]),
+        underlying={"regularMarketPrice": 100.0},
+    )
+
+    class Maker:
+        options = ["2023-01-01"]
+
+        def __init__(self, t, session=None):
+            pass
+
+        @property
+        def info(self):
+            raise AssertionError("info must not be downloaded")
+
+        def option_chain(self, date=None):
+            return chain
+
+    monkeypatch.setattr("openmarkets.repositories.options.yf", type("Y", (), {"Ticker": Maker}))
+    res = options_repository.get_options_by_moneyness("AAPL")
+    assert res.current_price == 100.0
+
+
+@pytest.mark.parametrize(
+    ("fast_info", "info", "expected"),
+    [
+        (SimpleNamespace(last_price=101.5), {"currentPrice": 1.0}, 101.5),
+        (SimpleNamespace(last_price=float("nan")), {"currentPrice": 99.0}, 99.0),
+        (None, {"regularMarketPrice": 98.0}, 98.0),
+        (None, {}, None),
+    ],
+)
+def test_get_underlying_price_fallbacks(options_repository, fast_info, info, expected):
+    """Without a chain quote the fast quote path is tried before ``info``."""
+    stock = SimpleNamespace(info=info)
+    if fast_info is not None:
+        stock.fast_info = fast_info
+    assert options_repository._get_underlying_price(stock) == expected
+
+
 def test_get_options_skew_no_expirations(options_repository, monkeypatch, dummy_ticker):
     """Test options skew when no expirations available."""
 
@@ -266,7 +358,7 @@ def test_get_option_chain_with_data(
     chain = dummy_option_chain(calls=calls, puts=puts, underlying={"symbol": "AAPL"})
     monkeypatch.setattr(
         "openmarkets.repositories.options.yf",
-        type("Y", (), {"Ticker": lambda t, session=None: dummy_ticker(option_chain=chain)}),
+        type("Y", (), {"Ticker": lambda t, session=None: dummy_ticker(options=["2023-01-01"], option_chain=chain)}),
     )
     result = options_repository.get_option_chain("AAPL")
     assert result.calls is not None
@@ -275,6 +367,34 @@ def test_get_option_chain_with_data(
     assert len(result.puts) == 1
 
 
+def test_get_option_chain_columns_layout(options_repository, monkeypatch, dummy_ticker, sample_call_option_data):
+    """The columns layout converts each array once and builds no per-contract models."""
+    second = {**sample_call_option_data, "contractSymbol": "C2", "strike": 110, "volume": None}
+    chain = SimpleNamespace(
+        calls=pd.DataFrame([sample_call_option_data, second]), puts=pd.DataFrame(), underlying={"symbol": "AAPL"}
+    )
+    monkeypatch.setattr(
+        "openmarkets.repositories.options.yf",
+        type("Y", (), {"Ticker": lambda t, session=None: dummy_ticker(options=["2023-01-01"], option_chain=chain)}),
+    )
+    rows = options_repository.get_call_options("AAPL")
+
+    def no_rows(**kwargs):
+        raise AssertionError("a per-contract model was built")
+
+    monkeypatch.setattr("openmarkets.repositories.options.CallOption", no_rows)
+    result = options_repository.get_option_chain("AAPL", layout="columns")
+    columns = options_repository.get_call_options("AAPL", layout="columns")
+
+    assert result.calls is None and result.put_columns is None
+    assert result.call_columns == columns
+    assert columns.contract_symbol == ["C1", "C2"]
+    assert columns.strike == [100.0, 110.0]
+    assert columns.volume == [10.0, None]
+    assert columns.last_trade_date == [row.last_trade_date for row in rows]
+    assert options_repository.get_put_options("AAPL", layout="columns") is None
+
+
 def test_get_options_by_moneyness_no_chain(options_repository, monkeypatch, dummy_ticker):
     """Test get_options_by_moneyness when chain is not available."""
 
@@ -299,9 +419,33 @@ def test_safe_ratio_zero_denominator(options_repository):
 
 def test_get_column_sum_missing_column(options_repository, fake_dataframe):
     """Test _get_column_sum with missing column."""
-    df = fake_dataframe([{"volume": 10}])
-    assert options_repository._get_column_sum(df, "volume") == 10
-    assert options_repository._get_column_sum(df, "missing_col") == 0
+    contracts = _ContractColumns.from_frame(fake_dataframe([{"volume": 10}, {"volume": None}]))
+    assert options_repository._get_column_sum(contracts, "volume") == 10
+    assert options_repository._get_column_sum(contracts, "missing_col") == 0
+
+
+def test_contract_columns_from_frame_and_stacked(fake_dataframe):
+    """Chains are held as typed arrays; stacking pads columns missing on one side."""
+    calls = _ContractColumns.from_frame(
+        fake_dataframe([{"contractSymbol": "C1", "strike": 100, "volume": None, "inTheMoney": True}])
+    )
+    puts = _ContractColumns.from_frame(fake_dataframe([{"contractSymbol": "P1", "strike": 95, "bid": 1.5}]))
+
+    assert calls["strike"].dtype == float
+    assert calls["contractSymbol"].dtype == object
+    assert len(_ContractColumns.from_frame(None)) == 0
+
+    stacked = _OptionChain(calls=calls, puts=puts, underlying={}).stacked()
+
+    assert stacked["is_call"].tolist() == [True, False]
+    assert stacked["strike"].tolist() == [100.0, 95.0]
+    assert stacked.values("impliedVolatility").shape == (2,)
+    assert stacked.records(["contractSymbol", "inTheMoney"]) == [
+        {"contractSymbol": "C1", "inTheMoney": True},
+        {"contractSymbol": "P1", "inTheMoney": None},
+    ]
+    assert pd.isna(stacked.records()[1]["volume"]) and stacked.records()[1]["bid"] == 1.5
+    assert stacked.select(stacked["is_call"]).records(["strike"]) == [{"strike": 100.0}]
 
 
 def test_option_chain_exception_handling(options_repository, monkeypatch):
@@ -317,3 +461,277 @@ def test_option_chain_exception_handling(options_repository, monkeypatch):
     monkeypatch.setattr("openmarkets.repositories.options.yf", type("Y", (), {"Ticker": FailingTicker}))
     with pytest.raises(DataUnavailableError):
         options_repository.get_options_volume_analysis("AAPL")
+
+
+def test_get_option_greeks(options_repository, monkeypatch, dummy_ticker, dummy_option_chain):
+    """Greeks are computed column-wise and IV is re-solved from the midpoint."""
+    from openmarkets.core import black_scholes
+
+    repository = options_repository
+    monkeypatch.setattr(repository, "_years_to_expiry", lambda expiration: 0.25)
+    strikes = [90.0, 100.0, 110.0]
+    quotes = {side: black_scholes.price(side == "call", 100, strikes, 0.25, 0.05, 0.3) for side in ("call", "put")}
+
+    def side(prefix, prices):
+        return pd.DataFrame(
+            {
+                "contractSymbol": [f"{prefix}{int(strike)}" for strike in strikes],
+                "strike": strikes,
+                "bid": prices - 0.05,
+                "ask": prices + 0.05,
+                "lastPrice": prices,
+                "impliedVolatility": [0.31, 0.29, 0.32],
+                "volume": [10, None, 30],
+                "openInterest": [100, 200, 300],
+            }
+        )
+
+    # The last put is quoted below intrinsic value and falls back to Yahoo's IV.
+    puts = side("P", quotes["put"])
+    puts.loc[2, ["bid", "ask"]] = [5.0, 5.0]
+    chain = dummy_option_chain(calls=side("C", quotes["call"]), puts=puts, underlying={"regularMarketPrice": 100.0})
+    monkeypatch.setattr(
+        "openmarkets.repositories.options.yf",
+        type("Y", (), {"Ticker": lambda t, session=None: dummy_ticker(options=["2030-01-18"], option_chain=chain)}),
+    )
+
+    result = repository.get_option_greeks("AAPL", risk_free_rate=0.05)
+
+    assert result.expiration.isoformat() == "2030-01-18"
+    assert result.underlying_price == 100.0
+    assert [contract.option_type for contract in result.contracts] == ["call"] * 3 + ["put"] * 3
+    assert all(contract.implied_volatility == pytest.approx(0.3, abs=1e-4) for contract in result.contracts[:5])
+    call_atm, put_atm = result.contracts[1], result.contracts[4]
+    assert call_atm.delta - put_atm.delta == pytest.approx(1.0)
+    assert call_atm.gamma == pytest.approx(put_atm.gamma)
+    assert call_atm.volume is None
+    stale = result.contracts[5]
+    assert stale.implied_volatility is None
+    assert stale.quoted_implied_volatility == 0.32
+    assert stale.delta is not None
+
+
+def test_get_option_greeks_columns_match_rows(options_repository, monkeypatch, dummy_ticker):
+    """The columns layout carries the same values, in the same order, as the rows."""
+    monkeypatch.setattr(options_repository, "_years_to_expiry", lambda expiration: 0.25)
+    frame = pd.DataFrame(
+        {
+            "contractSymbol": ["C90", "C100"],
+            "strike": [90.0, 100.0],
+            "bid": [10.5, 2.9],
+            "ask": [10.7, 3.1],
+            "lastPrice": [10.6, 3.0],
+            "impliedVolatility": [0.3, 0.3],
+            "volume": [10, None],
+            "openInterest": [100, 200],
+        }
+    )
+    chain = SimpleNamespace(calls=frame, puts=None, underlying={"regularMarketPrice": 100.0})
+    monkeypatch.setattr(
+        "openmarkets.repositories.options.yf",
+        type("Y", (), {"Ticker": lambda t, session=None: dummy_ticker(options=["2030-01-18"], option_chain=chain)}),
+    )
+
+    rows = options_repository.get_option_greeks("AAPL")
+    columns = options_repository.get_option_greeks("AAPL", layout="columns")
+
+    assert rows.columns is None and columns.contracts is None
+    assert columns.columns.contract_symbol == ["C90", "C100"]
+    assert columns.columns.delta == [contract.delta for contract in rows.contracts]
+    assert columns.columns.volume == [10.0, None]
+
+
+def test_get_option_greeks_no_chain(options_repository, monkeypatch, dummy_ticker):
+    monkeypatch.setattr(
+        "openmarkets.repositories.options.yf",
+        type("Y", (), {"Ticker": lambda t, session=None: dummy_ticker(options=[])}),
+    )
+
+    with pytest.raises(DataUnavailableError):
+        options_repository.get_option_greeks("AAPL")
+
+
+def test_get_volatility_surface(options_repository, monkeypatch, dummy_option_chain):
+    """Rows per expiration, columns per strike, out-of-the-money side per cell."""
+    from openmarkets.core import black_scholes
+
+    monkeypatch.setattr(
+        options_repository,
+        "_years_to_expiry",
+        lambda expiration: {2030: 0.25, 2031: 0.5}[expiration.year],
+    )
+    volatility = {"2030-01-18": 0.3, "2031-01-17": 0.4}
+
+    def side(expiration, is_call, strikes):
+        prices = black_scholes.price(
+            is_call, 100, strikes, 0.25 if expiration < "2031" else 0.5, 0.04, volatility[expiration]
+        )
+        return pd.DataFrame({"strike": strikes, "bid": prices, "ask": prices, "impliedVolatility": 0.99})
+
+    class Ticker:
+        options = ["2030-01-18", "2031-01-17", "2032-01-16"]
+        requested: list[str] = []
+
+        def option_chain(self, date: str):
+            self.requested.append(date)
+            if date == "2032-01-16":
+                raise ValueError("upstream failed")
+            strikes = [80.0, 95.0, 100.0, 110.0, 150.0] if date < "2031" else [95.0, 105.0]
+            return dummy_option_chain(
+                calls=side(date, True, strikes),
+                puts=side(date, False, strikes),
+                underlying={"regularMarketPrice": 100.0},
+            )
+
+    monkeypatch.setattr(
+        "openmarkets.repositories.options.yf", type("Y", (), {"Ticker": lambda t, session=None: Ticker()})
+    )
+
+    result = options_repository.get_volatility_surface("AAPL", max_expirations=3, moneyness_range=0.2)
+
+    assert sorted(Ticker.requested) == ["2030-01-18", "2031-01-17", "2032-01-16"]
+    assert [expiration.isoformat() for expiration in result.expirations] == ["2030-01-18", "2031-01-17"]
+    assert result.time_to_expiry == [0.25, 0.5]
+    assert result.strikes == [80.0, 95.0, 100.0, 105.0, 110.0]
+    assert result.moneyness == pytest.approx([0.8, 0.95, 1.0, 1.05, 1.1])
+    first, second = result.implied_volatility
+    assert first[3] is None and second[0] is None
+    assert [value for value in first if value is not None] == pytest.approx([0.3] * 4, abs=1e-4)
+    assert [value for value in second if value is not None] == pytest.approx([0.4] * 2, abs=1e-4)
+
+
+def test_get_volatility_surface_no_expirations(options_repository, monkeypatch, dummy_ticker):
+    monkeypatch.setattr(
+        "openmarkets.repositories.options.yf",
+        type("Y", (), {"Ticker": lambda t, session=None: dummy_ticker(options=[])}),
+    )
+
+    with pytest.raises(DataUnavailableError):
+        options_repository.get_volatility_surface("AAPL")
+
+
+def test_get_options_positioning(options_repository, monkeypatch, dummy_ticker, dummy_option_chain):
+    """Max pain, gamma exposure and walls are computed from the whole chain."""
+    monkeypatch.setattr(options_repository, "_years_to_expiry", lambda expiration: 0.1)
+    strikes = [90.0, 100.0, 110.0]
+
+    def side(open_interest):
+        return pd.DataFrame(
+            {"strike": strikes, "bid": 0.0, "ask": 0.0, "impliedVolatility": 0.3, "openInterest": open_interest}
+        )
+
+    chain = dummy_option_chain(
+        calls=side([0, 100, 500]), puts=side([400, 300, None]), underlying={"regularMarketPrice": 100.0}
+    )
+    monkeypatch.setattr(
+        "openmarkets.repositories.options.yf",
+        type("Y", (), {"Ticker": lambda t, session=None: dummy_ticker(options=["2030-01-18"], option_chain=chain)}),
+    )
+
+    result = options_repository.get_options_positioning("AAPL", top_n=2)
+
+    # Holder payout settling at 90: 300 puts x 10 = 3000; at 100: nothing;
+    # at 110: 100 calls x 10 = 1000.
+    assert result.max_pain == 100.0
+    assert result.total_call_open_interest == 600
+    assert result.total_put_open_interest == 700
+    assert [wall.strike for wall in result.call_walls] == [110.0, 100.0]
+    assert [wall.strike for wall in result.put_walls] == [90.0, 100.0]
+    # At the money 100 calls face 300 puts of equal gamma: dealers are net short gamma.
+    by_strike = {point.strike: point.gamma_exposure for point in result.gamma_exposure_by_strike}
+    assert len(by_strike) == 2
+    assert by_strike[100.0] < 0
+    assert result.net_gamma_exposure < 0
+
+
+def test_get_options_scan_ranks_tickers(options_repository, monkeypatch, dummy_ticker, dummy_option_chain):
+    """Tickers are ranked by the metric; those without options are reported apart."""
+
+    def chain(call_oi, put_oi):
+        def side(open_interest, volatility):
+            return pd.DataFrame(
+                {"strike": [95.0, 105.0], "volume": 1.0, "openInterest": open_interest, "impliedVolatility": volatility}
+            )
+
+        return dummy_option_chain(
+            calls=side(call_oi, [0.2, 0.4]), puts=side(put_oi, [0.3, 0.5]), underlying={"regularMarketPrice": 96.0}
+        )
+
+    tickers = {
+        "LOW": dummy_ticker(options=["2030-01-18"], option_chain=chain([50, 50], [10, 10])),
+        "HIGH": dummy_ticker(options=["2030-01-18"], option_chain=chain([10, 10], [50, 50])),
+        "NONE": dummy_ticker(options=[]),
+    }
+    monkeypatch.setattr(
+        "openmarkets.repositories.options.yf",
+        type("Y", (), {"Ticker": lambda t, session=None: tickers[t]}),
+    )
+
+    result = options_repository.get_options_scan(["low", "NONE", "HIGH", "LOW"])
+
+    assert [row.ticker for row in result.rows] == ["HIGH", "LOW"]
+    assert result.rows[0].put_call_ratio_oi == 5.0
+    assert result.rows[0].total_put_volume == 2.0
+    # Nearest strike to 96 is 95: mean of the 0.2 call and 0.3 put.
+    assert result.rows[0].atm_implied_volatility == pytest.approx(0.25)
+    assert result.unavailable == ["NONE"]
+
+
+def test_get_options_scan_isolates_failing_tickers(options_repository, monkeypatch, dummy_ticker, dummy_option_chain):
+    """A failing chain download drops only its ticker, and no quote summary is fetched for the spot."""
+
+    class Ticker(dummy_ticker):
+        fast_info = None
+
+        @property
+        def info(self):
+            raise AssertionError("the scan must not download the quote summary")
+
+        @info.setter
+        def info(self, value):
+            pass
+
+        def option_chain(self, date=None):
+            if self._option_chain is None:
+                raise ValueError("upstream failed")
+            return self._option_chain
+
+    side = pd.DataFrame({"strike": [100.0], "volume": 1.0, "openInterest": 1.0, "impliedVolatility": 0.2})
+    tickers = {
+        "OK": Ticker(options=["2030-01-18"], option_chain=dummy_option_chain(calls=side, puts=side)),
+        "BROKEN": Ticker(options=["2030-01-18"]),
+    }
+    monkeypatch.setattr(
+        "openmarkets.repositories.options.yf",
+        type("Y", (), {"Ticker": lambda t, session=None: tickers[t]}),
+    )
+
+    result = options_repository.get_options_scan(["OK", "BROKEN"])
+
+    assert [row.ticker for row in result.rows] == ["OK"]
+    assert result.rows[0].underlying_price is None
+    assert result.unavailable == ["BROKEN"]
+
+
+def test_get_options_scan_logs_failing_tickers(options_repository, monkeypatch, dummy_ticker, caplog):
+    """An upstream error drops its ticker and is logged at debug level."""
+
+    class Ticker(dummy_ticker):
+        @property
+        def options(self):
+            raise YFException("rate limited")
+
+        @options.setter
+        def options(self, value):
+            pass
+
+    monkeypatch.setattr(
+        "openmarkets.repositories.options.yf",
+        type("Y", (), {"Ticker": lambda t, session=None: Ticker()}),
+    )
+
+    with caplog.at_level(logging.DEBUG, logger="openmarkets.repositories.options"):
+        result = options_repository.get_options_scan(["FAIL"])
+
+    assert result.unavailable == ["FAIL"]
+    assert "Options scan of FAIL failed." in caplog.messages
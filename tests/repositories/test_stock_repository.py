@@ -9,6 +9,7 @@ import pandas as pd
 import pytest
 from pydantic import BaseModel
 
+from openmarkets.repositories.stock import DEFAULT_FUNDAMENTAL_METRICS
 from openmarkets.schemas.stock import (
     CorporateActions,
     NewsItem,
@@ -307,3 +308,80 @@ def test_get_valuation_history_forwards_freq_and_periods(stock_repository, stock
     stock_repository.get_valuation_history(stock_ticker, freq="yearly", periods=2)
 
     assert captured == {"freq": "yearly", "periods": 2}
+
+
+def test_info_based_methods_share_one_download(stock_repository, stock_ticker, patch_yf):
+    downloads = []
+
+    class FakeTicker:
+        def __init__(self, ticker: str, session=None):
+            pass
+
+        @property
+        def info(self):
+            downloads.append(1)
+            return {"currentPrice": 150.0, "auditRisk": 1}
+
+    patch_yf("openmarkets.repositories.stock", SimpleNamespace(Ticker=FakeTicker))
+
+    stock_repository.get_risk_metrics(stock_ticker)
+    stock_repository.get_quick_technical_indicators(stock_ticker.lower())
+
+    assert len(downloads) == 1
+
+
+@pytest.mark.parametrize(("last_price", "expected"), [(101.5, 101.5), (float("nan"), None), (None, None)])
+def test_get_last_price_reads_fast_info_price(stock_repository, stock_ticker, patch_yf, last_price, expected):
+    class FakeTicker:
+        def __init__(self, ticker: str, session=None):
+            self.fast_info = SimpleNamespace(last_price=last_price)
+
+    patch_yf("openmarkets.repositories.stock", SimpleNamespace(Ticker=FakeTicker))
+
+    assert stock_repository.get_last_price(stock_ticker) == expected
+
+
+def test_compare_fundamentals_builds_ticker_by_metric_matrix(stock_repository, patch_yf):
+    downloads = []
+
+    class FakeTicker:
+        def __init__(self, ticker: str, session=None):
+            self.ticker = ticker
+
+        @property
+        def info(self):
+            downloads.append(self.ticker)
+            if self.ticker == "BAD":
+                raise ValueError("not found")
+            if self.ticker == "ODD":
+                return {"trailingPE": "n/a"}
+            return {"trailingPE": 20.0 if self.ticker == "AMD" else 30.0, "marketCap": 1_000}
+
+    patch_yf("openmarkets.repositories.stock", SimpleNamespace(Ticker=FakeTicker))
+    stock_repository.get_info("AMD")
+
+    result = stock_repository.compare_fundamentals(
+        ["amd", "nvda", "bad", "odd", "AMD"], ["trailing_pe", "market_cap", "beta"]
+    )
+
+    assert result.metrics == ["trailing_pe", "market_cap", "beta"]
+    assert [(row.ticker, row.values) for row in result.rows] == [
+        ("AMD", [20.0, 1_000, None]),
+        ("NVDA", [30.0, 1_000, None]),
+    ]
+    assert result.unavailable == ["BAD", "ODD"]
+    # AMD's summary came from the cache filled by get_info.
+    assert sorted(downloads) == ["AMD", "BAD", "NVDA", "ODD"]
+
+
+def test_compare_fundamentals_defaults_to_every_metric(stock_repository, patch_yf):
+    class FakeTicker:
+        def __init__(self, ticker: str, session=None):
+            self.info = {"beta": 1.2}
+
+    patch_yf("openmarkets.repositories.stock", SimpleNamespace(Ticker=FakeTicker))
+
+    result = stock_repository.compare_fundamentals(["AMD"])
+
+    assert result.metrics == list(DEFAULT_FUNDAMENTAL_METRICS)
+    assert result.rows[0].values[result.metrics.index("beta")] == 1.2
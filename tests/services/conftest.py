@@ -79,6 +79,14 @@ class StockRepositorySpy:
         self.calls.append(("get_valuation_history", ticker, freq, periods, session))
         return []
 
+    def get_last_price(self, ticker: str, session: Session | None = None) -> float | None:
+        self.calls.append(("get_last_price", ticker, session))
+        return 42.0
+
+    def compare_fundamentals(self, tickers: list[str], metrics: list[str] | None = None, session=None) -> dict:
+        self.calls.append(("compare_fundamentals", tickers, metrics, session))
+        return {}
+
 
 class McpToolRegistrySpy:
     """Captures functions decorated via mcp.tool()."""
@@ -7,11 +7,17 @@ from openmarkets.schemas.options import (
     CallOption,
     OptionContractChain,
     OptionExpirationDate,
+    OptionGreeks,
+    OptionGreeksChain,
     OptionsByMoneyness,
+    OptionsPositioning,
+    OptionsScan,
+    OptionsScanRow,
     OptionsSkew,
     OptionsVolumeAnalysis,
     PriceRange,
     PutOption,
+    VolatilitySurface,
 )
 from openmarkets.services.options import OptionsService
 
@@ -54,10 +60,11 @@ class OptionsRepositoryStub:
     def get_option_expiration_dates(self, ticker: str, session=None):
         return [OptionExpirationDate(date=datetime(2025, 12, 19))]
 
-    def get_option_chain(self, ticker: str, expiration=None, session=None):
+    def get_option_chain(self, ticker: str, expiration=None, layout="rows", session=None):
+        self.chain_layout = layout
         return OptionContractChain(calls=[], puts=[], underlying=None)
 
-    def get_call_options(self, ticker: str, expiration=None, session=None):
+    def get_call_options(self, ticker: str, expiration=None, layout="rows", session=None):
         return [
             CallOption(
                 contractSymbol="AAPL231215C00100000",
@@ -77,7 +84,7 @@ class OptionsRepositoryStub:
             )
         ]
 
-    def get_put_options(self, ticker: str, expiration=None, session=None):
+    def get_put_options(self, ticker: str, expiration=None, layout="rows", session=None):
         return [
             PutOption(
                 contractSymbol="AAPL231215P00100000",
@@ -113,6 +120,57 @@ class OptionsRepositoryStub:
     def get_options_skew(self, ticker: str, expiration_date=None, session=None):
         return OptionsSkew(call_skew=[], put_skew=[])
 
+    def get_option_greeks(
+        self, ticker: str, expiration=None, risk_free_rate=0.04, dividend_yield=0.0, layout="rows", session=None
+    ):
+        self.greeks_arguments = (expiration, risk_free_rate, dividend_yield, layout)
+        return OptionGreeksChain(
+            expiration=date(2025, 12, 19),
+            underlying_price=100.0,
+            time_to_expiry=0.1,
+            risk_free_rate=risk_free_rate,
+            dividend_yield=dividend_yield,
+            contracts=[OptionGreeks(contract_symbol="AAPL251219C00100000", option_type="call", strike=100, delta=0.5)],
+        )
+
+    def get_volatility_surface(self, ticker: str, max_expirations=6, moneyness_range=0.2, session=None):
+        return VolatilitySurface(
+            underlying_price=100.0,
+            expirations=[date(2025, 12, 19)][:max_expirations],
+            time_to_expiry=[0.1],
+            strikes=[95.0, 105.0],
+            moneyness=[0.95, 1.05],
+            implied_volatility=[[0.25, None]],
+        )
+
+    def get_options_positioning(self, ticker: str, expiration_date=None, top_n=5, session=None):
+        return OptionsPositioning(
+            expiration=date(2025, 12, 19),
+            underlying_price=100.0,
+            max_pain=100.0,
+            total_call_open_interest=10,
+            total_put_open_interest=20,
+            net_gamma_exposure=-1.0,
+            gamma_exposure_by_strike=[],
+            call_walls=[],
+            put_walls=[],
+        )
+
+    def get_options_scan(self, tickers, sort_by="put_call_ratio_oi", session=None):
+        row = OptionsScanRow(
+            ticker=tickers[0],
+            expiration=date(2025, 12, 19),
+            underlying_price=100.0,
+            atm_implied_volatility=0.3,
+            total_call_volume=10,
+            total_put_volume=20,
+            total_call_open_interest=5,
+            total_put_open_interest=15,
+            put_call_ratio_volume=2.0,
+            put_call_ratio_oi=3.0,
+        )
+        return OptionsScan(sort_by=sort_by, rows=[row], unavailable=tickers[1:])
+
 
 @pytest.fixture
 def options_service() -> OptionsService:
@@ -129,6 +187,12 @@ def test_get_option_chain(options_service):
     result = options_service.get_option_chain("AAPL", date(2025, 12, 19))
     assert hasattr(result, "calls")
     assert hasattr(result, "puts")
+    assert options_service.repository.chain_layout == "rows"
+
+
+def test_get_option_chain_passes_the_layout(options_service):
+    options_service.get_option_chain("AAPL", date(2025, 12, 19), layout="columns")
+    assert options_service.repository.chain_layout == "columns"
 
 
 def test_get_call_options(options_service):
@@ -172,3 +236,30 @@ def test_get_options_skew(options_service):
     assert isinstance(result, OptionsSkew)
     assert result.call_skew == []
     assert result.put_skew == []
+
+
+def test_get_option_greeks(options_service):
+    result = options_service.get_option_greeks("AAPL", date(2025, 12, 19), risk_free_rate=0.05, dividend_yield=0.01)
+    assert isinstance(result, OptionGreeksChain)
+    assert result.contracts[0].delta == 0.5
+    assert options_service.repository.greeks_arguments == (date(2025, 12, 19), 0.05, 0.01, "rows")
+
+
+def test_get_volatility_surface(options_service):
+    result = options_service.get_volatility_surface("AAPL", max_expirations=1, moneyness_range=0.1)
+    assert isinstance(result, VolatilitySurface)
+    assert result.implied_volatility == [[0.25, None]]
+
+
+def test_get_options_positioning(options_service):
+    result = options_service.get_options_positioning("AAPL", "2025-12-19", top_n=3)
+    assert isinstance(result, OptionsPositioning)
+    assert result.max_pain == 100.0
+
+
+def test_get_options_scan(options_service):
+    result = options_service.get_options_scan(["AAPL", "NOPE"], sort_by="atm_implied_volatility")
+    assert isinstance(result, OptionsScan)
+    assert result.sort_by == "atm_implied_volatility"
+    assert [row.ticker for row in result.rows] == ["AAPL"]
+    assert result.unavailable == ["NOPE"]
@@ -1,3 +1,7 @@
+import anyio
+import anyio.to_thread
+
+
 def test_stock_service_delegates_to_repository(stock_service, stock_repository_spy):
     ticker = "A"
 
@@ -15,6 +19,7 @@ def test_stock_service_delegates_to_repository(stock_service, stock_repository_s
     assert stock_service.get_corporate_actions(ticker) == []
     assert stock_service.get_news(ticker) == []
     assert stock_service.get_valuation_history(ticker) == []
+    assert stock_service.compare_fundamentals([ticker], ["trailing_pe"]) == {}
 
     assert stock_repository_spy.calls == [
         ("get_fast_info", ticker, stock_service.session),
@@ -31,4 +36,24 @@ def test_stock_service_delegates_to_repository(stock_service, stock_repository_s
         ("get_corporate_actions", ticker, stock_service.session),
         ("get_news", ticker, stock_service.session),
         ("get_valuation_history", ticker, "quarterly", 5, stock_service.session),
+        ("compare_fundamentals", [ticker], ["trailing_pe"], stock_service.session),
     ]
+
+
+def test_get_live_prices_watches_through_the_repository(stock_service, stock_repository_spy):
+    async def watch():
+        return await anyio.to_thread.run_sync(stock_service.get_live_prices, ["aapl"], 60)
+
+    result = anyio.run(watch)
+
+    assert [(price.symbol, price.price, price.uri) for price in result.prices] == [("AAPL", 42.0, "quote://AAPL")]
+    assert result.expires_in == 60
+    assert stock_repository_spy.calls[0] == ("get_last_price", "AAPL", stock_service.session)
+    assert stock_service.read_live_price("aapl").price == 42.0
+
+
+def test_read_live_price_fetches_unwatched_symbol(stock_service, stock_repository_spy):
+    result = stock_service.read_live_price("msft")
+
+    assert (result.symbol, result.price, result.updated_at) == ("MSFT", 42.0, None)
+    assert stock_repository_spy.calls == [("get_last_price", "msft", stock_service.session)]
@@ -4,6 +4,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
+from openmarkets.core.cache import reset_cache
 from openmarkets.repositories.funds import YFinanceFundsRepository
 from openmarkets.schemas.funds import FundAssetClassHolding, FundSectorWeighting
 
@@ -36,6 +37,7 @@ def test_get_fund_sector_weighting_variants(monkeypatch):
     assert repo.get_fund_sector_weighting("F") is None
 
     # missing attribute
+    reset_cache()
     monkeypatch.setattr(
         "openmarkets.repositories.funds.yf.Ticker",
         lambda ticker, session=None: SimpleNamespace(get_funds_data=lambda: SimpleNamespace()),
@@ -43,6 +45,7 @@ def test_get_fund_sector_weighting_variants(monkeypatch):
     assert repo.get_fund_sector_weighting("F") is None
 
     # present
+    reset_cache()
     sect = {"technology": 0.5, "financial_services": 0.25}
     monkeypatch.setattr(
         "openmarkets.repositories.funds.yf.Ticker",
@@ -99,7 +102,8 @@ def test_get_fund_overview_and_asset_classes_and_top_holdings_and_bond_equity_ho
     assert repo.get_fund_equity_holdings("F") == []
     assert repo.get_fund_asset_class_holdings("F") is None
 
-    # provide data
+    # provide data, replacing the cached fund data
+    reset_cache()
     df_top = fake_dataframe([{"Symbol": "A", "Name": "Alpha", "Holding Percent": 0.1}])
     df_bond = fake_dataframe([{"index": "B", "Duration": 1.2, "Maturity": 5.0, "Credit Quality": 7}])
     df_equity = fake_dataframe([{"index": "E", "Price/Earnings": 10.0}])
@@ -135,3 +139,101 @@ def test_get_fund_overview_and_asset_classes_and_top_holdings_and_bond_equity_ho
     ac = repo.get_fund_asset_class_holdings("F")
     assert isinstance(ac, FundAssetClassHolding)
     assert ac.cash_position == 1.0
+
+
+def test_fund_tools_share_one_download_per_ticker(monkeypatch, fake_dataframe):
+    """Test that every fund section and the full profile come from a single download."""
+    downloads = []
+    fund_data = SimpleNamespace(
+        fund_overview={"categoryName": "cat"},
+        top_holdings=fake_dataframe([{"Symbol": "A", "Name": "Alpha", "Holding Percent": 0.1}]),
+        sector_weightings={"technology": 0.5},
+    )
+
+    def get_funds_data():
+        downloads.append(1)
+        return fund_data
+
+    monkeypatch.setattr(
+        "openmarkets.repositories.funds.yf.Ticker",
+        lambda ticker, session=None: SimpleNamespace(get_funds_data=get_funds_data),
+    )
+    repo = YFinanceFundsRepository()
+
+    assert repo.get_fund_overview("spy").category_name == "cat"
+    assert repo.get_fund_sector_weighting("SPY").technology == 0.5
+    profile = repo.get_full_fund_profile("SPY")
+
+    assert len(downloads) == 1
+    assert profile.ticker == "SPY"
+    assert profile.top_holdings[0].symbol == "A"
+    assert profile.operations is None
+    assert profile.bond_holdings == []
+
+
+def test_get_fund_look_through_weights_holdings_and_sectors_across_funds(monkeypatch):
+    """Test that exposures are fund weights times in-fund weights, summed across funds."""
+    funds_data = {
+        "SPY": SimpleNamespace(
+            top_holdings=pd.DataFrame(
+                {"Name": ["Apple", "Microsoft"], "Holding Percent": [0.07, 0.06]},
+                index=pd.Index(["AAPL", "MSFT"], name="Symbol"),
+            ),
+            sector_weightings={"technology": 0.3, "healthcare": 0.1},
+        ),
+        "QQQ": SimpleNamespace(
+            top_holdings=pd.DataFrame(
+                {"Name": ["Apple", "NVIDIA"], "Holding Percent": [0.09, 0.08]},
+                index=pd.Index(["AAPL", "NVDA"], name="Symbol"),
+            ),
+            sector_weightings={"technology": 0.5},
+        ),
+    }
+
+    def ticker_factory(ticker, session=None):
+        if ticker not in funds_data:
+            raise ValueError("not found")
+        return SimpleNamespace(get_funds_data=lambda: funds_data[ticker])
+
+    monkeypatch.setattr("openmarkets.repositories.funds.yf.Ticker", ticker_factory)
+
+    result = YFinanceFundsRepository().get_fund_look_through({"spy": 60, "QQQ": 20, "BAD": 20}, top=2)
+
+    assert result.weights == pytest.approx({"SPY": 0.6, "QQQ": 0.2, "BAD": 0.2})
+    assert [holding.symbol for holding in result.holdings] == ["AAPL", "MSFT"]
+    assert result.holdings[0].weight == pytest.approx(0.6 * 0.07 + 0.2 * 0.09)
+    assert result.holdings[0].funds == ["SPY", "QQQ"]
+    assert result.holdings_coverage == pytest.approx(0.6 * 0.13 + 0.2 * 0.17)
+    assert [(sector.sector, sector.weight) for sector in result.sectors] == [
+        ("technology", pytest.approx(0.28)),
+        ("healthcare", pytest.approx(0.06)),
+    ]
+    assert result.unavailable == ["BAD"]
+
+
+def test_get_fund_overlap_builds_symmetric_matrices(monkeypatch):
+    """Test that overlap is the weight two funds hold in common, over funds with top holdings."""
+    top_holdings = {
+        "SPY": pd.DataFrame(
+            {"Name": ["Apple", "Microsoft"], "Holding Percent": [0.07, 0.06]},
+            index=pd.Index(["AAPL", "MSFT"], name="Symbol"),
+        ),
+        "QQQ": pd.DataFrame(
+            {"Name": ["Apple", "NVIDIA", "Microsoft"], "Holding Percent": [0.09, 0.08, 0.02]},
+            index=pd.Index(["AAPL", "NVDA", "MSFT"], name="Symbol"),
+        ),
+        "BND": None,
+    }
+    monkeypatch.setattr(
+        "openmarkets.repositories.funds.yf.Ticker",
+        lambda ticker, session=None: SimpleNamespace(
+            get_funds_data=lambda: SimpleNamespace(top_holdings=top_holdings[ticker])
+        ),
+    )
+
+    result = YFinanceFundsRepository().get_fund_overlap(["spy", "QQQ", "BND", "SPY"])
+
+    assert result.tickers == ["SPY", "QQQ"]
+    assert result.overlap == [[0.13, 0.09], [0.09, 0.19]]
+    assert result.shared_holdings == [[2, 2], [2, 3]]
+    assert result.unavailable == ["BND"]
@@ -3,6 +3,7 @@ from types import SimpleNamespace
 import pandas as pd
 import pytest
 
+from openmarkets.core.cache import reset_cache
 from openmarkets.core.exceptions import DataUnavailableError
 from openmarkets.repositories.options import YFinanceOptionsRepository
 from openmarkets.schemas.options import OptionExpirationDate
@@ -57,7 +58,9 @@ def test_get_option_chain_and_call_put_options(monkeypatch):
 
     monkeypatch.setattr(
         "openmarkets.repositories.options.yf.Ticker",
-        lambda t, session=None: SimpleNamespace(option_chain=lambda date=None: FakeOptionChain(calls, puts)),
+        lambda t, session=None: SimpleNamespace(
+            options=["2020-01-17"], option_chain=lambda date=None: FakeOptionChain(calls, puts)
+        ),
     )
 
     oc = repo.get_option_chain("A")
@@ -120,6 +123,8 @@ def test_get_options_by_moneyness_errors_and_success(monkeypatch):
         repo.get_options_by_moneyness("A")
 
     # with price and chain
+    reset_cache()
+
     class FakeStock:
         def __init__(self):
             self.info = {"currentPrice": 100}
@@ -145,6 +150,8 @@ def test_get_options_skew_various_cases(monkeypatch):
         repo.get_options_skew("A", "2020-01-01")
 
     # both empty
+    reset_cache()
+
     class FakeStockEmpty:
         def __init__(self):
             self.options = ["d"]
@@ -157,6 +164,7 @@ def test_get_options_skew_various_cases(monkeypatch):
         repo.get_options_skew("A")
 
     # missing columns
+    reset_cache()
     calls = pd.DataFrame([{"volume": 1}])
     monkeypatch.setattr(
         "openmarkets.repositories.options.yf.Ticker",
@@ -169,6 +177,7 @@ def test_get_options_skew_various_cases(monkeypatch):
         repo.get_options_skew("A")
 
     # valid skew
+    reset_cache()
     calls = pd.DataFrame([{"strike": 10, "impliedVolatility": 0.1}])
     puts = pd.DataFrame([{"strike": 9, "impliedVolatility": 0.2}])
     monkeypatch.setattr(